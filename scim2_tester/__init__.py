@@ -1,7 +1,77 @@
+from .bulk import BulkReport
+from .bulk import abulk_test
+from .bulk import bulk_test
+from .checker import acheck_server
+from .checker import aiter_check_server
 from .checker import check_server
+from .checker import iter_check_server
+from .filters import afilter_test
+from .filters import filter_test
+from .fixtures import FixturePool
+from .load import CapacityReport
+from .load import LoadReport
+from .load import OperationStats
+from .load import acapacity_test
+from .load import aiter_soak_test
+from .load import aload_test
+from .load import arate_test
+from .load import capacity_test
+from .load import iter_soak_test
+from .load import load_test
+from .load import rate_test
+from .membership import MembershipReport
+from .membership import amembership_test
+from .membership import membership_test
+from .pagination import apagination_test
+from .pagination import pagination_test
+from .patch import apatch_test
+from .patch import patch_test
+from .scenario import Scenario
+from .scenario import ascenario_test
+from .scenario import scenario_test
+from .utils import CHECKS
 from .utils import CheckConfig
 from .utils import CheckResult
+from .utils import ReferencePool
 from .utils import SCIMTesterError
 from .utils import Status
 
-__all__ = ["check_server", "Status", "CheckResult", "CheckConfig", "SCIMTesterError"]
+__all__ = [
+    "check_server",
+    "acheck_server",
+    "iter_check_server",
+    "aiter_check_server",
+    "load_test",
+    "aload_test",
+    "rate_test",
+    "arate_test",
+    "capacity_test",
+    "acapacity_test",
+    "CapacityReport",
+    "iter_soak_test",
+    "aiter_soak_test",
+    "scenario_test",
+    "ascenario_test",
+    "Scenario",
+    "pagination_test",
+    "apagination_test",
+    "filter_test",
+    "afilter_test",
+    "bulk_test",
+    "abulk_test",
+    "BulkReport",
+    "patch_test",
+    "apatch_test",
+    "membership_test",
+    "amembership_test",
+    "MembershipReport",
+    "FixturePool",
+    "LoadReport",
+    "OperationStats",
+    "Status",
+    "CheckResult",
+    "CheckConfig",
+    "ReferencePool",
+    "SCIMTesterError",
+    "CHECKS",
+]
@@ -0,0 +1,566 @@
+import json
+from dataclasses import dataclass
+from inspect import isclass
+from typing import Any
+from typing import Literal
+from typing import get_args
+from typing import get_origin
+
+from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
+from scim2_models import BulkOperation
+from scim2_models import BulkRequest
+from scim2_models import BulkResponse
+from scim2_models import ComplexAttribute
+from scim2_models import Context
+from scim2_models import Mutability
+from scim2_models import Resource
+from scim2_models import ResourceType
+
+from scim2_tester.filling import agenerate_objects
+from scim2_tester.filling import fill_plan
+from scim2_tester.filling import generate_objects
+from scim2_tester.filling import required_field_names
+from scim2_tester.load import REFERENCE_POOL_SIZE
+from scim2_tester.load import ResourcePool
+from scim2_tester.load import resource_pools
+from scim2_tester.resource import adelete_references
+from scim2_tester.resource import delete_references
+from scim2_tester.utils import CheckConfig
+from scim2_tester.utils import CheckResult
+from scim2_tester.utils import Status
+from scim2_tester.utils import asend_http_request
+from scim2_tester.utils import check_http_response
+from scim2_tester.utils import checker
+from scim2_tester.utils import http_url
+from scim2_tester.utils import missing_http_client_result
+from scim2_tester.utils import send_http_request
+
+
+@dataclass
+class MemberAttribute:
+    """A writable attribute referencing objects of another resource type, like the group ``members``."""
+
+    name: str
+    """The attribute name in SCIM payloads."""
+
+    multiple: bool
+    """Whether the attribute is multi-valued."""
+
+    pool: ResourcePool
+    """The pool of the referenced resource type."""
+
+    typed: bool
+    """Whether the attribute has a ``type`` sub-attribute, set to the referenced resource type id."""
+
+    def value(self, member_id: str) -> Any:
+        """Return the attribute value referencing an object."""
+        value: dict[str, Any] = {"value": member_id}
+        if self.typed:
+            value["type"] = self.pool.resource_type.id
+        return [value] if self.multiple else value
+
+
+@dataclass
+class Creation:
+    """An object to create with :func:`check_bulk_creation` or :func:`check_sequential_creation`."""
+
+    pool: ResourcePool
+    """The pool of the object resource type, where the created object is stored."""
+
+    data: dict[str, Any]
+    """The object creation payload."""
+
+    bulk_id: str
+    """The bulk operation identifier."""
+
+    member: "Creation | None" = None
+    """An object of another resource type to reference, for instance a user to add to a group.
+
+    In bulk requests, it is referenced by its bulkId until it is created.
+    """
+
+    attribute: MemberAttribute | None = None
+    """The attribute referencing :attr:`member`."""
+
+    def payload(self, ids: dict[str, str] | None = None) -> dict[str, Any]:
+        """Return the creation payload.
+
+        :param ids: The ids of the objects already created, indexed by bulkId.
+            Members that are not created yet are referenced by their bulkId.
+        """
+        if self.member is None or self.attribute is None:
+            return self.data
+
+        member_id = (ids or {}).get(
+            self.member.bulk_id, f"bulkId:{self.member.bulk_id}"
+        )
+        return {**self.data, self.attribute.name: self.attribute.value(member_id)}
+
+
+@dataclass
+class BulkReport:
+    """The results of a :func:`bulk_test`."""
+
+    bulk: CheckResult
+    """The :func:`check_bulk_creation` result."""
+
+    sequential: CheckResult | None = None
+    """The :func:`check_sequential_creation` result, or :data:`None` if the server does not support bulk operations."""
+
+    @property
+    def speedup(self) -> float | None:
+        """How many times faster the bulk creation was than the sequential creation."""
+        if (
+            self.sequential is None
+            or self.sequential.duration is None
+            or not self.bulk.duration
+        ):
+            return None
+        return self.sequential.duration / self.bulk.duration
+
+    def __str__(self) -> str:
+        lines = [f"{'mode':<12} {'status':>8} {'requests':>9} {'seconds':>9}"]
+        for name, result in (("bulk", self.bulk), ("sequential", self.sequential)):
+            if result is not None:
+                lines.append(
+                    f"{name:<12} {result.status.name:>8} {result.requests:>9} {result.duration or 0:>9.3f}"
+                )
+        if self.speedup is not None:
+            lines.append(f"speedup: {self.speedup:.1f}")
+        return "\n".join(lines)
+
+
+def supports_bulk(conf: CheckConfig) -> bool:
+    """Whether the server :class:`~scim2_models.ServiceProviderConfig` announces bulk support."""
+    service_provider_config = conf.client.service_provider_config
+    return bool(
+        service_provider_config
+        and service_provider_config.bulk
+        and service_provider_config.bulk.supported
+    )
+
+
+@checker("bulk")
+def check_bulk_creation(conf: CheckConfig, creations: list[Creation]) -> CheckResult:
+    """Create objects with bulk requests.
+
+    The requests are sized to the ``maxOperations`` and ``maxPayloadSize`` values of the server
+    :class:`~scim2_models.ServiceProviderConfig`. Objects reference the members of the same request by their bulkId,
+    and the members created by previous requests by their id.
+    """
+    if not supports_bulk(conf):
+        return _unsupported_bulk_result(conf)
+
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    responses: list[BulkResponse] = []
+    ids: dict[str, str] = {}
+    try:
+        for chunk in _chunks(conf, creations):
+            payload = _bulk_payload(chunk, ids)
+            response = send_http_request(conf, "post", http_url(conf, "/Bulk"), payload)
+            responses.append(_bulk_response(conf, response))
+            ids.update(_created_ids(responses[-1]))
+    finally:
+        # The objects of the successful requests are stored even if a later request fails,
+        # so they are cleaned up.
+        created = _store_created(creations, responses)
+
+    return _bulk_result(conf, creations, responses, created)
+
+
+@checker("bulk")
+async def acheck_bulk_creation(
+    conf: CheckConfig, creations: list[Creation]
+) -> CheckResult:
+    """Create objects with bulk requests."""
+    if not supports_bulk(conf):
+        return _unsupported_bulk_result(conf)
+
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    responses: list[BulkResponse] = []
+    ids: dict[str, str] = {}
+    try:
+        for chunk in _chunks(conf, creations):
+            payload = _bulk_payload(chunk, ids)
+            response = await asend_http_request(
+                conf, "post", http_url(conf, "/Bulk"), payload
+            )
+            responses.append(_bulk_response(conf, response))
+            ids.update(_created_ids(responses[-1]))
+    finally:
+        created = _store_created(creations, responses)
+
+    return _bulk_result(conf, creations, responses, created)
+
+
+@checker("bulk")
+def check_sequential_creation(
+    conf: CheckConfig, creations: list[Creation]
+) -> CheckResult:
+    """Create objects one by one, to compare with :func:`check_bulk_creation`."""
+    ids: dict[str, str] = {}
+    for creation in creations:
+        obj = conf.client.create(
+            creation.payload(ids),
+            expected_status_codes=conf.expected_status_codes or [201],
+        )
+        creation.pool.objects.append(obj)
+        ids[creation.bulk_id] = obj.id
+
+    return _sequential_result(conf, creations)
+
+
+@checker("bulk")
+async def acheck_sequential_creation(
+    conf: CheckConfig, creations: list[Creation]
+) -> CheckResult:
+    """Create objects one by one, to compare with :func:`check_bulk_creation`."""
+    ids: dict[str, str] = {}
+    for creation in creations:
+        obj = await conf.client.create(
+            creation.payload(ids),
+            expected_status_codes=conf.expected_status_codes or [201],
+        )
+        creation.pool.objects.append(obj)
+        ids[creation.bulk_id] = obj.id
+
+    return _sequential_result(conf, creations)
+
+
+def _unsupported_bulk_result(conf: CheckConfig) -> CheckResult:
+    return CheckResult(
+        conf,
+        status=Status.SKIPPED,
+        reason="Bulk operations are not supported by the server",
+    )
+
+
+def _chunks(conf: CheckConfig, creations: list[Creation]) -> list[list[Creation]]:
+    """Split the creations in requests sized to the server bulk limits.
+
+    Objects are kept in the same request than the member they reference when possible.
+    Otherwise, the member is created by a previous request, and is referenced by its id.
+    """
+    service_provider_config = conf.client.service_provider_config
+    bulk = service_provider_config.bulk if service_provider_config else None
+    max_operations = (bulk and bulk.max_operations) or len(creations) or 1
+    max_payload_size = bulk.max_payload_size if bulk else None
+    envelope_size = _payload_size(_bulk_payload([]))
+    sizes = {
+        creation.bulk_id: _payload_size(_operation(creation)) + 1
+        for creation in creations
+    }
+
+    chunks: list[list[Creation]] = [[]]
+    size = envelope_size
+    for creation in creations:
+        chunk = chunks[-1]
+        too_many = len(chunk) >= max_operations
+        too_large = (
+            max_payload_size is not None
+            and size + sizes[creation.bulk_id] > max_payload_size
+        )
+        if chunk and (too_many or too_large):
+            # The referenced member is moved to the new request
+            is_member = len(chunk) > 1 and chunk[-1] is creation.member
+            chunks.append([chunk.pop()] if is_member else [])
+            size = envelope_size + sum(sizes[c.bulk_id] for c in chunks[-1])
+
+        chunks[-1].append(creation)
+        size += sizes[creation.bulk_id]
+
+    return [chunk for chunk in chunks if chunk]
+
+
+def _operation(creation: Creation, ids: dict[str, str] | None = None) -> dict[str, Any]:
+    operation = BulkOperation(
+        method=BulkOperation.Method.post,
+        bulk_id=creation.bulk_id,
+        path=creation.pool.resource_type.endpoint,
+    ).model_dump()
+    # The data is set afterwards, because BulkOperation normalizes the case of its keys
+    operation["data"] = creation.payload(ids)
+    return operation
+
+
+def _bulk_payload(
+    creations: list[Creation], ids: dict[str, str] | None = None
+) -> dict[str, Any]:
+    return {
+        **BulkRequest().model_dump(),
+        "Operations": [_operation(creation, ids) for creation in creations],
+    }
+
+
+def _payload_size(payload: dict[str, Any]) -> int:
+    return len(json.dumps(payload, separators=(",", ":")).encode())
+
+
+def _bulk_response(conf: CheckConfig, response) -> BulkResponse:
+    return check_http_response(
+        conf,
+        response,
+        expected_status_codes=conf.expected_status_codes or [200],
+        expected_types=[BulkResponse],
+        scim_ctx=Context.RESOURCE_CREATION_RESPONSE,
+    )
+
+
+def _created_ids(response: BulkResponse) -> dict[str, str]:
+    """Return the ids of the objects created by a bulk response, indexed by bulkId."""
+    return {
+        operation.bulk_id: operation.location.rstrip("/").rsplit("/", 1)[-1]
+        for operation in response.operations or []
+        if operation.status == 201 and operation.bulk_id and operation.location
+    }
+
+
+def _created_object(
+    creation: Creation, ids: dict[str, str], location: str | None
+) -> Resource:
+    """Build a created object from its creation payload, without querying it."""
+    return creation.pool.model.model_validate(
+        {
+            **creation.payload(ids),
+            "id": ids[creation.bulk_id],
+            "meta": {
+                "resourceType": creation.pool.resource_type.id,
+                "location": location,
+            },
+        }
+    )
+
+
+def _store_created(creations: list[Creation], responses: list[BulkResponse]) -> int:
+    """Add the objects created by the bulk responses to their pools, and return their number."""
+    operations = {
+        operation.bulk_id: operation
+        for response in responses
+        for operation in response.operations or []
+    }
+    ids = {
+        bulk_id: obj_id
+        for response in responses
+        for bulk_id, obj_id in _created_ids(response).items()
+    }
+    created = 0
+    for creation in creations:
+        if creation.bulk_id in ids:
+            location = operations[creation.bulk_id].location
+            creation.pool.objects.append(_created_object(creation, ids, location))
+            created += 1
+    return created
+
+
+def _bulk_result(
+    conf: CheckConfig,
+    creations: list[Creation],
+    responses: list[BulkResponse],
+    created: int,
+) -> CheckResult:
+    if failures := len(creations) - created:
+        return CheckResult(
+            conf,
+            status=Status.ERROR,
+            reason=f"{failures} of {len(creations)} bulk creations failed",
+            data=responses,
+        )
+
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful creation of {len(creations)} objects in {len(responses)} bulk requests",
+        data=responses,
+    )
+
+
+def _sequential_result(conf: CheckConfig, creations: list[Creation]) -> CheckResult:
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful creation of {len(creations)} objects one by one",
+    )
+
+
+def creations(
+    conf: CheckConfig, pools: list[ResourcePool], count: int
+) -> list[Creation]:
+    """Build ``count`` objects to create for every pool, filled with their required attributes.
+
+    Objects with a writable attribute referencing another resource type of the pools,
+    like the group ``members``, reference an object of this resource type built along with them.
+    """
+    objs = []
+    for pool in pools:
+        pool_objs, garbages = generate_objects(
+            conf, pool.model, count, required_field_names(pool.model)
+        )
+        pool.garbages.extend(garbages)
+        objs.append(pool_objs)
+    return _creations(pools, objs)
+
+
+async def acreations(
+    conf: CheckConfig, pools: list[ResourcePool], count: int
+) -> list[Creation]:
+    """Asynchronous version of :func:`creations`."""
+    objs = []
+    for pool in pools:
+        pool_objs, garbages = await agenerate_objects(
+            conf, pool.model, count, required_field_names(pool.model)
+        )
+        pool.garbages.extend(garbages)
+        objs.append(pool_objs)
+    return _creations(pools, objs)
+
+
+def _creations(pools: list[ResourcePool], objs: list[list[Resource]]) -> list[Creation]:
+    """Build the creations row by row, every object referencing the member of its row.
+
+    The referenced objects come first in every row, so they can be created one by one.
+    """
+    attributes = {id(pool): _member_attribute(pool, pools) for pool in pools}
+    order = _dependency_order(pools, attributes)
+    result = []
+    for row in zip(*objs, strict=True):
+        row_creations = {
+            id(pool): _creation(pool, obj) for pool, obj in zip(pools, row, strict=True)
+        }
+        for pool in order:
+            creation = row_creations[id(pool)]
+            attribute = attributes[id(pool)]
+            if attribute is not None:
+                creation.member = row_creations[id(attribute.pool)]
+                creation.attribute = attribute
+            result.append(creation)
+    return result
+
+
+def _creation(pool: ResourcePool, obj: Resource) -> Creation:
+    data = obj.model_dump(scim_ctx=Context.RESOURCE_CREATION_REQUEST)
+    return Creation(pool, data, pool.conf.random_uuid().hex)
+
+
+def _member_attribute(
+    pool: ResourcePool, pools: list[ResourcePool]
+) -> MemberAttribute | None:
+    """Return the first writable attribute of a pool model referencing another pool resource type."""
+    for field_name, field_plan in fill_plan(pool.model).items():
+        if field_plan.mutability == Mutability.read_only:
+            continue
+
+        attribute_type = pool.model.get_field_root_type(field_name)
+        if not (
+            isclass(attribute_type)
+            and issubclass(attribute_type, ComplexAttribute)
+            and {"value", "ref"} <= attribute_type.model_fields.keys()
+        ):
+            continue
+
+        ref_type_ids = _ref_type_ids(attribute_type.get_field_root_type("ref"))
+        for other in pools:
+            if other is not pool and other.resource_type.id in ref_type_ids:
+                return MemberAttribute(
+                    field_plan.alias,
+                    field_plan.multiple,
+                    other,
+                    "type" in attribute_type.model_fields,
+                )
+
+    return None
+
+
+def _ref_type_ids(ref_type: Any) -> set[str]:
+    """Return {"User", "Group"} from "Reference[Union[Literal['User'], Literal['Group']]]"."""
+    if get_origin(ref_type) is Literal:
+        return {arg for arg in get_args(ref_type) if isinstance(arg, str)}
+
+    return {
+        ref_type_id for arg in get_args(ref_type) for ref_type_id in _ref_type_ids(arg)
+    }
+
+
+def _dependency_order(
+    pools: list[ResourcePool], attributes: dict[int, MemberAttribute | None]
+) -> list[ResourcePool]:
+    """Sort the pools so the referenced ones come first. References closing a cycle are dropped."""
+    ordered: list[ResourcePool] = []
+
+    def visit(pool: ResourcePool, visiting: tuple[ResourcePool, ...]) -> None:
+        if pool in ordered:
+            return
+
+        attribute = attributes[id(pool)]
+        if attribute is not None and attribute.pool in (*visiting, pool):
+            attributes[id(pool)] = None
+        elif attribute is not None:
+            visit(attribute.pool, (*visiting, pool))
+        ordered.append(pool)
+
+    for pool in pools:
+        visit(pool, ())
+    return ordered
+
+
+def bulk_test(
+    client: SCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    count: int = 50,
+) -> BulkReport:
+    """Compare the creation of objects with bulk requests, and one by one.
+
+    ``count`` objects of every resource type are created with :func:`check_bulk_creation`,
+    and then ``count`` other objects with :func:`check_sequential_creation`.
+    The duration and the number of requests of both checks are available in the report.
+    If the server does not announce bulk support, the bulk check is skipped and no object is created.
+    The created objects are deleted after the run.
+
+    Bulk requests are sent with the HTTP client wrapped by the SCIM client, like :class:`httpx.Client`.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+    :param resource_types: The resource types to create. Defaults to all the client resource types.
+    :param count: The number of objects of every resource type to create in each mode.
+    """
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    if not supports_bulk(conf):
+        return BulkReport(check_bulk_creation(conf, []))
+
+    pools = resource_pools(conf, resource_types)
+    try:
+        bulk = check_bulk_creation(conf, creations(conf, pools, count))
+        sequential = check_sequential_creation(conf, creations(conf, pools, count))
+    finally:
+        for pool in pools[::-1]:
+            pool.cleanup()
+        delete_references(conf)
+
+    return BulkReport(bulk, sequential)
+
+
+async def abulk_test(
+    client: BaseAsyncSCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    count: int = 50,
+) -> BulkReport:
+    """Asynchronous version of :func:`bulk_test`."""
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    if not supports_bulk(conf):
+        return BulkReport(await acheck_bulk_creation(conf, []))
+
+    pools = resource_pools(conf, resource_types)
+    try:
+        bulk = await acheck_bulk_creation(conf, await acreations(conf, pools, count))
+        sequential = await acheck_sequential_creation(
+            conf, await acreations(conf, pools, count)
+        )
+    finally:
+        for pool in pools[::-1]:
+            await pool.acleanup()
+        await adelete_references(conf)
+
+    return BulkReport(bulk, sequential)
@@ -1,12 +1,30 @@
 import argparse
-import uuid
+import functools
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
 
 from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
 from scim2_models import Error
 
-from scim2_tester.resource import check_resource_type
+from scim2_tester.fixtures import FixturePool
+from scim2_tester.resource import aresource_type_tasks
+from scim2_tester.resource import resource_type_tasks
+from scim2_tester.resource_types import acheck_resource_types_endpoint
+from scim2_tester.resource_types import check_access_invalid_resource_type
+from scim2_tester.resource_types import check_query_all_resource_types
+from scim2_tester.resource_types import check_query_resource_type_by_id
 from scim2_tester.resource_types import check_resource_types_endpoint
+from scim2_tester.scheduler import Task
+from scim2_tester.scheduler import aiter_tasks
+from scim2_tester.scheduler import iter_tasks
+from scim2_tester.scheduler import value_results
+from scim2_tester.schemas import acheck_schemas_endpoint
+from scim2_tester.schemas import check_access_invalid_schema
+from scim2_tester.schemas import check_query_all_schemas
+from scim2_tester.schemas import check_query_schema_by_id
 from scim2_tester.schemas import check_schemas_endpoint
+from scim2_tester.service_provider_config import acheck_service_provider_config_endpoint
 from scim2_tester.service_provider_config import check_service_provider_config_endpoint
 from scim2_tester.utils import CheckConfig
 from scim2_tester.utils import CheckResult
@@ -14,12 +32,27 @@ from scim2_tester.utils import Status
 from scim2_tester.utils import checker
 
 
-@checker
+@checker("negative")
 def check_random_url(conf: CheckConfig) -> CheckResult:
     """Check that a request to a random URL returns a 404 Error object."""
-    probably_invalid_url = f"/{str(uuid.uuid4())}"
+    probably_invalid_url = f"/{str(conf.random_uuid())}"
     response = conf.client.query(url=probably_invalid_url, raise_scim_errors=False)
+    return _random_url_result(conf, probably_invalid_url, response)
 
+
+@checker("negative")
+async def acheck_random_url(conf: CheckConfig) -> CheckResult:
+    """Check that a request to a random URL returns a 404 Error object."""
+    probably_invalid_url = f"/{str(conf.random_uuid())}"
+    response = await conf.client.query(
+        url=probably_invalid_url, raise_scim_errors=False
+    )
+    return _random_url_result(conf, probably_invalid_url, response)
+
+
+def _random_url_result(
+    conf: CheckConfig, probably_invalid_url: str, response
+) -> CheckResult:
     if not isinstance(response, Error):
         return CheckResult(
             conf,
@@ -44,7 +77,17 @@ def check_random_url(conf: CheckConfig) -> CheckResult:
     )
 
 
-def check_server(client: SCIMClient, raise_exceptions=False) -> list[CheckResult]:
+def check_server(
+    client: SCIMClient,
+    raise_exceptions=False,
+    max_workers: int | None = None,
+    fail_fast: int | None = None,
+    time_budget: float | None = None,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    seed: int | None = None,
+    fixtures: FixturePool | None = None,
+) -> list[CheckResult]:
     """Perform a series of check to a SCIM server.
 
     It starts by retrieving the standard :class:`~scim2_models.ServiceProviderConfig`,
@@ -56,44 +99,332 @@ def check_server(client: SCIMClient, raise_exceptions=False) -> list[CheckResult
 
     :param client: A SCIM client that will perform the requests.
     :param raise_exceptions: Whether exceptions should be raised or stored in a :class:`~scim2_tester.CheckResult` object.
+    :param max_workers: If set, independent checks are performed concurrently by a pool of threads of this size.
+        The results order is the same than in sequential mode.
+        The client must be thread-safe.
+    :param fail_fast: If set, no new check is started once this number of checks have failed.
+        The temporary objects created on the server are still deleted.
+    :param time_budget: If set, the number of seconds the checks are allowed to last.
+        The cheapest checks are performed first, checks that do not fit in the remaining time
+        are reported as :attr:`~scim2_tester.Status.SKIPPED`, and the requests timeout is bounded
+        by the remaining time. The temporary objects created on the server are still deleted.
+        This is suitable for health probes with a timeout.
+    :param include: If set, only the checks with those names or tags are performed, with the checks they depend on.
+        Tags are listed in :data:`~scim2_tester.CHECKS`, and resource checks are also tagged with their resource type id.
+        The configuration endpoints are queried anyway if the client needs them.
+    :param exclude: If set, the checks with those names or tags are not performed.
+    :param seed: If set, the seed of the random values the objects are filled with, so runs can be reproduced.
+    :param fixtures: If set, the read checks are performed on the objects of this :class:`~scim2_tester.FixturePool`,
+        provisioned beforehand, instead of the objects created by the checks.
     """
-    conf = CheckConfig(client, raise_exceptions)
-    results = []
-
-    # Get the initial basic objects
-    result_spc = check_service_provider_config_endpoint(conf)
-    results.append(result_spc)
-    if not conf.client.service_provider_config:
-        conf.client.service_provider_config = result_spc.data
-
-    results_resource_types = check_resource_types_endpoint(conf)
-    results.extend(results_resource_types)
-    if not conf.client.resource_types:
-        conf.client.resource_types = results_resource_types[0].data
-
-    results_schemas = check_schemas_endpoint(conf)
-    results.extend(results_schemas)
-    if not conf.client.resource_models:
-        conf.client.resource_models = conf.client.build_resource_models(
-            conf.client.resource_types or [], results_schemas[0].data or []
+    return list(
+        iter_check_server(
+            client,
+            raise_exceptions,
+            max_workers,
+            fail_fast,
+            time_budget,
+            include,
+            exclude,
+            seed,
+            fixtures,
+        )
+    )
+
+
+def iter_check_server(
+    client: SCIMClient,
+    raise_exceptions=False,
+    max_workers: int | None = None,
+    fail_fast: int | None = None,
+    time_budget: float | None = None,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    seed: int | None = None,
+    fixtures: FixturePool | None = None,
+) -> Iterator[CheckResult]:
+    """Perform the same checks than :func:`check_server`, and yield the results as soon as they are available.
+
+    The results are yielded in the same order than :func:`check_server` returns them.
+    Results are not retained once yielded, and stopping the iteration stops the checks.
+
+    .. code-block:: python
+
+        for result in iter_check_server(client):
+            print(result.status.name, result.title)
+    """
+    conf = CheckConfig(
+        client,
+        raise_exceptions,
+        max_workers=max_workers,
+        fail_fast=fail_fast,
+        time_budget=time_budget,
+        include=include,
+        exclude=exclude,
+        seed=seed,
+        fixtures=fixtures,
+    )
+
+    try:
+        # Get the initial basic objects
+        discovery = {}
+        for name, value in iter_tasks(conf, discovery_tasks(conf)):
+            discovery[name] = value
+            yield from value_results(value)
+
+        if not is_discovery_complete(conf, discovery) or not configure_client(
+            conf, **discovery
+        ):
+            return
+
+        for _, value in iter_tasks(conf, server_tasks(conf)):
+            yield from value_results(value)
+
+    finally:
+        conf.reset_request_timeout()
+
+
+async def acheck_server(
+    client: BaseAsyncSCIMClient,
+    raise_exceptions=False,
+    max_workers: int | None = None,
+    fail_fast: int | None = None,
+    time_budget: float | None = None,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    seed: int | None = None,
+    fixtures: FixturePool | None = None,
+) -> list[CheckResult]:
+    """Asynchronous version of :func:`check_server`.
+
+    Independent checks are performed concurrently: the
+    :class:`~scim2_models.ServiceProviderConfig`, :class:`~scim2_models.Schema` and
+    :class:`~scim2_models.ResourceType` endpoints are checked together, and then the
+    checks of every resource type are run together.
+
+    :param client: An asynchronous SCIM client that will perform the requests.
+    :param raise_exceptions: Whether exceptions should be raised or stored in a :class:`~scim2_tester.CheckResult` object.
+    :param max_workers: If set, the number of individual :class:`~scim2_models.Schema` and
+        :class:`~scim2_models.ResourceType` queries awaited concurrently is bounded to this value.
+    :param fail_fast: If set, the checks being performed are cancelled once this number of checks have failed.
+        The temporary objects created on the server are still deleted.
+    :param time_budget: If set, the number of seconds the checks are allowed to last.
+        See :func:`check_server`.
+    :param include: If set, only the checks with those names or tags are performed.
+        See :func:`check_server`.
+    :param exclude: If set, the checks with those names or tags are not performed.
+    :param seed: If set, the seed of the random values the objects are filled with.
+    :param fixtures: If set, the read checks are performed on the objects of this :class:`~scim2_tester.FixturePool`.
+    """
+    return [
+        result
+        async for result in aiter_check_server(
+            client,
+            raise_exceptions,
+            max_workers,
+            fail_fast,
+            time_budget,
+            include,
+            exclude,
+            seed,
+            fixtures,
+        )
+    ]
+
+
+async def aiter_check_server(
+    client: BaseAsyncSCIMClient,
+    raise_exceptions=False,
+    max_workers: int | None = None,
+    fail_fast: int | None = None,
+    time_budget: float | None = None,
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+    seed: int | None = None,
+    fixtures: FixturePool | None = None,
+) -> AsyncIterator[CheckResult]:
+    """Asynchronous version of :func:`iter_check_server`.
+
+    .. code-block:: python
+
+        async for result in aiter_check_server(client):
+            print(result.status.name, result.title)
+    """
+    conf = CheckConfig(
+        client,
+        raise_exceptions,
+        max_workers=max_workers,
+        fail_fast=fail_fast,
+        time_budget=time_budget,
+        include=include,
+        exclude=exclude,
+        seed=seed,
+        fixtures=fixtures,
+    )
+
+    try:
+        # Get the initial basic objects
+        discovery = {}
+        async for name, value in aiter_tasks(conf, adiscovery_tasks(conf)):
+            discovery[name] = value
+            for result in value_results(value):
+                yield result
+
+        if not is_discovery_complete(conf, discovery) or not configure_client(
+            conf, **discovery
+        ):
+            return
+
+        async for _, value in aiter_tasks(conf, aserver_tasks(conf)):
+            for result in value_results(value):
+                yield result
+
+    finally:
+        conf.reset_request_timeout()
+
+
+def discovery_tasks(conf: CheckConfig) -> list[Task]:
+    """Build the graph of the configuration endpoints checks, that are all independent."""
+    checks = discovery_checks(conf)
+    return [
+        Task(
+            "service_provider_config",
+            functools.partial(check_service_provider_config_endpoint, conf),
+            checks=checks["service_provider_config"],
+        ),
+        Task(
+            "resource_types",
+            functools.partial(check_resource_types_endpoint, conf),
+            cost=3,
+            checks=checks["resource_types"],
+        ),
+        Task(
+            "schemas",
+            functools.partial(check_schemas_endpoint, conf),
+            cost=3,
+            checks=checks["schemas"],
+        ),
+    ]
+
+
+def adiscovery_tasks(conf: CheckConfig) -> list[Task]:
+    """Asynchronous version of :func:`discovery_tasks`."""
+    checks = discovery_checks(conf)
+    return [
+        Task(
+            "service_provider_config",
+            functools.partial(acheck_service_provider_config_endpoint, conf),
+            checks=checks["service_provider_config"],
+        ),
+        Task(
+            "resource_types",
+            functools.partial(acheck_resource_types_endpoint, conf),
+            cost=3,
+            checks=checks["resource_types"],
+        ),
+        Task(
+            "schemas",
+            functools.partial(acheck_schemas_endpoint, conf),
+            cost=3,
+            checks=checks["schemas"],
+        ),
+    ]
+
+
+def discovery_checks(conf: CheckConfig) -> dict[str, tuple]:
+    """Return the checks performed by each of the configuration endpoints tasks.
+
+    The endpoints of the configuration resources the client lacks are needed by the
+    resource checks, so they are given no checks, and are queried whatever the check selection.
+    """
+    client = conf.client
+    return {
+        "service_provider_config": (check_service_provider_config_endpoint,)
+        if client.service_provider_config
+        else (),
+        "resource_types": (
+            check_query_all_resource_types,
+            check_query_resource_type_by_id,
+            check_access_invalid_resource_type,
+        )
+        if client.resource_types
+        else (),
+        "schemas": (
+            check_query_all_schemas,
+            check_query_schema_by_id,
+            check_access_invalid_schema,
         )
+        if client.resource_models
+        else (),
+    }
 
-    if (
-        not conf.client.service_provider_config
-        or not conf.client.resource_types
-        or not conf.client.resource_models
-    ):
-        return results
 
-    # Miscelleaneous checks
-    result_random = check_random_url(conf)
-    results.append(result_random)
+def server_tasks(conf: CheckConfig) -> list[Task]:
+    """Build the graph of the checks that need a configured client."""
+    # Error handling is less relevant than the resources lifecycle for health probes.
+    tasks = [
+        Task(
+            "random_url",
+            functools.partial(check_random_url, conf),
+            priority=-1,
+            checks=(check_random_url,),
+        )
+    ]
+    for resource_type in conf.client.resource_types or []:
+        tasks.extend(resource_type_tasks(conf, resource_type, f"{resource_type.id}."))
+    return tasks
 
-    # Resource checks
+
+def aserver_tasks(conf: CheckConfig) -> list[Task]:
+    """Asynchronous version of :func:`server_tasks`."""
+    tasks = [
+        Task(
+            "random_url",
+            functools.partial(acheck_random_url, conf),
+            priority=-1,
+            checks=(check_random_url,),
+        )
+    ]
     for resource_type in conf.client.resource_types or []:
-        results.extend(check_resource_type(conf, resource_type))
+        tasks.extend(aresource_type_tasks(conf, resource_type, f"{resource_type.id}."))
+    return tasks
+
+
+def is_discovery_complete(conf: CheckConfig, discovery: dict) -> bool:
+    """Indicate whether the configuration endpoints checks have all been performed."""
+    return not conf.is_stopped() and not any(
+        isinstance(value, CheckResult) and value.status == Status.SKIPPED
+        for value in discovery.values()
+    )
+
 
-    return results
+def configure_client(
+    conf: CheckConfig,
+    service_provider_config: CheckResult | None = None,
+    resource_types: list[CheckResult] | None = None,
+    schemas: list[CheckResult] | None = None,
+) -> bool:
+    """Register the discovered configuration resources to the client if no other have been registered yet.
+
+    The configuration endpoints results are only needed for the resources the client lacks.
+    Return :data:`False` if the client configuration is not complete enough to perform resource checks.
+    """
+    if not conf.client.service_provider_config and service_provider_config is not None:
+        conf.client.service_provider_config = service_provider_config.data
+
+    if not conf.client.resource_types and resource_types:
+        conf.client.resource_types = resource_types[0].data
+
+    if not conf.client.resource_models and schemas:
+        conf.client.resource_models = conf.client.build_resource_models(
+            conf.client.resource_types or [], schemas[0].data or []
+        )
+
+    return bool(
+        conf.client.service_provider_config
+        and conf.client.resource_types
+        and conf.client.resource_models
+    )
 
 
 if __name__ == "__main__":
@@ -104,6 +435,11 @@ if __name__ == "__main__":
     parser.add_argument("host")
     parser.add_argument("--token", required=False)
     parser.add_argument("--verbose", required=False, action="store_true")
+    parser.add_argument("--max-workers", required=False, type=int)
+    parser.add_argument("--fail-fast", required=False, type=int)
+    parser.add_argument("--time-budget", required=False, type=float)
+    parser.add_argument("--include", required=False, action="append")
+    parser.add_argument("--exclude", required=False, action="append")
     args = parser.parse_args()
 
     client = Client(
@@ -112,7 +448,14 @@ if __name__ == "__main__":
     )
     scim = SyncSCIMClient(client)
     scim.discover()
-    results = check_server(scim)
+    results = check_server(
+        scim,
+        max_workers=args.max_workers,
+        fail_fast=args.fail_fast,
+        time_budget=args.time_budget,
+        include=args.include,
+        exclude=args.exclude,
+    )
     for result in results:
         print(result.status.name, result.title)
         if result.reason:
@@ -1,6 +1,12 @@
 import base64
-import random
-import uuid
+import functools
+import itertools
+import os
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Generator
+from collections.abc import Iterator
+from dataclasses import dataclass
 from enum import Enum
 from inspect import isclass
 from typing import Annotated
@@ -8,10 +14,12 @@ from typing import Any
 from typing import get_args
 from typing import get_origin
 
+from scim2_models import BaseModel
 from scim2_models import ComplexAttribute
 from scim2_models import Extension
 from scim2_models import ExternalReference
 from scim2_models import Meta
+from scim2_models import Mutability
 from scim2_models import Reference
 from scim2_models import Required
 from scim2_models import Resource
@@ -20,23 +28,63 @@ from scim2_models.utils import UNION_TYPES
 
 from scim2_tester.utils import CheckConfig
 
+Filler = Generator[Resource, Resource, tuple[Any, list[Resource]]]
+"""Generator filling an object with random values.
+
+It yields the referenced objects that need to be created on the server, and
+expects to be sent back the created objects, so the same filling code can be
+driven by both synchronous and asynchronous clients. It returns the filled value,
+an object or an attribute value, and the referenced objects it created.
+"""
+
 
 def create_minimal_object(
     conf: CheckConfig, model: type[Resource]
 ) -> tuple[Resource, list[Resource]]:
     """Create an object filling with the minimum required field set."""
-    field_names = [
-        field_name
-        for field_name in model.model_fields
-        if model.get_field_annotation(field_name, Required) == Required.true
-    ]
-    obj, garbages = fill_with_random_values(conf, model(), field_names)
-    obj = conf.client.create(obj)
+    return run_filler(conf, _create_minimal_object(conf, model))
+
+
+async def acreate_minimal_object(
+    conf: CheckConfig, model: type[Resource]
+) -> tuple[Resource, list[Resource]]:
+    """Asynchronous version of :func:`create_minimal_object`."""
+    return await arun_filler(conf, _create_minimal_object(conf, model))
+
+
+def _create_minimal_object(
+    conf: CheckConfig, model: type[Resource], tokens: Iterator[str] | None = None
+) -> Filler:
+    field_names = required_field_names(model)
+    obj, garbages = yield from _new_object(conf, model, field_names, tokens)
+    obj = yield obj
     return obj, garbages
 
 
+def run_filler(conf: CheckConfig, filler: Filler) -> tuple[Resource, list[Resource]]:
+    """Drive a filler generator, creating the objects it requests with the synchronous client."""
+    try:
+        obj = next(filler)
+        while True:
+            obj = filler.send(conf.client.create(obj))
+    except StopIteration as exc:
+        return exc.value
+
+
+async def arun_filler(
+    conf: CheckConfig, filler: Filler
+) -> tuple[Resource, list[Resource]]:
+    """Drive a filler generator, creating the objects it requests with the asynchronous client."""
+    try:
+        obj = next(filler)
+        while True:
+            obj = filler.send(await conf.client.create(obj))
+    except StopIteration as exc:
+        return exc.value
+
+
 def model_from_ref_type(
-    conf: CheckConfig, ref_type: type, different_than: Resource
+    conf: CheckConfig, ref_type: type, different_than: type[BaseModel]
 ) -> type[Resource]:
     """Return "User" from "Union[Literal['User'], Literal['Group']]"."""
 
@@ -59,83 +107,382 @@ def model_from_ref_type(
 
 def fill_with_random_values(
     conf: CheckConfig, obj: Resource, field_names: list[str] | None = None
-) -> Resource:
+) -> tuple[Resource, list[Resource]]:
     """Fill an object with random values generated according the attribute types."""
+    return run_filler(conf, _fill_with_random_values(conf, obj, field_names))
+
+
+async def afill_with_random_values(
+    conf: CheckConfig, obj: Resource, field_names: list[str] | None = None
+) -> tuple[Resource, list[Resource]]:
+    """Asynchronous version of :func:`fill_with_random_values`."""
+    return await arun_filler(conf, _fill_with_random_values(conf, obj, field_names))
+
+
+def generate_objects(
+    conf: CheckConfig,
+    model: type[Resource],
+    n: int,
+    field_names: list[str] | None = None,
+) -> tuple[list[Resource], list[Resource]]:
+    """Generate ``n`` distinct objects filled with random values, without creating them on the server.
+
+    The random values of the whole batch are drawn together, which is much faster than
+    filling objects one by one with :func:`fill_with_random_values`.
+    Return the objects, and the referenced objects created on the server to fill the references.
+
+    :param field_names: The fields to fill. Defaults to all the model fields.
+    """
+    objs, garbages = [], []
+    for obj, obj_garbages in iter_objects(conf, model, n, field_names):
+        objs.append(obj)
+        garbages.extend(obj_garbages)
+    return objs, garbages
+
+
+async def agenerate_objects(
+    conf: CheckConfig,
+    model: type[Resource],
+    n: int,
+    field_names: list[str] | None = None,
+) -> tuple[list[Resource], list[Resource]]:
+    """Asynchronous version of :func:`generate_objects`."""
+    objs, garbages = [], []
+    async for obj, obj_garbages in aiter_objects(conf, model, n, field_names):
+        objs.append(obj)
+        garbages.extend(obj_garbages)
+    return objs, garbages
+
+
+def iter_objects(
+    conf: CheckConfig,
+    model: type[Resource],
+    n: int,
+    field_names: list[str] | None = None,
+) -> Iterator[tuple[Resource, list[Resource]]]:
+    """Lazy version of :func:`generate_objects`, yielding the objects one by one with their referenced objects."""
+    tokens = random_tokens(conf, _batch_size(model, n, field_names))
+    for _ in range(n):
+        yield run_filler(conf, _new_object(conf, model, field_names, tokens))
+
+
+async def aiter_objects(
+    conf: CheckConfig,
+    model: type[Resource],
+    n: int,
+    field_names: list[str] | None = None,
+) -> AsyncIterator[tuple[Resource, list[Resource]]]:
+    """Asynchronous version of :func:`iter_objects`."""
+    tokens = random_tokens(conf, _batch_size(model, n, field_names))
+    for _ in range(n):
+        yield await arun_filler(conf, _new_object(conf, model, field_names, tokens))
+
+
+TOKEN_SIZE = 16
+"""The number of random bytes of the tokens the random values are generated from."""
+
+
+def random_tokens(conf: CheckConfig | None, batch: int = 16) -> Iterator[str]:
+    """Yield random hexadecimal tokens of :data:`TOKEN_SIZE` bytes.
+
+    The random bytes are drawn ``batch`` tokens at a time from the
+    :attr:`~scim2_tester.CheckConfig.random_generator`, or from :func:`os.urandom` without configuration.
+    """
+    while True:
+        size = TOKEN_SIZE * batch
+        data = (
+            conf.random_generator.randbytes(size) if conf else os.urandom(size)
+        ).hex()
+        for start in range(0, len(data), 2 * TOKEN_SIZE):
+            yield data[start : start + 2 * TOKEN_SIZE]
+
+
+def _batch_size(
+    model: type[Resource], n: int, field_names: list[str] | None = None
+) -> int:
+    # Complex attributes need several tokens, this is just an order of magnitude
+    fields = len(field_names or fill_plan(model))
+    return max(fields * min(n, 100), 1)
+
+
+def _fill_with_random_values(
+    conf: CheckConfig,
+    obj: Resource,
+    field_names: list[str] | None = None,
+    tokens: Iterator[str] | None = None,
+) -> Filler:
+    values, garbages = yield from _random_values(
+        conf, obj.__class__, field_names, tokens
+    )
+    for field_name, value in values.items():
+        setattr(obj, field_name, value)
+
+    return obj, garbages
+
+
+def _new_object(
+    conf: CheckConfig,
+    model: type[BaseModel],
+    field_names: list[str] | None = None,
+    tokens: Iterator[str] | None = None,
+) -> Filler:
+    # Models are validated at every assignment, so new objects are validated once with all their values
+    values, garbages = yield from _random_values(conf, model, field_names, tokens)
+    plan = fill_plan(model)
+    payload = {plan[field_name].alias: value for field_name, value in values.items()}
+    return model.model_validate(payload), garbages
+
+
+def _random_values(
+    conf: CheckConfig,
+    model: type[BaseModel],
+    field_names: list[str] | None = None,
+    tokens: Iterator[str] | None = None,
+) -> Generator[Resource, Resource, tuple[dict[str, Any], list[Resource]]]:
+    values = {}
     garbages = []
-    for field_name in field_names or obj.model_fields.keys():
-        field = obj.model_fields[field_name]
-        if field.default:
+    plan = fill_plan(model)
+    field_names = field_names or list(plan.keys())
+    tokens = tokens or random_tokens(conf, len(field_names))
+    for field_name in field_names:
+        field_plan = plan[field_name]
+        if not field_plan.fillable:
             continue
 
-        is_multiple = obj.get_field_multiplicity(field_name)
-        field_type = obj.get_field_root_type(field_name)
-        if get_origin(field_type) == Annotated:
-            field_type = get_args(field_type)[0]
-
-        value: Any
-        if field_type is Meta:
-            value = None
-
-        elif field.examples:
-            value = random.choice(field.examples)
-
-        # RFC7643 §4.1.2 provides the following indications, however
-        # there is no way to guess the existence of such requirements
-        # just by looking at the object schema.
-        #     The value SHOULD be specified according to [RFC5321].
-        elif field_name == "value" and "email" in obj.__class__.__name__.lower():
-            value = f"{uuid.uuid4()}@{uuid.uuid4()}.com"
-
-        # RFC7643 §4.1.2 provides the following indications, however
-        # there is no way to guess the existence of such requirements
-        # just by looking at the object schema.
-        #     The value SHOULD be specified
-        #     according to the format defined in [RFC3966], e.g.,
-        #     'tel:+1-201-555-0123'.
-        elif field_name == "value" and "phone" in obj.__class__.__name__.lower():
-            value = "".join(str(random.choice(range(10))) for _ in range(10))
-
-        elif field_type is int:
-            value = uuid.uuid4().int
-
-        elif field_type is bool:
-            value = random.choice([True, False])
-
-        elif field_type is bytes:
-            value = base64.b64encode(str(uuid.uuid4()).encode("utf-8"))
-
-        elif get_origin(field_type) is Reference:
-            ref_type = get_args(field_type)[0]
-            if ref_type not in (ExternalReference, URIReference):
-                model = model_from_ref_type(
-                    conf, ref_type, different_than=obj.__class__
-                )
-                ref_obj, sub_garbages = create_minimal_object(conf, model)
-                value = ref_obj.meta.location
-                garbages += sub_garbages
-
-            else:
-                value = f"https://{str(uuid.uuid4())}.test"
-
-        elif isclass(field_type) and issubclass(field_type, Enum):
-            value = random.choice(list(field_type))
-
-        elif isclass(field_type) and issubclass(field_type, ComplexAttribute):
-            value, sub_garbages = fill_with_random_values(conf, field_type())
+        if field_plan.filler:
+            value, sub_garbages = yield from field_plan.filler(conf, model, tokens)
             garbages += sub_garbages
 
-        elif isclass(field_type) and issubclass(field_type, Extension):
-            value, sub_garbages = fill_with_random_values(conf, field_type())
-            garbages += sub_garbages
+        elif field_plan.value:
+            value = field_plan.value(next(tokens))
 
         else:
-            # Put emails so this will be accepted by EmailStr too
-            value = str(uuid.uuid4())
+            continue
 
-        if is_multiple:
-            setattr(obj, field_name, [value])
+        values[field_name] = [value] if field_plan.multiple else value
 
-        else:
-            setattr(obj, field_name, value)
+    return values, garbages
 
-    return obj, garbages
+
+Strategy = Callable[[str], Any]
+"""Generate an attribute value from a random hexadecimal token yielded by :func:`random_tokens`."""
+
+STRATEGIES: dict[Any, Strategy] = {}
+"""The value generation strategies registered with :func:`register_strategy`."""
+
+
+def register_strategy(key: Any, strategy: Strategy) -> None:
+    """Register a strategy generating the values of some attributes.
+
+    The key can be:
+
+    - an attribute URN, like ``urn:ietf:params:scim:schemas:core:2.0:User:userName``,
+      for an attribute of a resource or an extension schema;
+    - an attribute name, like ``displayName``, for the attributes and sub-attributes with this name in every schema;
+    - a type, like :class:`str` or :class:`int`, for every attribute of this type.
+      The attributes with examples, and the email and phone number values, keep their own values.
+
+    The most specific strategy is used. The tokens are drawn from the :attr:`~scim2_tester.CheckConfig.seed`
+    random generator, so strategies only using their token produce reproducible values.
+
+    .. code-block:: python
+
+        register_strategy("userName", lambda token: f"user-{token[:8]}")
+    """
+    STRATEGIES[key] = strategy
+    fill_plan.cache_clear()
+
+
+def unregister_strategy(key: Any) -> None:
+    """Remove a strategy registered with :func:`register_strategy`."""
+    STRATEGIES.pop(key, None)
+    fill_plan.cache_clear()
+
+
+def counter_strategy() -> Strategy:
+    """Return a strategy generating unique strings from a counter.
+
+    This is cheaper than random values for high-volume load tests.
+    The values start with the first token the strategy gets, so they differ between runs.
+
+    .. code-block:: python
+
+        register_strategy(str, counter_strategy())
+    """
+    counter = itertools.count()
+    prefixes: list[str] = []
+
+    def strategy(token: str) -> str:
+        if not prefixes:
+            prefixes.append(token[:8])
+        return f"{prefixes[0]}-{next(counter)}"
+
+    return strategy
+
+
+def _registered_strategy(model: type[BaseModel], alias: str) -> Strategy | None:
+    keys = [alias]
+    if issubclass(model, Resource | Extension):
+        keys.insert(0, f"{model.model_fields['schemas'].default[0]}:{alias}")
+
+    for key in keys:
+        if key in STRATEGIES:
+            return STRATEGIES[key]
+    return None
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """How to fill a model field with random values."""
+
+    alias: str
+    """The attribute name in SCIM payloads."""
+
+    multiple: bool
+    """Whether the field is multi-valued."""
+
+    required: bool
+    """Whether the field is required."""
+
+    mutability: Mutability | None
+    """The field mutability."""
+
+    fillable: bool = True
+    """Whether the field is filled. Fields with a default value are left untouched."""
+
+    value: Callable[[str], Any] | None = None
+    """Generate a value from a random token, when no other object is needed.
+
+    Tokens are hexadecimal strings yielded by :func:`random_tokens`.
+    """
+
+    filler: Callable[[CheckConfig, type[BaseModel], Iterator[str]], Filler] | None = (
+        None
+    )
+    """Generate a random value needing other objects, like references and complex attributes.
+
+    It is called with the model being filled and the random tokens,
+    and returns the value and the created referenced objects.
+    """
+
+
+@functools.lru_cache(maxsize=256)
+def fill_plan(model: type[BaseModel]) -> dict[str, FieldPlan]:
+    """Return how to fill every field of a model, indexed by field names.
+
+    The model fields types are introspected once, and the plan is reused for every object of the model.
+    The cache is bounded, so the models built dynamically from the server schemas can be released.
+    """
+    return {
+        field_name: _field_plan(model, field_name) for field_name in model.model_fields
+    }
+
+
+def required_field_names(model: type[Resource]) -> list[str]:
+    """Return the names of the required fields of a model."""
+    return [
+        field_name
+        for field_name, field_plan in fill_plan(model).items()
+        if field_plan.required
+    ]
+
+
+def _field_plan(model: type[BaseModel], field_name: str) -> FieldPlan:
+    field = model.model_fields[field_name]
+    alias = field.serialization_alias or field_name
+    plan = functools.partial(
+        FieldPlan,
+        alias=alias,
+        multiple=model.get_field_multiplicity(field_name),
+        required=model.get_field_annotation(field_name, Required) == Required.true,
+        mutability=model.get_field_annotation(field_name, Mutability),
+    )
+    if field.default:
+        return plan(fillable=False)
+
+    field_type = model.get_field_root_type(field_name)
+    if get_origin(field_type) == Annotated:
+        field_type = get_args(field_type)[0]
+
+    if field_type is Meta:
+        return plan(value=lambda token: None)
+
+    if strategy := _registered_strategy(model, alias):
+        return plan(value=strategy)
+
+    if field.examples:
+        return plan(value=functools.partial(_choice, list(field.examples)))
+
+    # RFC7643 §4.1.2 provides the following indications, however
+    # there is no way to guess the existence of such requirements
+    # just by looking at the object schema.
+    #     The value SHOULD be specified according to [RFC5321].
+    if field_name == "value" and "email" in model.__name__.lower():
+        return plan(value=lambda token: f"{token[:16]}@{token[16:]}.com")
+
+    # RFC7643 §4.1.2 provides the following indications, however
+    # there is no way to guess the existence of such requirements
+    # just by looking at the object schema.
+    #     The value SHOULD be specified
+    #     according to the format defined in [RFC3966], e.g.,
+    #     'tel:+1-201-555-0123'.
+    if field_name == "value" and "phone" in model.__name__.lower():
+        return plan(value=lambda token: str(int(token, 16))[-10:])
+
+    if strategy := STRATEGIES.get(field_type):
+        return plan(value=strategy)
+
+    if field_type is int:
+        return plan(value=lambda token: int(token, 16))
+
+    if field_type is bool:
+        return plan(value=functools.partial(_choice, [True, False]))
+
+    if field_type is bytes:
+        return plan(value=lambda token: base64.b64encode(token.encode("utf-8")))
+
+    if get_origin(field_type) is Reference:
+        ref_type = get_args(field_type)[0]
+        if ref_type not in (ExternalReference, URIReference):
+            return plan(filler=functools.partial(_fill_reference, ref_type))
+
+        return plan(value=lambda token: f"https://{token}.test")
+
+    if isclass(field_type) and issubclass(field_type, Enum):
+        return plan(value=functools.partial(_choice, list(field_type)))
+
+    if isclass(field_type) and issubclass(field_type, ComplexAttribute | Extension):
+        return plan(filler=functools.partial(_fill_attribute, field_type))
+
+    # Put emails so this will be accepted by EmailStr too
+    return plan(value=str)
+
+
+def _choice(values: list[Any], token: str) -> Any:
+    return values[int(token, 16) % len(values)]
+
+
+def _fill_reference(
+    ref_type: type, conf: CheckConfig, model: type[BaseModel], tokens: Iterator[str]
+) -> Filler:
+    ref_model = model_from_ref_type(conf, ref_type, different_than=model)
+    pool = conf.reference_pool if conf is not None else None
+    if pool is None:
+        ref_obj, garbages = yield from _create_minimal_object(conf, ref_model, tokens)
+        return ref_obj.meta.location, [*garbages, ref_obj]
+
+    # Pooled objects are released with the referencing object, and deleted with the pool
+    ref_obj = pool.take(ref_model)
+    if ref_obj is None:
+        ref_obj, garbages = yield from _create_minimal_object(conf, ref_model, tokens)
+        pool.add(ref_model, ref_obj, garbages)
+    return ref_obj.meta.location, [ref_obj]
+
+
+def _fill_attribute(
+    attribute_type: type[BaseModel],
+    conf: CheckConfig,
+    model: type[BaseModel],
+    tokens: Iterator[str],
+) -> Filler:
+    return (yield from _new_object(conf, attribute_type, None, tokens))
@@ -0,0 +1,240 @@
+import datetime
+import json
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
+from scim2_models import Resource
+from scim2_models import ResourceType
+from scim2_models import SearchRequest
+
+from scim2_tester.load import REFERENCE_POOL_SIZE
+from scim2_tester.load import LoadReport
+from scim2_tester.load import resource_pools
+from scim2_tester.resource import adelete_references
+from scim2_tester.resource import delete_references
+from scim2_tester.utils import CheckConfig
+from scim2_tester.utils import CheckResult
+from scim2_tester.utils import Status
+from scim2_tester.utils import checker
+
+
+@dataclass
+class FilterExpression:
+    """A filter generated by :func:`filter_expressions`."""
+
+    attribute: str
+    """The attribute path, for instance ``name.familyName`` or ``emails[type]``."""
+
+    operator: str
+    """The filter operator, for instance ``eq`` or ``sw``."""
+
+    expression: str
+    """The filter, for instance ``name.familyName eq "Doe"``."""
+
+    def __str__(self) -> str:
+        return f"{self.attribute} {self.operator}"
+
+
+def filter_expressions(obj: Resource) -> list[FilterExpression]:
+    """Generate filters matching an object, for every attribute it has a value for.
+
+    - strings are filtered with ``eq``, ``sw``, ``co`` and ``pr``;
+    - booleans are filtered with ``eq``;
+    - numbers are filtered with ``eq`` and ``gt``;
+    - datetimes are filtered with ``gt``;
+    - complex attributes are filtered on their sub-attributes, for instance ``name.familyName``;
+    - multi-valued complex attributes are also filtered on their type, for instance ``emails[type eq "work"]``.
+    """
+    payload = obj.model_dump()
+    return list(_attribute_expressions("", payload))
+
+
+def _attribute_expressions(
+    prefix: str, payload: dict[str, Any]
+) -> Iterator[FilterExpression]:
+    for key, value in payload.items():
+        if key in ("schemas", "$ref") or value is None:
+            continue
+
+        # Extension attributes are prefixed by the extension schema
+        if key.startswith("urn:") and isinstance(value, dict):
+            yield from _attribute_expressions(f"{key}:", value)
+            continue
+
+        attribute = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from _attribute_expressions(f"{attribute}.", value)
+
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            if isinstance(value[0].get("type"), str):
+                yield FilterExpression(
+                    f"{attribute}[type]",
+                    "eq",
+                    f"{attribute}[type eq {json.dumps(value[0]['type'])}]",
+                )
+            if value[0].get("value") is not None:
+                yield from _value_expressions(f"{attribute}.value", value[0]["value"])
+
+        elif isinstance(value, list) and value:
+            yield from _value_expressions(attribute, value[0])
+
+        elif not isinstance(value, list):
+            yield from _value_expressions(attribute, value)
+
+
+def _value_expressions(attribute: str, value: Any) -> Iterator[FilterExpression]:
+    if isinstance(value, bool):
+        yield FilterExpression(attribute, "eq", f"{attribute} eq {json.dumps(value)}")
+
+    elif isinstance(value, int | float):
+        yield FilterExpression(attribute, "eq", f"{attribute} eq {json.dumps(value)}")
+        yield FilterExpression(
+            attribute, "gt", f"{attribute} gt {json.dumps(value - 1)}"
+        )
+
+    elif isinstance(value, str) and (date := _parse_datetime(value)):
+        earlier = (date - datetime.timedelta(seconds=1)).isoformat()
+        yield FilterExpression(attribute, "gt", f"{attribute} gt {json.dumps(earlier)}")
+
+    elif isinstance(value, str) and value:
+        half = max(len(value) // 2, 1)
+        start = len(value) // 4
+        yield FilterExpression(attribute, "eq", f"{attribute} eq {json.dumps(value)}")
+        yield FilterExpression(
+            attribute, "sw", f"{attribute} sw {json.dumps(value[:half])}"
+        )
+        yield FilterExpression(
+            attribute, "co", f"{attribute} co {json.dumps(value[start : start + half])}"
+        )
+        yield FilterExpression(attribute, "pr", f"{attribute} pr")
+
+
+def _parse_datetime(value: str) -> datetime.datetime | None:
+    if "T" not in value:
+        return None
+
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@checker("filter")
+def check_filter(
+    conf: CheckConfig, model: type[Resource], filter: FilterExpression
+) -> CheckResult:
+    """Perform a filtered query, and check that it returns resources.
+
+    The filters are built from objects that exist on the server, so they must match at least one resource.
+    """
+    response = conf.client.query(
+        model,
+        search_request=SearchRequest(filter=filter.expression),
+        expected_status_codes=conf.expected_status_codes or [200],
+    )
+    return _filter_result(conf, model, filter, response)
+
+
+@checker("filter")
+async def acheck_filter(
+    conf: CheckConfig, model: type[Resource], filter: FilterExpression
+) -> CheckResult:
+    """Perform a filtered query, and check that it returns resources."""
+    response = await conf.client.query(
+        model,
+        search_request=SearchRequest(filter=filter.expression),
+        expected_status_codes=conf.expected_status_codes or [200],
+    )
+    return _filter_result(conf, model, filter, response)
+
+
+def _filter_result(
+    conf: CheckConfig, model: type[Resource], filter: FilterExpression, response
+) -> CheckResult:
+    if not response.resources:
+        return CheckResult(
+            conf,
+            status=Status.ERROR,
+            reason=f"The filter '{filter.expression}' did not return any {model.__name__} object",
+            data=response,
+        )
+
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"The filter '{filter.expression}' returned {len(response.resources)} {model.__name__} objects",
+        data=response,
+    )
+
+
+def filter_test(
+    client: SCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    seeds: int = 50,
+    repeat: int = 3,
+) -> LoadReport:
+    """Create objects of resource types, and measure the latency of filters on every attribute.
+
+    The filters are generated by :func:`filter_expressions` from one of the created objects,
+    and performed ``repeat`` times each by :func:`check_filter`.
+    The report operations are named after the resource type, the attribute and the operator,
+    for instance ``User.name.familyName sw``, so attributes that are slow to filter stand out.
+    Filters that fail, for instance because an operator is not supported, are reported as errors.
+    The created objects are deleted after the run.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+    :param resource_types: The resource types to profile. Defaults to all the client resource types.
+    :param seeds: The number of objects to create for each resource type.
+    :param repeat: The number of times every filter is performed.
+    """
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    report = LoadReport()
+    start = time.perf_counter()
+    try:
+        for pool in resource_pools(conf, resource_types):
+            try:
+                pool.prepare(seeds)
+                filters = filter_expressions(pool.objects[0]) if pool.objects else []
+                for _ in range(repeat):
+                    for filter in filters:
+                        result = check_filter(conf, pool.model, filter)
+                        report.record(f"{pool.resource_type.id}.{filter}", result)
+            finally:
+                pool.cleanup()
+    finally:
+        delete_references(conf)
+
+    report.finish(time.perf_counter() - start)
+    return report
+
+
+async def afilter_test(
+    client: BaseAsyncSCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    seeds: int = 50,
+    repeat: int = 3,
+) -> LoadReport:
+    """Asynchronous version of :func:`filter_test`."""
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    report = LoadReport()
+    start = time.perf_counter()
+    try:
+        for pool in resource_pools(conf, resource_types):
+            try:
+                await pool.aprepare(seeds)
+                filters = filter_expressions(pool.objects[0]) if pool.objects else []
+                for _ in range(repeat):
+                    for filter in filters:
+                        result = await acheck_filter(conf, pool.model, filter)
+                        report.record(f"{pool.resource_type.id}.{filter}", result)
+            finally:
+                await pool.acleanup()
+    finally:
+        await adelete_references(conf)
+
+    report.finish(time.perf_counter() - start)
+    return report
@@ -0,0 +1,156 @@
+from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
+from scim2_models import Resource
+from scim2_models import ResourceType
+from scim2_models import SearchRequest
+
+from scim2_tester.bulk import acheck_bulk_creation
+from scim2_tester.bulk import acreations
+from scim2_tester.bulk import check_bulk_creation
+from scim2_tester.bulk import creations
+from scim2_tester.bulk import supports_bulk
+from scim2_tester.load import REFERENCE_POOL_SIZE
+from scim2_tester.load import ResourcePool
+from scim2_tester.load import resource_pools
+from scim2_tester.resource import adelete_references
+from scim2_tester.resource import delete_references
+from scim2_tester.utils import CheckConfig
+
+
+class FixturePool:
+    """Objects provisioned once, and shared by the read checks of several runs.
+
+    The objects are created by :meth:`provision` with bulk requests if the server supports them,
+    and else, or if the bulk requests fail, one by one. Resource types with a filter in ``filters`` adopt the existing objects
+    matching the filter instead, so repeated runs against the same server do not create anything.
+    Created objects are deleted by :meth:`cleanup`, adopted objects are left untouched.
+
+    Pass the pool to :func:`~scim2_tester.check_server` or to the load tests with their ``fixtures``
+    parameter, so the read checks use its objects instead of freshly created ones:
+
+    .. code-block:: python
+
+        with FixturePool(client, count=50) as fixtures:
+            check_server(client, fixtures=fixtures)
+            rate_test(
+                client, rate=100, duration=60, operation="query", fixtures=fixtures
+            )
+
+    Fixture objects are only read, so they must not be modified or deleted by other means during the runs.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+    :param resource_types: The resource types to provision. Defaults to all the client resource types.
+    :param count: The number of objects of every resource type.
+    :param filters: Filters selecting the objects to adopt, indexed by resource type id.
+    """
+
+    def __init__(
+        self,
+        client: SCIMClient | BaseAsyncSCIMClient,
+        resource_types: list[ResourceType] | None = None,
+        count: int = 10,
+        filters: dict[str, str] | None = None,
+    ):
+        self.conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+        self.count = count
+        self.filters = filters or {}
+        self.pools = resource_pools(self.conf, resource_types)
+        self.objects: dict[str | None, list[Resource]] = {}
+        """The fixture objects, indexed by resource type id."""
+
+    def provision(self) -> None:
+        """Create or adopt the objects of every resource type."""
+        pools = []
+        for pool in self.pools:
+            search_request = self._search_request(pool)
+            if search_request is None:
+                pools.append(pool)
+                continue
+
+            response = self.conf.client.query(pool.model, search_request=search_request)
+            self.objects[pool.resource_type.id] = list(response.resources or [])
+
+        if pools and supports_bulk(self.conf):
+            check_bulk_creation(self.conf, creations(self.conf, pools, self.count))
+
+        # The objects the bulk requests did not create are created one by one.
+        for pool in pools:
+            pool.prepare(self.count - len(pool.objects))
+
+        self._store(pools)
+
+    async def aprovision(self) -> None:
+        """Asynchronous version of :meth:`provision`."""
+        pools = []
+        for pool in self.pools:
+            search_request = self._search_request(pool)
+            if search_request is None:
+                pools.append(pool)
+                continue
+
+            response = await self.conf.client.query(
+                pool.model, search_request=search_request
+            )
+            self.objects[pool.resource_type.id] = list(response.resources or [])
+
+        if pools and supports_bulk(self.conf):
+            await acheck_bulk_creation(
+                self.conf, await acreations(self.conf, pools, self.count)
+            )
+
+        for pool in pools:
+            await pool.aprepare(self.count - len(pool.objects))
+
+        self._store(pools)
+
+    def _search_request(self, pool: ResourcePool) -> SearchRequest | None:
+        resource_type_id = pool.resource_type.id
+        filter = self.filters.get(resource_type_id) if resource_type_id else None
+        if filter is None:
+            return None
+        return SearchRequest(filter=filter, count=self.count)
+
+    def _store(self, pools: list[ResourcePool]) -> None:
+        for pool in pools:
+            self.objects[pool.resource_type.id] = list(pool.objects)
+
+    def take(self, resource_type_id: str | None) -> Resource | None:
+        """Return a random object of a resource type, or :data:`None` if there is none."""
+        objs = self.objects.get(resource_type_id)
+        return self.conf.random_generator.choice(objs) if objs else None
+
+    def cleanup(self) -> None:
+        """Delete the created objects."""
+        for pool in self.pools[::-1]:
+            pool.cleanup()
+        delete_references(self.conf)
+        self.objects.clear()
+
+    async def acleanup(self) -> None:
+        """Asynchronous version of :meth:`cleanup`."""
+        for pool in self.pools[::-1]:
+            await pool.acleanup()
+        await adelete_references(self.conf)
+        self.objects.clear()
+
+    def __enter__(self) -> "FixturePool":
+        try:
+            self.provision()
+        except BaseException:
+            self.cleanup()
+            raise
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.cleanup()
+
+    async def __aenter__(self) -> "FixturePool":
+        try:
+            await self.aprovision()
+        except BaseException:
+            await self.acleanup()
+            raise
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.acleanup()
@@ -0,0 +1,1005 @@
+import asyncio
+import datetime
+import math
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Any
+
+from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
+from scim2_models import Resource
+from scim2_models import ResourceType
+
+from scim2_tester.filling import afill_with_random_values
+from scim2_tester.filling import aiter_objects
+from scim2_tester.filling import fill_with_random_values
+from scim2_tester.filling import iter_objects
+from scim2_tester.resource import CREATION_MUTABILITIES
+from scim2_tester.resource import REPLACEMENT_MUTABILITIES
+from scim2_tester.resource import acheck_object_creation
+from scim2_tester.resource import acheck_object_deletion
+from scim2_tester.resource import acheck_object_modification
+from scim2_tester.resource import acheck_object_query
+from scim2_tester.resource import acheck_object_query_without_id
+from scim2_tester.resource import acheck_object_replacement
+from scim2_tester.resource import adelete_objects
+from scim2_tester.resource import adelete_references
+from scim2_tester.resource import aresource_type_tasks
+from scim2_tester.resource import check_object_creation
+from scim2_tester.resource import check_object_deletion
+from scim2_tester.resource import check_object_modification
+from scim2_tester.resource import check_object_query
+from scim2_tester.resource import check_object_query_without_id
+from scim2_tester.resource import check_object_replacement
+from scim2_tester.resource import delete_objects
+from scim2_tester.resource import delete_references
+from scim2_tester.resource import field_names_by_mutability
+from scim2_tester.resource import model_from_resource_type
+from scim2_tester.resource import resource_type_tasks
+from scim2_tester.scheduler import arun_tasks
+from scim2_tester.scheduler import run_tasks
+from scim2_tester.scheduler import value_results
+from scim2_tester.utils import CheckConfig
+from scim2_tester.utils import CheckResult
+from scim2_tester.utils import Status
+
+if TYPE_CHECKING:
+    from scim2_tester.fixtures import FixturePool
+
+REFERENCE_POOL_SIZE = 10
+"""The :attr:`~scim2_tester.CheckConfig.reference_pool_size` of the load tests.
+
+Objects referenced by the generated objects, like group members, are shared instead of being
+created for every reference, so the load tests do not double their requests on references.
+"""
+
+
+def percentile(values: list[float], rank: float) -> float | None:
+    """Return the nearest-rank percentile of sorted values, or :data:`None` if there are no values."""
+    if not values:
+        return None
+
+    index = max(math.ceil(rank / 100 * len(values)) - 1, 0)
+    return values[index]
+
+
+@dataclass
+class OperationStats:
+    """Latency and error statistics of an operation."""
+
+    latencies: list[float] = field(default_factory=list)
+    """The latency of every performed operation, in seconds."""
+
+    service_times: list[float] = field(default_factory=list)
+    """The duration of every performed operation, in seconds.
+
+    It only differs from :attr:`latencies` when latencies are measured from the intended start time
+    of the operations, as in :func:`rate_test`.
+    """
+
+    errors: int = 0
+    """The number of failed operations."""
+
+    error_statuses: Counter = field(default_factory=Counter)
+    """The number of failed operations, indexed by the HTTP status code of their last response.
+
+    Failures without response, like network errors, are indexed by :data:`None`.
+    """
+
+    duration: float = 0
+    """The duration of the run the operations were performed in, in seconds."""
+
+    bytes_sent: int = 0
+    """The size of the request bodies sent by all the operations, in bytes."""
+
+    bytes_received: int = 0
+    """The size of the response bodies received by all the operations, in bytes."""
+
+    def add(self, result: CheckResult, latency: float | None = None) -> None:
+        """Record the result of an operation.
+
+        :param latency: The operation latency, if it differs from the check duration.
+        """
+        if result.duration is not None:
+            self.service_times.append(result.duration)
+            self.latencies.append(result.duration if latency is None else latency)
+        self.bytes_sent += result.bytes_sent
+        self.bytes_received += result.bytes_received
+        if result.status == Status.ERROR:
+            self.errors += 1
+            status_code = result.status_codes[-1] if result.status_codes else None
+            self.error_statuses[status_code] += 1
+
+    @property
+    def count(self) -> int:
+        """The number of performed operations."""
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """The number of operations per second."""
+        return self.count / self.duration if self.duration else 0
+
+    @property
+    def mean_bytes_sent(self) -> float:
+        """The mean size of the request bodies of an operation, in bytes."""
+        return self.bytes_sent / self.count if self.count else 0
+
+    @property
+    def mean_bytes_received(self) -> float:
+        """The mean size of the response bodies of an operation, in bytes."""
+        return self.bytes_received / self.count if self.count else 0
+
+    def percentile(self, rank: float) -> float | None:
+        """Return a latency percentile, in seconds."""
+        return percentile(sorted(self.latencies), rank)
+
+    def service_percentile(self, rank: float) -> float | None:
+        """Return a service time percentile, in seconds."""
+        return percentile(sorted(self.service_times), rank)
+
+    @property
+    def p50(self) -> float | None:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float | None:
+        return self.percentile(95)
+
+    @property
+    def p99(self) -> float | None:
+        return self.percentile(99)
+
+    @property
+    def max(self) -> float | None:
+        return max(self.latencies, default=None)
+
+
+@dataclass
+class LoadReport:
+    """Statistics of a load test."""
+
+    operations: dict[str, OperationStats] = field(default_factory=dict)
+    """The statistics indexed by operation names.
+
+    Operation names are the resource type id and the task name, for instance ``User.creation``.
+    """
+
+    duration: float = 0
+    """The duration of the load test, in seconds."""
+
+    start: datetime.datetime | None = None
+    """When the load test started."""
+
+    def add(self, values: dict[str, Any]) -> None:
+        """Record the results of a task graph run.
+
+        Tasks returning several results, like the PATCH modifications, have every result recorded
+        under the task name and the result title, for instance ``User.modification.check_object_modification``.
+        """
+        for name, value in values.items():
+            if isinstance(value, CheckResult):
+                self.record(name, value)
+                continue
+
+            for result in value_results(value):
+                self.record(f"{name}.{result.title}", result)
+
+    def record(
+        self, name: str, result: CheckResult, latency: float | None = None
+    ) -> None:
+        """Record the result of an operation. See :meth:`OperationStats.add`."""
+        self.operations.setdefault(name, OperationStats()).add(result, latency)
+
+    def finish(self, duration: float) -> None:
+        self.duration = duration
+        for stats in self.operations.values():
+            stats.duration = duration
+
+    @property
+    def count(self) -> int:
+        """The number of performed operations, all operations included."""
+        return sum(stats.count for stats in self.operations.values())
+
+    @property
+    def errors(self) -> int:
+        """The number of failed operations, all operations included."""
+        return sum(stats.errors for stats in self.operations.values())
+
+    @property
+    def error_rate(self) -> float:
+        """The proportion of failed operations, all operations included."""
+        return self.errors / self.count if self.count else 0
+
+    @property
+    def throughput(self) -> float:
+        """The number of operations per second, all operations included."""
+        return self.count / self.duration if self.duration else 0
+
+    def percentile(self, rank: float) -> float | None:
+        """Return a latency percentile, all operations included, in seconds."""
+        latencies = [
+            latency for stats in self.operations.values() for latency in stats.latencies
+        ]
+        return percentile(sorted(latencies), rank)
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'operation':<30} {'count':>7} {'errors':>7} {'ops/s':>8} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'bytes':>8}"
+        ]
+        for name, stats in self.operations.items():
+            latencies = [stats.p50, stats.p95, stats.p99, stats.max]
+            lines.append(
+                f"{name:<30} {stats.count:>7} {stats.errors:>7} {stats.throughput:>8.1f} "
+                + " ".join(f"{latency or 0:>8.3f}" for latency in latencies)
+                + f" {stats.mean_bytes_sent:>8.0f}"
+            )
+        return "\n".join(lines)
+
+
+def load_test(
+    client: SCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    iterations: int = 1,
+    concurrency: int = 1,
+    fixtures: "FixturePool | None" = None,
+) -> LoadReport:
+    """Repeat the creation, query, replacement and deletion lifecycle of resource types, and measure the latencies.
+
+    The lifecycle is the one performed by :func:`~scim2_tester.check_server`, with the same generated objects.
+    Temporary objects are deleted at the end of each lifecycle, and the referenced objects at the end of the run.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+        The client must be thread-safe.
+    :param resource_types: The resource types to test. Defaults to all the client resource types.
+    :param iterations: The number of lifecycles to perform for each resource type.
+    :param concurrency: The number of lifecycles performed concurrently by a pool of threads.
+    :param fixtures: If set, the queries are performed on the objects of this :class:`~scim2_tester.FixturePool`,
+        instead of the objects created by the lifecycles.
+    """
+    conf = CheckConfig(
+        client, reference_pool_size=REFERENCE_POOL_SIZE, fixtures=fixtures
+    )
+    jobs = _jobs(client, resource_types, iterations)
+    report = LoadReport()
+    start = time.perf_counter()
+
+    def lifecycle(resource_type: ResourceType) -> dict[str, Any]:
+        tasks = resource_type_tasks(conf, resource_type, f"{resource_type.id}.")
+        return run_tasks(conf, tasks)
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for values in executor.map(lifecycle, jobs):
+                report.add(values)
+    finally:
+        delete_references(conf)
+
+    report.finish(time.perf_counter() - start)
+    return report
+
+
+async def aload_test(
+    client: BaseAsyncSCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    iterations: int = 1,
+    concurrency: int = 1,
+    fixtures: "FixturePool | None" = None,
+) -> LoadReport:
+    """Asynchronous version of :func:`load_test`.
+
+    :param concurrency: The number of lifecycles performed concurrently.
+    """
+    conf = CheckConfig(
+        client, reference_pool_size=REFERENCE_POOL_SIZE, fixtures=fixtures
+    )
+    jobs = iter(_jobs(client, resource_types, iterations))
+    report = LoadReport()
+    start = time.perf_counter()
+
+    async def worker() -> None:
+        for resource_type in jobs:
+            tasks = aresource_type_tasks(conf, resource_type, f"{resource_type.id}.")
+            report.add(await arun_tasks(conf, tasks))
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        await adelete_references(conf)
+
+    report.finish(time.perf_counter() - start)
+    return report
+
+
+def _jobs(
+    client: SCIMClient, resource_types: list[ResourceType] | None, iterations: int
+) -> list[ResourceType]:
+    if resource_types is None:
+        resource_types = list(client.resource_types or [])
+    return [
+        resource_type for _ in range(iterations) for resource_type in resource_types
+    ]
+
+
+@dataclass
+class CapacityStep:
+    """A step of a :func:`capacity_test`."""
+
+    concurrency: int
+    """The number of lifecycles performed concurrently during the step."""
+
+    report: LoadReport
+    """The statistics of the step."""
+
+    within_slo: bool
+    """Whether the error rate and the latency were within the objectives."""
+
+
+@dataclass
+class CapacityReport:
+    """Result of a :func:`capacity_test`."""
+
+    steps: dict[str, list[CapacityStep]] = field(default_factory=dict)
+    """The performed steps, indexed by resource type id.
+
+    The steps are stopped at the first step out of the objectives.
+    """
+
+    def sustainable(self, resource_type_id: str) -> CapacityStep | None:
+        """Return the step with the highest throughput within the objectives, if any."""
+        return max(
+            (step for step in self.steps[resource_type_id] if step.within_slo),
+            key=lambda step: step.report.throughput,
+            default=None,
+        )
+
+    def max_throughput(self, resource_type_id: str) -> float:
+        """Return the maximum sustainable throughput of a resource type, in operations per second."""
+        step = self.sustainable(resource_type_id)
+        return step.report.throughput if step else 0
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'resource type':<20} {'concurrency':>11} {'ops/s':>8} {'errors':>7} {'p99':>8}"
+        ]
+        for resource_type_id, steps in self.steps.items():
+            for step in steps:
+                marker = "" if step.within_slo else " SLO breached"
+                lines.append(
+                    f"{resource_type_id:<20} {step.concurrency:>11} {step.report.throughput:>8.1f} "
+                    f"{step.report.errors:>7} {step.report.percentile(99) or 0:>8.3f}{marker}"
+                )
+        return "\n".join(lines)
+
+
+DEFAULT_CONCURRENCIES = (1, 2, 4, 8, 16, 32, 64)
+
+
+def capacity_test(
+    client: SCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    concurrencies: tuple[int, ...] = DEFAULT_CONCURRENCIES,
+    iterations: int = 5,
+    max_p99: float | None = None,
+    max_error_rate: float = 0.01,
+) -> CapacityReport:
+    """Increase the concurrency of :func:`load_test` step by step, until the service level objectives are breached.
+
+    Each resource type is tested separately, so the maximum sustainable throughput of each of them
+    is available with :meth:`CapacityReport.max_throughput`.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+        The client must be thread-safe.
+    :param resource_types: The resource types to test. Defaults to all the client resource types.
+    :param concurrencies: The concurrency of each step, in increasing order.
+    :param iterations: The number of lifecycles performed by each worker at each step.
+    :param max_p99: The maximum acceptable 99th latency percentile, in seconds, all operations included.
+        If :data:`None`, the latency is not limited.
+    :param max_error_rate: The maximum acceptable proportion of failed operations.
+    """
+    report = CapacityReport()
+    for resource_type in _jobs(client, resource_types, 1):
+        # Steps are reported by resource type id
+        if resource_type.id is None:
+            continue
+
+        steps = report.steps.setdefault(resource_type.id, [])
+        for concurrency in concurrencies:
+            step_report = load_test(
+                client, [resource_type], concurrency * iterations, concurrency
+            )
+            step = _capacity_step(concurrency, step_report, max_p99, max_error_rate)
+            steps.append(step)
+            if not step.within_slo:
+                break
+
+    return report
+
+
+async def acapacity_test(
+    client: BaseAsyncSCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    concurrencies: tuple[int, ...] = DEFAULT_CONCURRENCIES,
+    iterations: int = 5,
+    max_p99: float | None = None,
+    max_error_rate: float = 0.01,
+) -> CapacityReport:
+    """Asynchronous version of :func:`capacity_test`."""
+    report = CapacityReport()
+    for resource_type in _jobs(client, resource_types, 1):
+        # Steps are reported by resource type id
+        if resource_type.id is None:
+            continue
+
+        steps = report.steps.setdefault(resource_type.id, [])
+        for concurrency in concurrencies:
+            step_report = await aload_test(
+                client, [resource_type], concurrency * iterations, concurrency
+            )
+            step = _capacity_step(concurrency, step_report, max_p99, max_error_rate)
+            steps.append(step)
+            if not step.within_slo:
+                break
+
+    return report
+
+
+def _capacity_step(
+    concurrency: int,
+    report: LoadReport,
+    max_p99: float | None,
+    max_error_rate: float,
+) -> CapacityStep:
+    p99 = report.percentile(99)
+    within_slo = report.error_rate <= max_error_rate and (
+        max_p99 is None or p99 is None or p99 <= max_p99
+    )
+    return CapacityStep(concurrency, report, within_slo)
+
+
+def iter_soak_test(
+    client: SCIMClient,
+    rate: float,
+    window: float = 60,
+    duration: float | None = None,
+    resource_types: list[ResourceType] | None = None,
+    max_workers: int = 100,
+    fixtures: "FixturePool | None" = None,
+) -> Iterator[LoadReport]:
+    """Start resources lifecycles at a steady rate for a long time, and yield statistics windows.
+
+    The lifecycles are the ones of :func:`load_test`, started in turn for every resource type.
+    A :class:`LoadReport` is yielded at the end of every window, with the operations finished during
+    the window, and is not retained afterwards, so the memory usage does not grow with the duration.
+
+    .. code-block:: python
+
+        for report in iter_soak_test(client, rate=10, window=60):
+            print(report.start, report.throughput, report.percentile(99), report.errors)
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+        The client must be thread-safe.
+    :param rate: The number of lifecycles to start per second.
+    :param window: The duration of the statistics windows, in seconds.
+    :param duration: The number of seconds during which lifecycles are started.
+        If :data:`None`, the test runs until the iteration is stopped.
+    :param resource_types: The resource types to test. Defaults to all the client resource types.
+    :param max_workers: The maximum number of lifecycles performed concurrently by a pool of threads.
+    :param fixtures: If set, the queries are performed on the objects of this :class:`~scim2_tester.FixturePool`.
+    """
+    conf = CheckConfig(
+        client, reference_pool_size=REFERENCE_POOL_SIZE, fixtures=fixtures
+    )
+    resource_types = _jobs(client, resource_types, 1)
+    pending: set[Future[dict[str, Any]]] = set()
+    clock = _SoakClock(rate, window, duration)
+    report = clock.new_window()
+
+    def lifecycle(resource_type: ResourceType) -> dict[str, Any]:
+        tasks = resource_type_tasks(conf, resource_type, f"{resource_type.id}.")
+        return run_tasks(conf, tasks)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while not clock.is_over() or pending:
+            if clock.is_window_over():
+                yield clock.close_window(report)
+                report = clock.new_window()
+
+            elif clock.is_start_due():
+                resource_type = resource_types[clock.started % len(resource_types)]
+                pending.add(executor.submit(lifecycle, resource_type))
+                clock.started += 1
+
+            elif pending:
+                done, pending = wait(
+                    pending, timeout=clock.next_event(), return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    report.add(future.result())
+
+            else:
+                time.sleep(clock.next_event())
+
+        yield clock.close_window(report)
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        delete_references(conf)
+
+
+async def aiter_soak_test(
+    client: BaseAsyncSCIMClient,
+    rate: float,
+    window: float = 60,
+    duration: float | None = None,
+    resource_types: list[ResourceType] | None = None,
+    fixtures: "FixturePool | None" = None,
+) -> AsyncIterator[LoadReport]:
+    """Asynchronous version of :func:`iter_soak_test`.
+
+    Every lifecycle is performed in its own asynchronous task.
+    """
+    conf = CheckConfig(
+        client, reference_pool_size=REFERENCE_POOL_SIZE, fixtures=fixtures
+    )
+    resource_types = _jobs(client, resource_types, 1)
+    pending: set[asyncio.Future[dict[str, Any]]] = set()
+    clock = _SoakClock(rate, window, duration)
+    report = clock.new_window()
+
+    async def lifecycle(resource_type: ResourceType) -> dict[str, Any]:
+        tasks = aresource_type_tasks(conf, resource_type, f"{resource_type.id}.")
+        return await arun_tasks(conf, tasks)
+
+    try:
+        while not clock.is_over() or pending:
+            if clock.is_window_over():
+                yield clock.close_window(report)
+                report = clock.new_window()
+
+            elif clock.is_start_due():
+                resource_type = resource_types[clock.started % len(resource_types)]
+                pending.add(asyncio.ensure_future(lifecycle(resource_type)))
+                clock.started += 1
+
+            elif pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=clock.next_event(), return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    report.add(future.result())
+
+            else:
+                await asyncio.sleep(clock.next_event())
+
+        yield clock.close_window(report)
+
+    finally:
+        # Cancelling lifecycles could interrupt a creation request that the server
+        # already processed, and leak its object, so the started lifecycles are awaited.
+        await asyncio.gather(*pending, return_exceptions=True)
+        await adelete_references(conf)
+
+
+class _SoakClock:
+    """Schedule of the lifecycles starts and of the statistics windows of a soak test."""
+
+    def __init__(self, rate: float, window: float, duration: float | None):
+        self.rate = rate
+        self.window = window
+        self.start = time.perf_counter()
+        self.end = self.start + duration if duration is not None else math.inf
+        self.window_start = self.start
+        self.started = 0
+
+    def next_start(self) -> float:
+        return self.start + self.started / self.rate
+
+    def is_over(self) -> bool:
+        return self.next_start() >= self.end
+
+    def is_start_due(self) -> bool:
+        return not self.is_over() and time.perf_counter() >= self.next_start()
+
+    def is_window_over(self) -> bool:
+        return time.perf_counter() >= self.window_start + self.window
+
+    def next_event(self) -> float:
+        """Return the number of seconds until the next lifecycle start or window end."""
+        next_start = self.next_start() if not self.is_over() else math.inf
+        next_event = min(next_start, self.window_start + self.window)
+        return max(next_event - time.perf_counter(), 0)
+
+    def new_window(self) -> LoadReport:
+        return LoadReport(start=datetime.datetime.now(datetime.timezone.utc))
+
+    def close_window(self, report: LoadReport) -> LoadReport:
+        now = time.perf_counter()
+        report.finish(now - self.window_start)
+        self.window_start = now
+        return report
+
+
+OPERATIONS = (
+    "creation",
+    "query",
+    "query_without_id",
+    "replacement",
+    "modification",
+    "deletion",
+)
+"""The operations that can be performed on a :class:`ResourcePool`."""
+
+READ_OPERATIONS = ("query", "query_without_id")
+"""The :data:`OPERATIONS` that are performed on the :attr:`~scim2_tester.CheckConfig.fixtures` if there are any."""
+
+
+def rate_test(
+    client: SCIMClient,
+    rate: float,
+    duration: float,
+    operation: str = "creation",
+    resource_types: list[ResourceType] | None = None,
+    max_workers: int = 100,
+    fixtures: "FixturePool | None" = None,
+) -> LoadReport:
+    """Perform an operation at a constant rate, whatever the server response times.
+
+    Unlike :func:`load_test`, the operations are started at their scheduled time, and do not wait for
+    the previous ones to finish. Latencies are measured from the scheduled start time, so server
+    stalls are reflected in the latency percentiles instead of slowing down the rate.
+    The operation durations are available in :attr:`OperationStats.service_times`.
+
+    The objects needed by the query, replacement, modification and deletion operations are created before the run,
+    and the temporary objects are deleted after the run.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+        The client must be thread-safe.
+    :param rate: The number of operations to start per second.
+    :param duration: The number of seconds during which operations are started.
+    :param operation: One of :data:`OPERATIONS`.
+    :param resource_types: The resource types the operations are performed on, in turn.
+        Defaults to all the client resource types.
+    :param max_workers: The number of threads performing the operations.
+        It must be large enough to absorb the server stalls, else the operations are queued,
+        which still counts in the latencies.
+    :param fixtures: If set, the query operations are performed on the objects of this :class:`~scim2_tester.FixturePool`,
+        and no object is created before the run for them.
+    """
+    conf = CheckConfig(
+        client, reference_pool_size=REFERENCE_POOL_SIZE, fixtures=fixtures
+    )
+    check_operation(operation)
+    pools = resource_pools(conf, resource_types)
+    report = LoadReport()
+    if not pools:
+        return report
+
+    def perform(pool: ResourcePool, intended: float):
+        result = pool.perform(operation)
+        return pool, result, time.perf_counter() - intended
+
+    try:
+        for pool in pools:
+            if pool.fixture(operation) is None:
+                pool.prepare(_pool_size(operation, len(pools), rate, duration))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for index, intended in enumerate(_schedule(start, rate, duration)):
+                time.sleep(max(intended - time.perf_counter(), 0))
+                pool = pools[index % len(pools)]
+                futures.append(executor.submit(perform, pool, intended))
+
+            for future in futures:
+                pool, result, latency = future.result()
+                if result is not None:
+                    report.record(
+                        f"{pool.resource_type.id}.{operation}", result, latency
+                    )
+
+        report.finish(time.perf_counter() - start)
+
+    finally:
+        for pool in pools:
+            pool.cleanup()
+        delete_references(conf)
+
+    return report
+
+
+async def arate_test(
+    client: BaseAsyncSCIMClient,
+    rate: float,
+    duration: float,
+    operation: str = "creation",
+    resource_types: list[ResourceType] | None = None,
+    fixtures: "FixturePool | None" = None,
+) -> LoadReport:
+    """Asynchronous version of :func:`rate_test`.
+
+    Every operation is performed in its own asynchronous task, so their concurrency is not bounded.
+    """
+    conf = CheckConfig(
+        client, reference_pool_size=REFERENCE_POOL_SIZE, fixtures=fixtures
+    )
+    check_operation(operation)
+    pools = resource_pools(conf, resource_types)
+    report = LoadReport()
+    if not pools:
+        return report
+
+    async def perform(pool: ResourcePool, intended: float) -> None:
+        result = await pool.aperform(operation)
+        latency = time.perf_counter() - intended
+        if result is not None:
+            report.record(f"{pool.resource_type.id}.{operation}", result, latency)
+
+    try:
+        for pool in pools:
+            if pool.fixture(operation) is None:
+                await pool.aprepare(_pool_size(operation, len(pools), rate, duration))
+
+        start = time.perf_counter()
+        tasks = []
+        for index, intended in enumerate(_schedule(start, rate, duration)):
+            await asyncio.sleep(max(intended - time.perf_counter(), 0))
+            pool = pools[index % len(pools)]
+            tasks.append(asyncio.ensure_future(perform(pool, intended)))
+
+        await asyncio.gather(*tasks)
+        report.finish(time.perf_counter() - start)
+
+    finally:
+        for pool in pools:
+            await pool.acleanup()
+        await adelete_references(conf)
+
+    return report
+
+
+def _schedule(start: float, rate: float, duration: float) -> list[float]:
+    """Return the intended start times of the operations."""
+    return [start + index / rate for index in range(int(rate * duration))]
+
+
+def _pool_size(operation: str, pools: int, rate: float, duration: float) -> int:
+    """Return the number of objects a pool needs for a :func:`rate_test`."""
+    if operation == "creation":
+        return 0
+
+    # Deletions consume one object each, the other operations share a single object.
+    if operation == "deletion":
+        return math.ceil(int(rate * duration) / max(pools, 1))
+
+    return 1
+
+
+def check_operation(operation: str) -> None:
+    """Raise a :class:`ValueError` if the operation is not one of :data:`OPERATIONS`."""
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unknown operation {operation}, expected one of {OPERATIONS}")
+
+
+def resource_pools(
+    conf: CheckConfig, resource_types: list[ResourceType] | None = None
+) -> list["ResourcePool"]:
+    """Build a pool for each resource type that has a model.
+
+    :param resource_types: Defaults to all the client resource types.
+    """
+    return [
+        ResourcePool(conf, resource_type)
+        for resource_type in _jobs(conf.client, resource_types, 1)
+        if model_from_resource_type(conf, resource_type)
+    ]
+
+
+class ResourcePool:
+    """Objects of a resource type, shared by load test operations.
+
+    Operations are performed on random objects of the pool. Created objects are added to the pool,
+    and deleted objects are removed from it. Objects are not deleted while other operations use them.
+    :meth:`cleanup` deletes the remaining objects, and the objects created to fill references.
+
+    :raises ValueError: If the client has no model for the resource type.
+    """
+
+    def __init__(self, conf: CheckConfig, resource_type: ResourceType):
+        self.conf = conf
+        self.resource_type = resource_type
+        model = model_from_resource_type(conf, resource_type)
+        if model is None:
+            raise ValueError(f"No schema for the resource type {resource_type.id}")
+
+        self.model = model
+        self.objects: list[Resource] = []
+        self.garbages: list[Resource] = []
+        self.users: Counter[str | None] = Counter()
+        self.lock = threading.Lock()
+
+    def prepare(self, count: int) -> None:
+        """Create objects in the pool."""
+        field_names = field_names_by_mutability(self.model, CREATION_MUTABILITIES)
+        for obj, garbages in iter_objects(self.conf, self.model, count, field_names):
+            self.garbages.extend(garbages)
+            self.objects.append(self.conf.client.create(obj))
+
+    async def aprepare(self, count: int) -> None:
+        """Asynchronous version of :meth:`prepare`."""
+        field_names = field_names_by_mutability(self.model, CREATION_MUTABILITIES)
+        async for obj, garbages in aiter_objects(
+            self.conf, self.model, count, field_names
+        ):
+            self.garbages.extend(garbages)
+            self.objects.append(await self.conf.client.create(obj))
+
+    def take(self, remove: bool = False) -> Resource | None:
+        """Return a random object of the pool, or :data:`None` if the pool is empty.
+
+        Objects taken without being removed must be given back with :meth:`release`.
+
+        :param remove: Whether to remove the object from the pool.
+            Objects in use by other operations are not removed.
+        """
+        with self.lock:
+            candidates = (
+                [obj for obj in self.objects if not self.users[obj.id]]
+                if remove
+                else self.objects
+            )
+            if not candidates:
+                return None
+
+            obj = self.conf.random_generator.choice(candidates)
+            if remove:
+                self.objects.remove(obj)
+            else:
+                self.users[obj.id] += 1
+            return obj
+
+    def fixture(self, operation: str) -> Resource | None:
+        """Return an object of the configuration :class:`~scim2_tester.FixturePool` to perform a read operation on.
+
+        Return :data:`None` for other operations, or if there is no fixture of the pool resource type.
+        """
+        if operation not in READ_OPERATIONS or self.conf.fixtures is None:
+            return None
+        return self.conf.fixtures.take(self.resource_type.id)
+
+    def release(self, obj: Resource) -> None:
+        """Give back an object returned by :meth:`take`."""
+        with self.lock:
+            self.users[obj.id] -= 1
+
+    def perform(self, operation: str) -> CheckResult | None:
+        """Perform one of :data:`OPERATIONS` and return its result.
+
+        Return :data:`None` if the pool has no object to perform the operation on.
+        """
+        if operation == "creation":
+            field_names = field_names_by_mutability(self.model, CREATION_MUTABILITIES)
+            new_obj, garbages = fill_with_random_values(
+                self.conf, self.model.model_validate({}), field_names
+            )
+            self.garbages.extend(garbages)
+            return self.created(check_object_creation(self.conf, new_obj))
+
+        if operation == "deletion":
+            obj = self.take(remove=True)
+            if obj is None:
+                return None
+            return self.deleted(obj, check_object_deletion(self.conf, obj))
+
+        fixture = self.fixture(operation)
+        obj = fixture or self.take()
+        if obj is None:
+            return None
+
+        try:
+            if operation == "query":
+                return check_object_query(self.conf, obj)
+
+            if operation == "query_without_id":
+                return check_object_query_without_id(self.conf, obj)
+
+            if operation == "modification":
+                return check_object_modification(self.conf, obj)
+
+            field_names = field_names_by_mutability(
+                self.model, REPLACEMENT_MUTABILITIES
+            )
+            replaced = obj.model_copy(deep=True)
+            _, garbages = fill_with_random_values(self.conf, replaced, field_names)
+            self.garbages.extend(garbages)
+            return check_object_replacement(self.conf, replaced)
+
+        finally:
+            if fixture is None:
+                self.release(obj)
+
+    async def aperform(self, operation: str) -> CheckResult | None:
+        """Asynchronous version of :meth:`perform`."""
+        if operation == "creation":
+            field_names = field_names_by_mutability(self.model, CREATION_MUTABILITIES)
+            new_obj, garbages = await afill_with_random_values(
+                self.conf, self.model.model_validate({}), field_names
+            )
+            self.garbages.extend(garbages)
+            return self.created(await acheck_object_creation(self.conf, new_obj))
+
+        if operation == "deletion":
+            obj = self.take(remove=True)
+            if obj is None:
+                return None
+            return self.deleted(obj, await acheck_object_deletion(self.conf, obj))
+
+        fixture = self.fixture(operation)
+        obj = fixture or self.take()
+        if obj is None:
+            return None
+
+        try:
+            if operation == "query":
+                return await acheck_object_query(self.conf, obj)
+
+            if operation == "query_without_id":
+                return await acheck_object_query_without_id(self.conf, obj)
+
+            if operation == "modification":
+                return await acheck_object_modification(self.conf, obj)
+
+            field_names = field_names_by_mutability(
+                self.model, REPLACEMENT_MUTABILITIES
+            )
+            replaced = obj.model_copy(deep=True)
+            _, garbages = await afill_with_random_values(
+                self.conf, replaced, field_names
+            )
+            self.garbages.extend(garbages)
+            return await acheck_object_replacement(self.conf, replaced)
+
+        finally:
+            if fixture is None:
+                self.release(obj)
+
+    def created(self, result: CheckResult) -> CheckResult:
+        if result.status == Status.SUCCESS and result.data is not None:
+            with self.lock:
+                self.objects.append(result.data)
+        return result
+
+    def deleted(self, obj: Resource, result: CheckResult) -> CheckResult:
+        # Objects that failed to be deleted are deleted again on cleanup
+        if result.status != Status.SUCCESS:
+            self.garbages.append(obj)
+        return result
+
+    def cleanup(self) -> None:
+        """Delete the objects of the pool, and the objects created to fill references.
+
+        The objects of the configuration :class:`~scim2_tester.ReferencePool` can be referenced by other pools,
+        so they are left to :func:`~scim2_tester.resource.delete_references`, once every pool is cleaned up.
+        """
+        delete_objects(self.conf, self.objects + self.garbages[::-1])
+        self.objects.clear()
+        self.garbages.clear()
+
+    async def acleanup(self) -> None:
+        """Asynchronous version of :meth:`cleanup`."""
+        await adelete_objects(self.conf, self.objects + self.garbages[::-1])
+        self.objects.clear()
+        self.garbages.clear()
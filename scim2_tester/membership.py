@@ -0,0 +1,396 @@
+import json
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
+from scim2_models import Context
+from scim2_models import Resource
+from scim2_models import SearchRequest
+
+from scim2_tester.filling import acreate_minimal_object
+from scim2_tester.filling import create_minimal_object
+from scim2_tester.load import LoadReport
+from scim2_tester.resource import acheck_object_query
+from scim2_tester.resource import adelete_objects
+from scim2_tester.resource import check_object_query
+from scim2_tester.resource import delete_objects
+from scim2_tester.resource import object_url
+from scim2_tester.resource import patch_request
+from scim2_tester.resource import supports_patch
+from scim2_tester.utils import CheckConfig
+from scim2_tester.utils import CheckResult
+from scim2_tester.utils import Status
+from scim2_tester.utils import asend_http_request
+from scim2_tester.utils import check_http_response
+from scim2_tester.utils import checker
+from scim2_tester.utils import missing_http_client_result
+from scim2_tester.utils import send_http_request
+
+DEFAULT_MEMBERSHIP_SIZES = (1000, 10000, 50000)
+
+MEMBERSHIP_OPERATIONS = (
+    "member_addition",
+    "member_removal",
+    "query",
+    "query_without_members",
+)
+"""The operations measured by :func:`membership_test` at every group size."""
+
+
+@dataclass
+class MembershipStep:
+    """A step of a :func:`membership_test`."""
+
+    members: int
+    """The number of members of the group during the step."""
+
+    report: LoadReport
+    """The statistics of the :data:`MEMBERSHIP_OPERATIONS` performed during the step."""
+
+
+@dataclass
+class MembershipReport:
+    """Result of a :func:`membership_test`."""
+
+    steps: list[MembershipStep] = field(default_factory=list)
+    """The performed steps, by increasing number of members."""
+
+    def slowdown(self, operation: str) -> float | None:
+        """Return the ratio of the median latency of an operation at the largest group size to the smallest.
+
+        Return :data:`None` if the operation was not measured at both sizes.
+        """
+        if len(self.steps) < 2:
+            return None
+
+        first = self.steps[0].report.operations.get(operation)
+        last = self.steps[-1].report.operations.get(operation)
+        if not first or not last or not first.p50 or last.p50 is None:
+            return None
+
+        return last.p50 / first.p50
+
+    def __str__(self) -> str:
+        lines = [
+            f"{'members':>8} {'operation':<24} {'count':>7} {'errors':>7} {'p50':>8} {'p95':>8} {'bytes':>10}"
+        ]
+        for step in self.steps:
+            for name, stats in step.report.operations.items():
+                lines.append(
+                    f"{step.members:>8} {name:<24} {stats.count:>7} {stats.errors:>7} "
+                    f"{stats.p50 or 0:>8.3f} {stats.p95 or 0:>8.3f} {stats.mean_bytes_received:>10.0f}"
+                )
+        for operation in MEMBERSHIP_OPERATIONS:
+            slowdown = self.slowdown(operation)
+            if slowdown is not None:
+                lines.append(f"{operation} slowdown: {slowdown:.1f}")
+        return "\n".join(lines)
+
+
+@checker("membership")
+def check_member_addition(
+    conf: CheckConfig, group: Resource, member: Resource
+) -> CheckResult:
+    """Add a member to a group with a PATCH ``add`` operation."""
+    if not supports_patch(conf):
+        return _unsupported_patch_result(conf)
+
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    payload = patch_request([_addition(member)])
+    response = send_http_request(conf, "patch", object_url(conf, group), payload)
+    return _membership_result(conf, group, member, "addition", response)
+
+
+@checker("membership")
+async def acheck_member_addition(
+    conf: CheckConfig, group: Resource, member: Resource
+) -> CheckResult:
+    """Add a member to a group with a PATCH ``add`` operation."""
+    if not supports_patch(conf):
+        return _unsupported_patch_result(conf)
+
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    payload = patch_request([_addition(member)])
+    response = await asend_http_request(conf, "patch", object_url(conf, group), payload)
+    return _membership_result(conf, group, member, "addition", response)
+
+
+@checker("membership")
+def check_member_removal(
+    conf: CheckConfig, group: Resource, member: Resource
+) -> CheckResult:
+    """Remove a member from a group with a PATCH ``remove`` operation filtered on the member id."""
+    if not supports_patch(conf):
+        return _unsupported_patch_result(conf)
+
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    payload = patch_request([_removal(member)])
+    response = send_http_request(conf, "patch", object_url(conf, group), payload)
+    return _membership_result(conf, group, member, "removal", response)
+
+
+@checker("membership")
+async def acheck_member_removal(
+    conf: CheckConfig, group: Resource, member: Resource
+) -> CheckResult:
+    """Remove a member from a group with a PATCH ``remove`` operation filtered on the member id."""
+    if not supports_patch(conf):
+        return _unsupported_patch_result(conf)
+
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    payload = patch_request([_removal(member)])
+    response = await asend_http_request(conf, "patch", object_url(conf, group), payload)
+    return _membership_result(conf, group, member, "removal", response)
+
+
+@checker("membership")
+def check_group_query_without_members(
+    conf: CheckConfig, group: Resource
+) -> CheckResult:
+    """Query a group with ``excludedAttributes=members``, and check that no member is returned.
+
+    Clients that only need the group attributes rely on this to avoid the cost of large groups.
+    """
+    response = conf.client.query(
+        group.__class__,
+        group.id,
+        search_request=SearchRequest(excluded_attributes=["members"]),
+        expected_status_codes=conf.expected_status_codes or [200],
+    )
+    return _query_without_members_result(conf, group, response)
+
+
+@checker("membership")
+async def acheck_group_query_without_members(
+    conf: CheckConfig, group: Resource
+) -> CheckResult:
+    """Query a group with ``excludedAttributes=members``, and check that no member is returned."""
+    response = await conf.client.query(
+        group.__class__,
+        group.id,
+        search_request=SearchRequest(excluded_attributes=["members"]),
+        expected_status_codes=conf.expected_status_codes or [200],
+    )
+    return _query_without_members_result(conf, group, response)
+
+
+def _member(member: Resource) -> dict[str, Any]:
+    location = member.meta.location if member.meta else None
+    return {"value": member.id, "$ref": location}
+
+
+def _addition(member: Resource) -> dict[str, Any]:
+    return {"op": "add", "path": "members", "value": [_member(member)]}
+
+
+def _removal(member: Resource) -> dict[str, Any]:
+    return {"op": "remove", "path": f"members[value eq {json.dumps(member.id)}]"}
+
+
+def _unsupported_patch_result(conf: CheckConfig) -> CheckResult:
+    return CheckResult(
+        conf,
+        status=Status.SKIPPED,
+        reason="The server does not support PATCH operations",
+    )
+
+
+def _membership_result(
+    conf: CheckConfig, group: Resource, member: Resource, operation: str, response
+) -> CheckResult:
+    modified = check_http_response(
+        conf,
+        response,
+        expected_status_codes=conf.expected_status_codes or [200, 204],
+        expected_types=[group.__class__],
+        scim_ctx=Context.RESOURCE_REPLACEMENT_RESPONSE,
+    )
+    if modified is not None:
+        is_member = any(
+            group_member.value == member.id for group_member in modified.members or []
+        )
+        if is_member != (operation == "addition"):
+            return CheckResult(
+                conf,
+                status=Status.ERROR,
+                reason=f"The {member.__class__.__name__} object with id {member.id} {'is not' if operation == 'addition' else 'is still'} a member of the group after its {operation}",
+            )
+
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful {operation} of a member of the {group.__class__.__name__} object with id {group.id}",
+    )
+
+
+def _query_without_members_result(
+    conf: CheckConfig, group: Resource, response
+) -> CheckResult:
+    if response.members:
+        return CheckResult(
+            conf,
+            status=Status.ERROR,
+            reason=f"{len(response.members)} members were returned despite excludedAttributes=members",
+        )
+
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful query of the {group.__class__.__name__} object with id {group.id} without its members",
+    )
+
+
+def membership_test(
+    client: SCIMClient,
+    sizes: tuple[int, ...] = DEFAULT_MEMBERSHIP_SIZES,
+    iterations: int = 10,
+) -> MembershipReport:
+    """Grow a group step by step, and measure how its operations scale with the number of members.
+
+    At every step, users are created with :func:`~scim2_tester.filling.create_minimal_object`
+    until the group can have the step number of members, and the group is replaced with all of them as members.
+    Then the :data:`MEMBERSHIP_OPERATIONS` are performed ``iterations`` times each:
+    a user is added to the group and removed from it with PATCH requests
+    by :func:`check_member_addition` and :func:`check_member_removal`,
+    and the group is queried with :func:`~scim2_tester.resource.check_object_query`,
+    and without its members by :func:`check_group_query_without_members`.
+    If the server does not announce PATCH support, the additions and removals are skipped, and not reported.
+    If the server has no ``User`` or ``Group`` resource type, the report is empty.
+    The created objects are deleted after the run.
+
+    PATCH requests are sent with the HTTP client wrapped by the SCIM client, like :class:`httpx.Client`.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+    :param sizes: The number of members of the group at each step, in increasing order.
+    :param iterations: The number of times each operation is performed at each step.
+    """
+    conf = CheckConfig(client)
+    report = MembershipReport()
+    group_model = client.get_resource_model("Group")
+    user_model = client.get_resource_model("User")
+    if group_model is None or user_model is None:
+        return report
+
+    users: list[Resource] = []
+    garbages: list[Resource] = []
+    group = None
+    try:
+        group, group_garbages = create_minimal_object(conf, group_model)
+        garbages.extend(group_garbages)
+        spare, spare_garbages = create_minimal_object(conf, user_model)
+        garbages.extend([*spare_garbages, spare])
+        for size in sizes:
+            while len(users) < size:
+                user, user_garbages = create_minimal_object(conf, user_model)
+                garbages.extend(user_garbages)
+                users.append(user)
+
+            group = conf.client.replace(_with_members(group, users[:size]))
+            step = MembershipStep(size, LoadReport())
+            start = time.perf_counter()
+            for _ in range(iterations):
+                _record(
+                    step, "member_addition", check_member_addition(conf, group, spare)
+                )
+                _record(
+                    step, "member_removal", check_member_removal(conf, group, spare)
+                )
+                _record(step, "query", check_object_query(conf, group))
+                _record(
+                    step,
+                    "query_without_members",
+                    check_group_query_without_members(conf, group),
+                )
+            step.report.finish(time.perf_counter() - start)
+            report.steps.append(step)
+
+    finally:
+        delete_objects(conf, ([group] if group else []) + users + garbages[::-1])
+
+    return report
+
+
+async def amembership_test(
+    client: BaseAsyncSCIMClient,
+    sizes: tuple[int, ...] = DEFAULT_MEMBERSHIP_SIZES,
+    iterations: int = 10,
+) -> MembershipReport:
+    """Asynchronous version of :func:`membership_test`."""
+    conf = CheckConfig(client)
+    report = MembershipReport()
+    group_model = client.get_resource_model("Group")
+    user_model = client.get_resource_model("User")
+    if group_model is None or user_model is None:
+        return report
+
+    users: list[Resource] = []
+    garbages: list[Resource] = []
+    group = None
+    try:
+        group, group_garbages = await acreate_minimal_object(conf, group_model)
+        garbages.extend(group_garbages)
+        spare, spare_garbages = await acreate_minimal_object(conf, user_model)
+        garbages.extend([*spare_garbages, spare])
+        for size in sizes:
+            while len(users) < size:
+                user, user_garbages = await acreate_minimal_object(conf, user_model)
+                garbages.extend(user_garbages)
+                users.append(user)
+
+            group = await conf.client.replace(_with_members(group, users[:size]))
+            step = MembershipStep(size, LoadReport())
+            start = time.perf_counter()
+            for _ in range(iterations):
+                _record(
+                    step,
+                    "member_addition",
+                    await acheck_member_addition(conf, group, spare),
+                )
+                _record(
+                    step,
+                    "member_removal",
+                    await acheck_member_removal(conf, group, spare),
+                )
+                _record(step, "query", await acheck_object_query(conf, group))
+                _record(
+                    step,
+                    "query_without_members",
+                    await acheck_group_query_without_members(conf, group),
+                )
+            step.report.finish(time.perf_counter() - start)
+            report.steps.append(step)
+
+    finally:
+        await adelete_objects(conf, ([group] if group else []) + users + garbages[::-1])
+
+    return report
+
+
+def _record(step: MembershipStep, operation: str, result: CheckResult) -> None:
+    # Skipped checks performed no request, so their latency would skew the statistics
+    if result.status != Status.SKIPPED:
+        step.report.record(operation, result)
+
+
+def _with_members(group: Resource, users: list[Resource]) -> Resource:
+    """Return a copy of a group, with users as members."""
+    member_model = group.get_field_root_type("members")
+    if member_model is None:
+        return group
+
+    members = [
+        member_model(value=user.id, ref=user.meta.location if user.meta else None)
+        for user in users
+    ]
+    return group.model_copy(update={"members": members})
@@ -0,0 +1,244 @@
+import statistics
+import time
+from dataclasses import dataclass
+
+from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
+from scim2_models import ListResponse
+from scim2_models import Resource
+from scim2_models import ResourceType
+from scim2_models import SearchRequest
+
+from scim2_tester.load import REFERENCE_POOL_SIZE
+from scim2_tester.load import resource_pools
+from scim2_tester.resource import adelete_references
+from scim2_tester.resource import delete_references
+from scim2_tester.resource import next_start_index
+from scim2_tester.utils import CheckConfig
+from scim2_tester.utils import CheckResult
+from scim2_tester.utils import Status
+from scim2_tester.utils import checker
+
+
+@dataclass
+class Page:
+    """A page of a paginated query, stored in the :func:`check_pagination` results data."""
+
+    start_index: int
+    """The requested ``startIndex``."""
+
+    items: int
+    """The number of resources in the page."""
+
+    latency: float
+    """The number of seconds the page query lasted."""
+
+
+@checker("pagination")
+def check_pagination(
+    conf: CheckConfig,
+    model: type[Resource],
+    objs: list[Resource],
+    page_size: int = 10,
+    max_slowdown: float = 3,
+) -> CheckResult:
+    """Walk every page of a resource type with startIndex and count, and check the pagination consistency.
+
+    The totalResults and itemsPerPage values must match the returned resources,
+    every object of ``objs`` must be returned once, and the last pages must not be
+    more than ``max_slowdown`` times slower than the first pages.
+    """
+    pages: list[tuple[int, ListResponse, float]] = []
+    while (start_index := _next_start_index(pages)) is not None:
+        search_request = SearchRequest(start_index=start_index, count=page_size)
+        start = time.perf_counter()
+        response = conf.client.query(
+            model,
+            search_request=search_request,
+            expected_status_codes=conf.expected_status_codes or [200],
+        )
+        pages.append((start_index, response, time.perf_counter() - start))
+
+    return _pagination_result(conf, model, objs, page_size, max_slowdown, pages)
+
+
+@checker("pagination")
+async def acheck_pagination(
+    conf: CheckConfig,
+    model: type[Resource],
+    objs: list[Resource],
+    page_size: int = 10,
+    max_slowdown: float = 3,
+) -> CheckResult:
+    """Walk every page of a resource type with startIndex and count, and check the pagination consistency."""
+    pages: list[tuple[int, ListResponse, float]] = []
+    while (start_index := _next_start_index(pages)) is not None:
+        search_request = SearchRequest(start_index=start_index, count=page_size)
+        start = time.perf_counter()
+        response = await conf.client.query(
+            model,
+            search_request=search_request,
+            expected_status_codes=conf.expected_status_codes or [200],
+        )
+        pages.append((start_index, response, time.perf_counter() - start))
+
+    return _pagination_result(conf, model, objs, page_size, max_slowdown, pages)
+
+
+def _next_start_index(pages: list[tuple[int, ListResponse, float]]) -> int | None:
+    """Return the startIndex of the next page to query, or :data:`None` if the last page was reached."""
+    if not pages:
+        return 1
+
+    start_index, response, _ = pages[-1]
+    return next_start_index(start_index, response, pages[0][1])
+
+
+def _pagination_result(
+    conf: CheckConfig,
+    model: type[Resource],
+    objs: list[Resource],
+    page_size: int,
+    max_slowdown: float,
+    pages: list[tuple[int, ListResponse, float]],
+) -> CheckResult:
+    problems = []
+    ids = [
+        resource.id for _, response, _ in pages for resource in response.resources or []
+    ]
+    total_results = pages[0][1].total_results
+    if total_results is None:
+        problems.append("totalResults is missing")
+
+    elif total_results != len(ids):
+        problems.append(
+            f"totalResults is {total_results} but {len(ids)} resources were returned"
+        )
+
+    for start_index, response, _ in pages:
+        items = len(response.resources or [])
+        if response.total_results != total_results:
+            problems.append(
+                f"totalResults changed to {response.total_results} at startIndex {start_index}"
+            )
+        if response.items_per_page is not None and response.items_per_page != items:
+            problems.append(
+                f"itemsPerPage is {response.items_per_page} but {items} resources were returned at startIndex {start_index}"
+            )
+        if items > page_size:
+            problems.append(
+                f"{items} resources were returned at startIndex {start_index} for a count of {page_size}"
+            )
+        if response.start_index is not None and response.start_index != start_index:
+            problems.append(
+                f"startIndex {response.start_index} was returned for startIndex {start_index}"
+            )
+
+    if len(set(ids)) != len(ids):
+        problems.append("some resources were returned on several pages")
+
+    missing = {obj.id for obj in objs} - set(ids)
+    if missing:
+        problems.append(f"{len(missing)} resources were not returned")
+
+    slowdown = _slowdown([latency for _, _, latency in pages])
+    if slowdown is not None and slowdown > max_slowdown:
+        problems.append(
+            f"the last pages are {slowdown:.1f} times slower than the first pages"
+        )
+
+    data = [
+        Page(start_index, len(response.resources or []), latency)
+        for start_index, response, latency in pages
+    ]
+    if problems:
+        return CheckResult(
+            conf,
+            status=Status.ERROR,
+            reason=f"Inconsistent pagination of {model.__name__} objects: {'; '.join(problems)}",
+            data=data,
+        )
+
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful pagination of {len(ids)} {model.__name__} objects in {len(pages)} pages",
+        data=data,
+    )
+
+
+def _slowdown(latencies: list[float]) -> float | None:
+    """Return the ratio of the median latency of the last quarter of the pages to the first quarter.
+
+    Return :data:`None` if there are not enough pages to compare.
+    """
+    quarter = len(latencies) // 4
+    if quarter < 2:
+        return None
+
+    first = statistics.median(latencies[:quarter])
+    last = statistics.median(latencies[-quarter:])
+    return last / first if first else None
+
+
+def pagination_test(
+    client: SCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    seeds: int = 50,
+    page_size: int = 10,
+    max_slowdown: float = 3,
+) -> list[CheckResult]:
+    """Create objects of resource types, and check their pagination with :func:`check_pagination`.
+
+    The query latency of every page is stored in the result data as :class:`Page` objects,
+    so servers whose deep pages get slower with the offset can be spotted.
+    The created objects are deleted after the checks.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+    :param resource_types: The resource types to check. Defaults to all the client resource types.
+    :param seeds: The number of objects to create for each resource type.
+    :param page_size: The ``count`` of resources requested for every page.
+    :param max_slowdown: The maximum ratio of the last pages latency to the first pages latency.
+    """
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    results = []
+    try:
+        for pool in resource_pools(conf, resource_types):
+            try:
+                pool.prepare(seeds)
+                results.append(
+                    check_pagination(
+                        conf, pool.model, pool.objects, page_size, max_slowdown
+                    )
+                )
+            finally:
+                pool.cleanup()
+    finally:
+        delete_references(conf)
+    return results
+
+
+async def apagination_test(
+    client: BaseAsyncSCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    seeds: int = 50,
+    page_size: int = 10,
+    max_slowdown: float = 3,
+) -> list[CheckResult]:
+    """Asynchronous version of :func:`pagination_test`."""
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    results = []
+    try:
+        for pool in resource_pools(conf, resource_types):
+            try:
+                await pool.aprepare(seeds)
+                results.append(
+                    await acheck_pagination(
+                        conf, pool.model, pool.objects, page_size, max_slowdown
+                    )
+                )
+            finally:
+                await pool.acleanup()
+    finally:
+        await adelete_references(conf)
+    return results
@@ -0,0 +1,115 @@
+import time
+
+from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
+from scim2_models import Resource
+from scim2_models import ResourceType
+
+from scim2_tester.load import REFERENCE_POOL_SIZE
+from scim2_tester.load import LoadReport
+from scim2_tester.load import ResourcePool
+from scim2_tester.load import resource_pools
+from scim2_tester.resource import acheck_object_modification
+from scim2_tester.resource import acheck_object_replacement
+from scim2_tester.resource import adelete_references
+from scim2_tester.resource import check_object_modification
+from scim2_tester.resource import check_object_replacement
+from scim2_tester.resource import delete_references
+from scim2_tester.resource import patch_field_name
+from scim2_tester.resource import supports_patch
+from scim2_tester.utils import CheckConfig
+
+
+def patch_test(
+    client: SCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    iterations: int = 10,
+) -> LoadReport:
+    """Compare equivalent PUT and PATCH updates of objects.
+
+    For every resource type, an object is created, and the same attribute is updated ``iterations`` times
+    with a full replacement by :func:`~scim2_tester.resource.check_object_replacement`, and with a PATCH
+    ``replace`` operation by :func:`~scim2_tester.resource.check_object_modification`.
+    The report operations are named ``replacement`` and ``modification``, for instance ``User.modification``,
+    and the request body sizes are available in :attr:`~scim2_tester.OperationStats.bytes_sent`.
+    Resource types without attribute that can be patched are not reported,
+    and the report is empty if the server does not announce PATCH support.
+    The created objects are deleted after the run.
+
+    PATCH requests are sent with the HTTP client wrapped by the SCIM client, like :class:`httpx.Client`.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+    :param resource_types: The resource types to update. Defaults to all the client resource types.
+    :param iterations: The number of updates of each kind for every resource type.
+    """
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    report = LoadReport()
+    start = time.perf_counter()
+    try:
+        for pool in _pools(conf, resource_types):
+            try:
+                pool.prepare(1)
+                obj = pool.objects[0]
+                for _ in range(iterations):
+                    replacement = check_object_replacement(conf, _replaced(conf, obj))
+                    report.record(f"{pool.resource_type.id}.replacement", replacement)
+                    modification = check_object_modification(conf, obj)
+                    report.record(f"{pool.resource_type.id}.modification", modification)
+            finally:
+                pool.cleanup()
+    finally:
+        delete_references(conf)
+
+    report.finish(time.perf_counter() - start)
+    return report
+
+
+async def apatch_test(
+    client: BaseAsyncSCIMClient,
+    resource_types: list[ResourceType] | None = None,
+    iterations: int = 10,
+) -> LoadReport:
+    """Asynchronous version of :func:`patch_test`."""
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    report = LoadReport()
+    start = time.perf_counter()
+    try:
+        for pool in _pools(conf, resource_types):
+            try:
+                await pool.aprepare(1)
+                obj = pool.objects[0]
+                for _ in range(iterations):
+                    replacement = await acheck_object_replacement(
+                        conf, _replaced(conf, obj)
+                    )
+                    report.record(f"{pool.resource_type.id}.replacement", replacement)
+                    modification = await acheck_object_modification(conf, obj)
+                    report.record(f"{pool.resource_type.id}.modification", modification)
+            finally:
+                await pool.acleanup()
+    finally:
+        await adelete_references(conf)
+
+    report.finish(time.perf_counter() - start)
+    return report
+
+
+def _pools(
+    conf: CheckConfig, resource_types: list[ResourceType] | None
+) -> list[ResourcePool]:
+    if not supports_patch(conf):
+        return []
+
+    return [
+        pool
+        for pool in resource_pools(conf, resource_types)
+        if patch_field_name(pool.model) is not None
+    ]
+
+
+def _replaced(conf: CheckConfig, obj: Resource) -> Resource:
+    """Return a copy of an object, with the same attribute as the PATCH checks updated."""
+    replaced = obj.model_copy(deep=True)
+    if field_name := patch_field_name(obj.__class__):
+        setattr(replaced, field_name, str(conf.random_uuid()))
+    return replaced
@@ -1,12 +1,32 @@
+from typing import Any
+
+from scim2_client import SCIMClientError
+from scim2_models import Context
+from scim2_models import Error
+from scim2_models import ListResponse
 from scim2_models import Mutability
+from scim2_models import PatchOp
+from scim2_models import Required
 from scim2_models import Resource
 from scim2_models import ResourceType
+from scim2_models import SearchRequest
 
+from scim2_tester.filling import afill_with_random_values
+from scim2_tester.filling import fill_plan
 from scim2_tester.filling import fill_with_random_values
+from scim2_tester.scheduler import Task
+from scim2_tester.scheduler import arun_tasks
+from scim2_tester.scheduler import run_tasks
+from scim2_tester.scheduler import task_results
 from scim2_tester.utils import CheckConfig
 from scim2_tester.utils import CheckResult
 from scim2_tester.utils import Status
+from scim2_tester.utils import asend_http_request
+from scim2_tester.utils import check_http_response
 from scim2_tester.utils import checker
+from scim2_tester.utils import http_url
+from scim2_tester.utils import missing_http_client_result
+from scim2_tester.utils import send_http_request
 
 
 def model_from_resource_type(
@@ -19,7 +39,7 @@ def model_from_resource_type(
     return None
 
 
-@checker
+@checker("crud")
 def check_object_creation(conf: CheckConfig, obj: type[Resource]) -> CheckResult:
     """Perform an object creation.
 
@@ -40,7 +60,22 @@ def check_object_creation(conf: CheckConfig, obj: type[Resource]) -> CheckResult
     )
 
 
-@checker
+@checker("crud")
+async def acheck_object_creation(conf: CheckConfig, obj: type[Resource]) -> CheckResult:
+    """Perform an object creation."""
+    response = await conf.client.create(
+        obj, expected_status_codes=conf.expected_status_codes or [201]
+    )
+
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful creation of a {obj.__class__.__name__} object with id {response.id}",
+        data=response,
+    )
+
+
+@checker("crud")
 def check_object_query(conf: CheckConfig, obj: type[Resource]) -> CheckResult:
     """Perform an object query by knowing its id.
 
@@ -60,22 +95,140 @@ def check_object_query(conf: CheckConfig, obj: type[Resource]) -> CheckResult:
     )
 
 
-@checker
+@checker("crud")
+async def acheck_object_query(conf: CheckConfig, obj: type[Resource]) -> CheckResult:
+    """Perform an object query by knowing its id."""
+    response = await conf.client.query(
+        obj.__class__, obj.id, expected_status_codes=conf.expected_status_codes or [200]
+    )
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful query of a {obj.__class__.__name__} object with id {response.id}",
+        data=response,
+    )
+
+
+@checker("crud")
 def check_object_query_without_id(
     conf: CheckConfig, obj: type[Resource]
 ) -> CheckResult:
-    """Perform the query of all objects of one kind.
+    """Perform the query of all objects of one kind, and look for the object.
+
+    If the server supports filtering, the object is looked for with an ``id eq`` filter.
+    Else, or if the filter does not return it, the pages are walked until the object is found.
 
     Todo:
-      - look for the object across several pages
       - check if the fields of the result object are the same than the
       fields of the request object
 
     """
-    response = conf.client.query(
-        obj.__class__, expected_status_codes=conf.expected_status_codes or [200]
+    if supports_filter(conf):
+        response = conf.client.query(
+            obj.__class__,
+            search_request=id_search_request(obj),
+            expected_status_codes=conf.expected_status_codes or [200],
+        )
+        if is_in_response(obj, response):
+            return _query_without_id_result(conf, obj, response, found=True)
+
+    start_index: int | None = 1
+    first_response = None
+    while start_index is not None:
+        response = conf.client.query(
+            obj.__class__,
+            search_request=SearchRequest(start_index=start_index),
+            expected_status_codes=conf.expected_status_codes or [200],
+        )
+        if is_in_response(obj, response):
+            return _query_without_id_result(conf, obj, response, found=True)
+
+        first_response = first_response or response
+        start_index = next_start_index(start_index, response, first_response)
+
+    return _query_without_id_result(conf, obj, response, found=False)
+
+
+@checker("crud")
+async def acheck_object_query_without_id(
+    conf: CheckConfig, obj: type[Resource]
+) -> CheckResult:
+    """Perform the query of all objects of one kind, and look for the object."""
+    if supports_filter(conf):
+        response = await conf.client.query(
+            obj.__class__,
+            search_request=id_search_request(obj),
+            expected_status_codes=conf.expected_status_codes or [200],
+        )
+        if is_in_response(obj, response):
+            return _query_without_id_result(conf, obj, response, found=True)
+
+    start_index: int | None = 1
+    first_response = None
+    while start_index is not None:
+        response = await conf.client.query(
+            obj.__class__,
+            search_request=SearchRequest(start_index=start_index),
+            expected_status_codes=conf.expected_status_codes or [200],
+        )
+        if is_in_response(obj, response):
+            return _query_without_id_result(conf, obj, response, found=True)
+
+        first_response = first_response or response
+        start_index = next_start_index(start_index, response, first_response)
+
+    return _query_without_id_result(conf, obj, response, found=False)
+
+
+def supports_filter(conf: CheckConfig) -> bool:
+    """Whether the server :class:`~scim2_models.ServiceProviderConfig` announces filtering support."""
+    service_provider_config = conf.client.service_provider_config
+    return bool(
+        service_provider_config
+        and service_provider_config.filter
+        and service_provider_config.filter.supported
     )
-    found = any(obj.id == resource.id for resource in response.resources)
+
+
+def id_search_request(obj: Resource) -> SearchRequest:
+    """Build a search request filtering on the object id."""
+    obj_id = (obj.id or "").replace("\\", "\\\\").replace('"', '\\"')
+    return SearchRequest(filter=f'id eq "{obj_id}"')
+
+
+def is_in_response(obj: Resource, response: ListResponse) -> bool:
+    return any(obj.id == resource.id for resource in response.resources or [])
+
+
+def next_start_index(
+    start_index: int, response: ListResponse, first_response: ListResponse
+) -> int | None:
+    """Return the startIndex of the page following a response, or :data:`None` if it was the last page.
+
+    :param first_response: The response of the first page, whose totalResults is trusted.
+    """
+    if not response.resources:
+        return None
+
+    # Servers ignoring startIndex would return the first page again and again
+    if (
+        response is not first_response
+        and first_response.resources
+        and response.resources[0].id == first_response.resources[0].id
+    ):
+        return None
+
+    next_index = start_index + len(response.resources)
+    total_results = first_response.total_results
+    if total_results is not None and next_index > total_results:
+        return None
+
+    return next_index
+
+
+def _query_without_id_result(
+    conf: CheckConfig, obj: Resource, response: ListResponse, found: bool
+) -> CheckResult:
     if not found:
         return CheckResult(
             conf,
@@ -92,7 +245,7 @@ def check_object_query_without_id(
     )
 
 
-@checker
+@checker("crud")
 def check_object_replacement(conf: CheckConfig, obj: type[Resource]) -> CheckResult:
     """Perform an object replacement.
 
@@ -112,7 +265,209 @@ def check_object_replacement(conf: CheckConfig, obj: type[Resource]) -> CheckRes
     )
 
 
-@checker
+@checker("crud")
+async def acheck_object_replacement(
+    conf: CheckConfig, obj: type[Resource]
+) -> CheckResult:
+    """Perform an object replacement."""
+    response = await conf.client.replace(
+        obj, expected_status_codes=conf.expected_status_codes or [200]
+    )
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful replacement of a {obj.__class__.__name__} object with id {response.id}",
+        data=response,
+    )
+
+
+@checker("crud", "patch")
+def check_object_modification(
+    conf: CheckConfig, obj: Resource, op: str = "replace", with_path: bool = True
+) -> CheckResult:
+    """Perform a PATCH operation on an attribute of an object.
+
+    ``add`` and ``replace`` operations set a new random value to the attribute,
+    and ``remove`` operations unset it. Operations without path pass the value in an object.
+    If the server returns the modified object, the attribute value is checked.
+    """
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    field_name = patch_field_name(obj.__class__)
+    if field_name is None:
+        return _no_patch_field_result(conf, obj)
+
+    payload, value = _patch_payload(conf, obj, field_name, op, with_path)
+    response = send_http_request(conf, "patch", object_url(conf, obj), payload)
+    return _modification_result(conf, obj, field_name, op, with_path, value, response)
+
+
+@checker("crud", "patch")
+async def acheck_object_modification(
+    conf: CheckConfig, obj: Resource, op: str = "replace", with_path: bool = True
+) -> CheckResult:
+    """Perform a PATCH operation on an attribute of an object."""
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    field_name = patch_field_name(obj.__class__)
+    if field_name is None:
+        return _no_patch_field_result(conf, obj)
+
+    payload, value = _patch_payload(conf, obj, field_name, op, with_path)
+    response = await asend_http_request(conf, "patch", object_url(conf, obj), payload)
+    return _modification_result(conf, obj, field_name, op, with_path, value, response)
+
+
+@checker("patch", "negative")
+def check_object_modification_without_target(
+    conf: CheckConfig, obj: Resource
+) -> CheckResult:
+    """Check that a PATCH remove operation without path returns a 400 noTarget error."""
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    payload = patch_request([{"op": "remove"}])
+    response = send_http_request(conf, "patch", object_url(conf, obj), payload)
+    return _no_target_result(conf, obj, response)
+
+
+@checker("patch", "negative")
+async def acheck_object_modification_without_target(
+    conf: CheckConfig, obj: Resource
+) -> CheckResult:
+    """Check that a PATCH remove operation without path returns a 400 noTarget error."""
+    if (skipped := missing_http_client_result(conf)) is not None:
+        return skipped
+
+    payload = patch_request([{"op": "remove"}])
+    response = await asend_http_request(conf, "patch", object_url(conf, obj), payload)
+    return _no_target_result(conf, obj, response)
+
+
+def supports_patch(conf: CheckConfig) -> bool:
+    """Whether the server :class:`~scim2_models.ServiceProviderConfig` announces PATCH support."""
+    service_provider_config = conf.client.service_provider_config
+    return bool(
+        service_provider_config
+        and service_provider_config.patch
+        and service_provider_config.patch.supported
+    )
+
+
+def patch_field_name(model: type[Resource]) -> str | None:
+    """Return the name of an optional, singular and writable string attribute, that PATCH checks can modify."""
+    for field_name in field_names_by_mutability(model, REPLACEMENT_MUTABILITIES):
+        field = model.model_fields[field_name]
+        if (
+            model.get_field_root_type(field_name) is str
+            and not model.get_field_multiplicity(field_name)
+            and model.get_field_annotation(field_name, Required) != Required.true
+            and not field.examples
+        ):
+            return field_name
+
+    return None
+
+
+def patch_request(operations: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the payload of a PATCH request performing operations."""
+    # Operations are not built with PatchOperation, as it normalizes the case of the value keys
+    return {
+        "schemas": PatchOp.model_fields["schemas"].default,
+        "Operations": operations,
+    }
+
+
+def _patch_payload(
+    conf: CheckConfig, obj: Resource, field_name: str, op: str, with_path: bool
+) -> tuple[dict[str, Any], str | None]:
+    """Return the PATCH request payload, and the expected attribute value."""
+    attribute = obj.model_fields[field_name].serialization_alias or field_name
+    if op == "remove":
+        return patch_request([{"op": op, "path": attribute}]), None
+
+    value = str(conf.random_uuid())
+    operation = (
+        {"op": op, "path": attribute, "value": value}
+        if with_path
+        else {"op": op, "value": {attribute: value}}
+    )
+    return patch_request([operation]), value
+
+
+def object_url(conf: CheckConfig, obj: Resource) -> str:
+    """Return the URL of an object, for requests sent with the :meth:`~scim2_tester.utils.CheckConfig.http_client`."""
+    return http_url(conf, f"{conf.client.resource_endpoint(obj.__class__)}/{obj.id}")
+
+
+def _no_patch_field_result(conf: CheckConfig, obj: Resource) -> CheckResult:
+    return CheckResult(
+        conf,
+        status=Status.SKIPPED,
+        reason=f"No attribute of {obj.__class__.__name__} objects can be modified with PATCH",
+    )
+
+
+def _modification_result(
+    conf: CheckConfig,
+    obj: Resource,
+    field_name: str,
+    op: str,
+    with_path: bool,
+    value: str | None,
+    response,
+) -> CheckResult:
+    modified = check_http_response(
+        conf,
+        response,
+        expected_status_codes=conf.expected_status_codes or [200, 204],
+        expected_types=[obj.__class__],
+        scim_ctx=Context.RESOURCE_REPLACEMENT_RESPONSE,
+    )
+    attribute = obj.model_fields[field_name].serialization_alias or field_name
+    operation = f"{op} operation {'with' if with_path else 'without'} path"
+    if modified is not None and getattr(modified, field_name) != value:
+        return CheckResult(
+            conf,
+            status=Status.ERROR,
+            reason=f"The {attribute} value of a {obj.__class__.__name__} object is {getattr(modified, field_name)!r} after a PATCH {operation}, expected {value!r}",
+            data=modified,
+        )
+
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful PATCH {operation} on the {attribute} attribute of a {obj.__class__.__name__} object with id {obj.id}",
+        data=modified,
+    )
+
+
+def _no_target_result(conf: CheckConfig, obj: Resource, response) -> CheckResult:
+    error = check_http_response(
+        conf,
+        response,
+        expected_status_codes=[400],
+        raise_scim_errors=False,
+    )
+    if not isinstance(error, Error) or error.scim_type != "noTarget":
+        return CheckResult(
+            conf,
+            status=Status.ERROR,
+            reason=f"A PATCH remove operation without path on a {obj.__class__.__name__} object did not return a noTarget error",
+            data=error,
+        )
+
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"A PATCH remove operation without path on a {obj.__class__.__name__} object correctly returned a noTarget error",
+        data=error,
+    )
+
+
+@checker("crud")
 def check_object_deletion(conf: CheckConfig, obj: type[Resource]) -> CheckResult:
     """Perform an object deletion."""
     conf.client.delete(
@@ -125,57 +480,365 @@ def check_object_deletion(conf: CheckConfig, obj: type[Resource]) -> CheckResult
     )
 
 
-def check_resource_type(
-    conf: CheckConfig,
-    resource_type: ResourceType,
-) -> list[CheckResult]:
+@checker("crud")
+async def acheck_object_deletion(conf: CheckConfig, obj: type[Resource]) -> CheckResult:
+    """Perform an object deletion."""
+    await conf.client.delete(
+        obj.__class__, obj.id, expected_status_codes=conf.expected_status_codes or [204]
+    )
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Successful deletion of a {obj.__class__.__name__} object with id {obj.id}",
+    )
+
+
+def field_names_by_mutability(
+    model: type[Resource], mutabilities: tuple[Mutability, ...]
+) -> list[str]:
+    """Return the names of the model fields having one of the given mutabilities."""
+    return [
+        field_name
+        for field_name, field_plan in fill_plan(model).items()
+        if field_plan.mutability in mutabilities
+    ]
+
+
+CREATION_MUTABILITIES = (
+    Mutability.read_write,
+    Mutability.write_only,
+    Mutability.immutable,
+)
+REPLACEMENT_MUTABILITIES = (Mutability.read_write, Mutability.write_only)
+MODIFICATIONS = (
+    ("add", True),
+    ("add", False),
+    ("replace", True),
+    ("replace", False),
+    ("remove", True),
+)
+"""The PATCH operations performed by the resource checks, and whether they have a path."""
+
+
+def resource_type_tasks(
+    conf: CheckConfig, resource_type: ResourceType, prefix: str = ""
+) -> list[Task]:
+    """Build the dependency graph of the checks of a resource type.
+
+    The two read checks need a created object, and can run concurrently.
+    If the configuration has :attr:`~scim2_tester.CheckConfig.fixtures` of the resource type,
+    the read checks are performed on one of them instead, and do not wait for the creation.
+    The replacement comes after the reads, then the PATCH modifications if the server supports them,
+    and the deletion comes last.
+    Temporary objects created to fill references are deleted once all the checks are done,
+    as well as the checked object if the checks were interrupted before its deletion.
+
+    :param prefix: A string prepended to the task names, so several graphs can be merged.
+    """
+    tags = (resource_type.id,) if resource_type.id else ()
     model = model_from_resource_type(conf, resource_type)
     if not model:
         return [
-            CheckResult(
-                conf,
-                status=Status.ERROR,
-                reason=f"No Schema matching the ResourceType {resource_type.id}",
+            Task(
+                f"{prefix}model",
+                lambda: _missing_model_result(conf, resource_type),
+                checks=(check_object_creation,),
+                tags=tags,
             )
         ]
 
-    results = []
+    fixture = conf.fixtures.take(resource_type.id) if conf.fixtures else None
+    created = []
     garbages = []
-    field_names = [
-        field_name
-        for field_name in model.model_fields.keys()
-        if model.get_field_annotation(field_name, Mutability)
-        in (Mutability.read_write, Mutability.write_only, Mutability.immutable)
-    ]
-    obj, obj_garbages = fill_with_random_values(conf, model(), field_names)
-    garbages += obj_garbages
 
-    result = check_object_creation(conf, obj)
-    results.append(result)
+    def creation():
+        field_names = field_names_by_mutability(model, CREATION_MUTABILITIES)
+        obj, obj_garbages = fill_with_random_values(conf, model(), field_names)
+        garbages.extend(obj_garbages)
+        result = check_object_creation(conf, obj)
+        if result.status == Status.SUCCESS:
+            created.append(result.data)
+        return result
+
+    def replacement(creation_result):
+        field_names = field_names_by_mutability(model, REPLACEMENT_MUTABILITIES)
+        created_obj = creation_result.data
+        _, obj_garbages = fill_with_random_values(conf, created_obj, field_names)
+        garbages.extend(obj_garbages)
+        return check_object_replacement(conf, created_obj)
+
+    def modification(creation_result):
+        obj = creation_result.data
+        results = []
+        if conf.is_selected(check_object_modification, tags=tags):
+            results = [
+                check_object_modification(conf, obj, op, with_path)
+                for op, with_path in MODIFICATIONS
+            ]
+        if conf.is_selected(check_object_modification_without_target, tags=tags):
+            results.append(check_object_modification_without_target(conf, obj))
+        return results
+
+    def deletion(creation_result):
+        result = check_object_deletion(conf, creation_result.data)
+        if result.status == Status.SUCCESS:
+            created.clear()
+        return result
+
+    def cleanup():
+        # The created object is still there if the checks were interrupted
+        delete_objects(conf, created + garbages[::-1])
+        created.clear()
+        garbages.clear()
+
+    return _lifecycle_tasks(
+        prefix,
+        resource_type,
+        creation=creation,
+        query=_read(conf, check_object_query, fixture),
+        query_without_id=_read(conf, check_object_query_without_id, fixture),
+        replacement=replacement,
+        modification=modification if supports_patch(conf) else None,
+        deletion=deletion,
+        cleanup=cleanup,
+        fixture=fixture is not None,
+    )
+
 
-    if result.status == Status.SUCCESS:
-        created_obj = result.data
-        result = check_object_query(conf, created_obj)
-        results.append(result)
+def aresource_type_tasks(
+    conf: CheckConfig, resource_type: ResourceType, prefix: str = ""
+) -> list[Task]:
+    """Asynchronous version of :func:`resource_type_tasks`."""
+    tags = (resource_type.id,) if resource_type.id else ()
+    model = model_from_resource_type(conf, resource_type)
+    if not model:
 
-        result = check_object_query_without_id(conf, created_obj)
-        results.append(result)
+        async def missing_model():
+            return _missing_model_result(conf, resource_type)
 
-        field_names = [
-            field_name
-            for field_name in model.model_fields.keys()
-            if model.get_field_annotation(field_name, Mutability)
-            in (Mutability.read_write, Mutability.write_only)
+        return [
+            Task(
+                f"{prefix}model",
+                missing_model,
+                checks=(check_object_creation,),
+                tags=tags,
+            )
         ]
-        _, obj_garbages = fill_with_random_values(conf, created_obj, field_names)
-        garbages += obj_garbages
-        result = check_object_replacement(conf, created_obj)
-        results.append(result)
 
-        result = check_object_deletion(conf, created_obj)
-        results.append(result)
+    fixture = conf.fixtures.take(resource_type.id) if conf.fixtures else None
+    created = []
+    garbages = []
+
+    async def creation():
+        field_names = field_names_by_mutability(model, CREATION_MUTABILITIES)
+        obj, obj_garbages = await afill_with_random_values(conf, model(), field_names)
+        garbages.extend(obj_garbages)
+        result = await acheck_object_creation(conf, obj)
+        if result.status == Status.SUCCESS:
+            created.append(result.data)
+        return result
+
+    async def replacement(creation_result):
+        field_names = field_names_by_mutability(model, REPLACEMENT_MUTABILITIES)
+        created_obj = creation_result.data
+        _, obj_garbages = await afill_with_random_values(conf, created_obj, field_names)
+        garbages.extend(obj_garbages)
+        return await acheck_object_replacement(conf, created_obj)
+
+    async def modification(creation_result):
+        obj = creation_result.data
+        results = []
+        if conf.is_selected(check_object_modification, tags=tags):
+            results = [
+                await acheck_object_modification(conf, obj, op, with_path)
+                for op, with_path in MODIFICATIONS
+            ]
+        if conf.is_selected(check_object_modification_without_target, tags=tags):
+            results.append(await acheck_object_modification_without_target(conf, obj))
+        return results
+
+    async def deletion(creation_result):
+        result = await acheck_object_deletion(conf, creation_result.data)
+        if result.status == Status.SUCCESS:
+            created.clear()
+        return result
+
+    async def cleanup():
+        # The created object is still there if the checks were interrupted
+        await adelete_objects(conf, created + garbages[::-1])
+        created.clear()
+        garbages.clear()
+
+    return _lifecycle_tasks(
+        prefix,
+        resource_type,
+        creation=creation,
+        query=_read(conf, acheck_object_query, fixture),
+        query_without_id=_read(conf, acheck_object_query_without_id, fixture),
+        replacement=replacement,
+        modification=modification if supports_patch(conf) else None,
+        deletion=deletion,
+        cleanup=cleanup,
+        fixture=fixture is not None,
+    )
+
+
+def _read(conf: CheckConfig, check, fixture: Resource | None):
+    """Return the run callable of a read task, on the fixture if any, and else on the created object."""
+    if fixture is not None:
+        return lambda: check(conf, fixture)
+    return lambda creation_result: check(conf, creation_result.data)
+
+
+def _lifecycle_tasks(
+    prefix,
+    resource_type,
+    creation,
+    query,
+    query_without_id,
+    replacement,
+    modification,
+    deletion,
+    cleanup,
+    fixture,
+) -> list[Task]:
+    # Filling objects can create referenced objects, so writes are more expensive than reads.
+    reads = (f"{prefix}query", f"{prefix}query_without_id")
+    reads_requires = () if fixture else (f"{prefix}creation",)
+    writes: tuple[str, ...] = (f"{prefix}replacement",)
+    tags = (resource_type.id,)
+    modifications = []
+    if modification:
+        writes = (*writes, f"{prefix}modification")
+        modifications.append(
+            Task(
+                f"{prefix}modification",
+                modification,
+                requires=(f"{prefix}creation",),
+                after=(*reads, f"{prefix}replacement"),
+                cost=2,
+                checks=(
+                    check_object_modification,
+                    check_object_modification_without_target,
+                ),
+                tags=tags,
+            )
+        )
+
+    return [
+        Task(
+            f"{prefix}creation",
+            creation,
+            cost=2,
+            checks=(check_object_creation,),
+            tags=tags,
+        ),
+        Task(
+            f"{prefix}query",
+            query,
+            requires=reads_requires,
+            checks=(check_object_query,),
+            tags=tags,
+        ),
+        Task(
+            f"{prefix}query_without_id",
+            query_without_id,
+            requires=reads_requires,
+            checks=(check_object_query_without_id,),
+            tags=tags,
+        ),
+        Task(
+            f"{prefix}replacement",
+            replacement,
+            requires=(f"{prefix}creation",),
+            after=reads,
+            cost=2,
+            checks=(check_object_replacement,),
+            tags=tags,
+        ),
+        *modifications,
+        Task(
+            f"{prefix}deletion",
+            deletion,
+            requires=(f"{prefix}creation",),
+            after=(*reads, *writes),
+            checks=(check_object_deletion,),
+            tags=tags,
+        ),
+        Task(
+            f"{prefix}cleanup",
+            cleanup,
+            cleanup=True,
+            after=(
+                f"{prefix}creation",
+                *reads,
+                *writes,
+                f"{prefix}deletion",
+            ),
+        ),
+    ]
 
-    for garbage in reversed(garbages):
-        conf.client.delete(garbage)
 
-    return results
+def delete_objects(conf: CheckConfig, objs: list[Resource]) -> None:
+    """Delete temporary objects from the server, ignoring errors.
+
+    The objects of the :attr:`~scim2_tester.CheckConfig.reference_pool` are released,
+    and only deleted once they are not referenced anymore.
+    """
+    for obj in objs:
+        if conf.reference_pool is not None and not conf.reference_pool.release(obj):
+            continue
+        try:
+            conf.client.delete(obj.__class__, obj.id)
+        except SCIMClientError:
+            pass
+
+
+async def adelete_objects(conf: CheckConfig, objs: list[Resource]) -> None:
+    """Asynchronous version of :func:`delete_objects`."""
+    for obj in objs:
+        if conf.reference_pool is not None and not conf.reference_pool.release(obj):
+            continue
+        try:
+            await conf.client.delete(obj.__class__, obj.id)
+        except SCIMClientError:
+            pass
+
+
+def delete_references(conf: CheckConfig) -> None:
+    """Delete the objects of the :attr:`~scim2_tester.CheckConfig.reference_pool`, if any, ignoring errors."""
+    if conf.reference_pool is not None:
+        delete_objects(conf, conf.reference_pool.drain())
+
+
+async def adelete_references(conf: CheckConfig) -> None:
+    """Asynchronous version of :func:`delete_references`."""
+    if conf.reference_pool is not None:
+        await adelete_objects(conf, conf.reference_pool.drain())
+
+
+def _missing_model_result(
+    conf: CheckConfig, resource_type: ResourceType
+) -> CheckResult:
+    return CheckResult(
+        conf,
+        status=Status.ERROR,
+        reason=f"No Schema matching the ResourceType {resource_type.id}",
+    )
+
+
+def check_resource_type(
+    conf: CheckConfig,
+    resource_type: ResourceType,
+) -> list[CheckResult]:
+    """Perform the creation, query, replacement, modification and deletion checks of a resource type."""
+    return task_results(run_tasks(conf, resource_type_tasks(conf, resource_type)))
+
+
+async def acheck_resource_type(
+    conf: CheckConfig,
+    resource_type: ResourceType,
+) -> list[CheckResult]:
+    """Asynchronous version of :func:`check_resource_type`."""
+    values = await arun_tasks(conf, aresource_type_tasks(conf, resource_type))
+    return task_results(values)
@@ -1,8 +1,12 @@
-import uuid
+import functools
+from collections.abc import Awaitable
+from collections.abc import Callable
 
 from scim2_models import Error
 from scim2_models import ResourceType
 
+from .scheduler import amap_checks
+from .scheduler import map_checks
 from .utils import CheckConfig
 from .utils import CheckResult
 from .utils import Status
@@ -23,16 +27,52 @@ def check_resource_types_endpoint(conf: CheckConfig) -> list[CheckResult]:
     resource_types_result = check_query_all_resource_types(conf)
     results = [resource_types_result]
 
-    if resource_types_result.status == Status.SUCCESS:
-        for resource_type in resource_types_result.data:
-            results.append(check_query_resource_type_by_id(conf, resource_type))
+    resource_types = (
+        resource_types_result.data
+        if resource_types_result.status == Status.SUCCESS
+        else []
+    )
+    checks: list[Callable[[], CheckResult]] = []
+    if conf.is_selected(check_query_resource_type_by_id):
+        checks.extend(
+            functools.partial(check_query_resource_type_by_id, conf, resource_type)
+            for resource_type in resource_types
+        )
+    if conf.is_selected(check_access_invalid_resource_type):
+        checks.append(functools.partial(check_access_invalid_resource_type, conf))
+    results.extend(map_checks(conf, checks))
+
+    return results
+
+
+async def acheck_resource_types_endpoint(conf: CheckConfig) -> list[CheckResult]:
+    """Asynchronous version of :func:`check_resource_types_endpoint`.
 
-    results.append(check_access_invalid_resource_type(conf))
+    The individual `/ResourceTypes` queries and the invalid id check are performed concurrently,
+    at most :attr:`~scim2_tester.CheckConfig.max_workers` at a time.
+    """
+    resource_types_result = await acheck_query_all_resource_types(conf)
+    results = [resource_types_result]
+
+    resource_types = (
+        resource_types_result.data
+        if resource_types_result.status == Status.SUCCESS
+        else []
+    )
+    checks: list[Callable[[], Awaitable[CheckResult]]] = []
+    if conf.is_selected(acheck_query_resource_type_by_id):
+        checks.extend(
+            functools.partial(acheck_query_resource_type_by_id, conf, resource_type)
+            for resource_type in resource_types
+        )
+    if conf.is_selected(acheck_access_invalid_resource_type):
+        checks.append(functools.partial(acheck_access_invalid_resource_type, conf))
+    results.extend(await amap_checks(conf, checks))
 
     return results
 
 
-@checker
+@checker("discovery")
 def check_query_all_resource_types(conf: CheckConfig) -> CheckResult:
     response = conf.client.query(
         ResourceType, expected_status_codes=conf.expected_status_codes or [200]
@@ -44,7 +84,19 @@ def check_query_all_resource_types(conf: CheckConfig) -> CheckResult:
     )
 
 
-@checker
+@checker("discovery")
+async def acheck_query_all_resource_types(conf: CheckConfig) -> CheckResult:
+    response = await conf.client.query(
+        ResourceType, expected_status_codes=conf.expected_status_codes or [200]
+    )
+    available = ", ".join([f"'{resource.name}'" for resource in response.resources])
+    reason = f"Resource types available are: {available}"
+    return CheckResult(
+        conf, status=Status.SUCCESS, reason=reason, data=response.resources
+    )
+
+
+@checker("discovery")
 def check_query_resource_type_by_id(
     conf: CheckConfig, resource_type: ResourceType
 ) -> CheckResult:
@@ -62,9 +114,27 @@ def check_query_resource_type_by_id(
     return CheckResult(conf, status=Status.SUCCESS, reason=reason, data=response)
 
 
-@checker
+@checker("discovery")
+async def acheck_query_resource_type_by_id(
+    conf: CheckConfig, resource_type: ResourceType
+) -> CheckResult:
+    response = await conf.client.query(
+        ResourceType,
+        resource_type.id,
+        expected_status_codes=conf.expected_status_codes or [200],
+    )
+    if isinstance(response, Error):
+        return CheckResult(
+            conf, status=Status.ERROR, reason=response.detail, data=response
+        )
+
+    reason = f"Successfully accessed the /ResourceTypes/{resource_type.id} endpoint."
+    return CheckResult(conf, status=Status.SUCCESS, reason=reason, data=response)
+
+
+@checker("discovery", "negative")
 def check_access_invalid_resource_type(conf: CheckConfig) -> CheckResult:
-    probably_invalid_id = str(uuid.uuid4())
+    probably_invalid_id = str(conf.random_uuid())
     response = conf.client.query(
         ResourceType,
         probably_invalid_id,
@@ -72,6 +142,25 @@ def check_access_invalid_resource_type(conf: CheckConfig) -> CheckResult:
         raise_scim_errors=False,
     )
 
+    return _invalid_resource_type_result(conf, probably_invalid_id, response)
+
+
+@checker("discovery", "negative")
+async def acheck_access_invalid_resource_type(conf: CheckConfig) -> CheckResult:
+    probably_invalid_id = str(conf.random_uuid())
+    response = await conf.client.query(
+        ResourceType,
+        probably_invalid_id,
+        expected_status_codes=conf.expected_status_codes or [404],
+        raise_scim_errors=False,
+    )
+
+    return _invalid_resource_type_result(conf, probably_invalid_id, response)
+
+
+def _invalid_resource_type_result(
+    conf: CheckConfig, probably_invalid_id: str, response
+) -> CheckResult:
     if not isinstance(response, Error):
         return CheckResult(
             conf,
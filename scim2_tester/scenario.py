@@ -0,0 +1,222 @@
+import asyncio
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from scim2_client import SCIMClient
+from scim2_client.client import BaseAsyncSCIMClient
+from scim2_models import ResourceType
+
+from scim2_tester.load import REFERENCE_POOL_SIZE
+from scim2_tester.load import LoadReport
+from scim2_tester.load import ResourcePool
+from scim2_tester.load import check_operation
+from scim2_tester.resource import adelete_references
+from scim2_tester.resource import delete_references
+from scim2_tester.utils import CheckConfig
+from scim2_tester.utils import CheckResult
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    import tomli as tomllib
+
+
+@dataclass
+class Scenario:
+    """A weighted mix of operations performed by :func:`scenario_test`.
+
+    .. code-block:: python
+
+        Scenario(
+            mixes={
+                "User": {"query": 70, "modification": 20, "creation": 8, "deletion": 2},
+                "Group": {"query": 10},
+            }
+        )
+    """
+
+    mixes: dict[str, dict[str, float]] = field(default_factory=dict)
+    """The operation weights, indexed by resource type identifiers and by :data:`~scim2_tester.load.OPERATIONS`.
+
+    The weights are relative to every operation of the scenario, all resource types included."""
+
+    pool_size: int = 10
+    """The number of objects of each resource type created before the run, and shared by the operations."""
+
+    def __post_init__(self):
+        if not any(self.mixes.values()):
+            raise ValueError("A scenario needs at least one operation")
+
+        for operations in self.mixes.values():
+            for operation, weight in operations.items():
+                check_operation(operation)
+                if weight <= 0:
+                    raise ValueError(
+                        f"The weight of {operation} must be positive, got {weight}"
+                    )
+
+        if self.pool_size < 0:
+            raise ValueError(f"The pool size must be positive, got {self.pool_size}")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Scenario":
+        """Build a scenario from a dict with a ``mixes`` key and an optional ``pool_size`` key."""
+        unknown = set(data) - {"mixes", "pool_size"}
+        if unknown:
+            raise ValueError(f"Unknown scenario keys: {', '.join(sorted(unknown))}")
+
+        return cls(**data)
+
+    @classmethod
+    def from_toml(cls, path: str | Path) -> "Scenario":
+        """Load a scenario from a TOML file.
+
+        .. code-block:: toml
+
+            pool_size = 10
+
+            [mixes.User]
+            query = 70
+            modification = 20
+            creation = 8
+            deletion = 2
+        """
+        with open(path, "rb") as fd:
+            return cls.from_dict(tomllib.load(fd))
+
+    def draw(
+        self, count: int, random_generator: random.Random | None = None
+    ) -> list[tuple[str, str]]:
+        """Draw random ``(resource type identifier, operation)`` couples, according to the weights.
+
+        :param random_generator: The generator to draw with, like :attr:`~scim2_tester.CheckConfig.random_generator`.
+        """
+        random_generator = random_generator or random.Random()
+        population = [
+            (resource_type_id, operation)
+            for resource_type_id, operations in self.mixes.items()
+            for operation in operations
+        ]
+        weights = [
+            weight
+            for operations in self.mixes.values()
+            for weight in operations.values()
+        ]
+        return random_generator.choices(population, weights, k=count)
+
+
+def scenario_test(
+    client: SCIMClient,
+    scenario: Scenario,
+    iterations: int = 100,
+    concurrency: int = 1,
+) -> LoadReport:
+    """Perform random operations according to the weights of a scenario, and measure the latencies.
+
+    Each resource type of the scenario gets a :class:`~scim2_tester.load.ResourcePool` of
+    :attr:`Scenario.pool_size` objects, that are created before the run.
+    Queries, replacements and modifications are performed on random objects of the pool, created objects are added
+    to the pool, and deleted objects are removed from it.
+    Operations drawn while the pool is empty are not performed, and not reported.
+    The remaining objects are deleted after the run.
+
+    :param client: A configured SCIM client, for instance with :meth:`~scim2_client.SCIMClient.discover`.
+        The client must be thread-safe.
+    :param scenario: The operations weights.
+    :param iterations: The number of operations to perform.
+    :param concurrency: The number of operations performed concurrently by a pool of threads.
+    """
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    pools = _pools(conf, scenario)
+    report = LoadReport()
+
+    def perform(
+        draw: tuple[str, str],
+    ) -> tuple[tuple[str, str], CheckResult | None]:
+        resource_type_id, operation = draw
+        return draw, pools[resource_type_id].perform(operation)
+
+    try:
+        for pool in pools.values():
+            pool.prepare(scenario.pool_size)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for draw, result in executor.map(
+                perform, scenario.draw(iterations, conf.random_generator)
+            ):
+                _record(report, draw, result)
+
+        report.finish(time.perf_counter() - start)
+
+    finally:
+        for pool in pools.values():
+            pool.cleanup()
+        delete_references(conf)
+
+    return report
+
+
+async def ascenario_test(
+    client: BaseAsyncSCIMClient,
+    scenario: Scenario,
+    iterations: int = 100,
+    concurrency: int = 1,
+) -> LoadReport:
+    """Asynchronous version of :func:`scenario_test`.
+
+    :param concurrency: The number of operations performed concurrently.
+    """
+    conf = CheckConfig(client, reference_pool_size=REFERENCE_POOL_SIZE)
+    pools = _pools(conf, scenario)
+    report = LoadReport()
+
+    async def worker(draws) -> None:
+        for draw in draws:
+            resource_type_id, operation = draw
+            _record(report, draw, await pools[resource_type_id].aperform(operation))
+
+    try:
+        for pool in pools.values():
+            await pool.aprepare(scenario.pool_size)
+
+        start = time.perf_counter()
+        draws = iter(scenario.draw(iterations, conf.random_generator))
+        await asyncio.gather(*(worker(draws) for _ in range(concurrency)))
+        report.finish(time.perf_counter() - start)
+
+    finally:
+        for pool in pools.values():
+            await pool.acleanup()
+        await adelete_references(conf)
+
+    return report
+
+
+def _pools(conf: CheckConfig, scenario: Scenario) -> dict[str, ResourcePool]:
+    resource_types: dict[str, ResourceType] = {
+        resource_type.id: resource_type
+        for resource_type in conf.client.resource_types or []
+        if resource_type.id is not None
+    }
+    pools = {}
+    for resource_type_id in scenario.mixes:
+        if resource_type_id not in resource_types:
+            raise ValueError(f"Unknown resource type {resource_type_id}")
+
+        pools[resource_type_id] = ResourcePool(conf, resource_types[resource_type_id])
+    return pools
+
+
+def _record(
+    report: LoadReport, draw: tuple[str, str], result: CheckResult | None
+) -> None:
+    if result is not None:
+        resource_type_id, operation = draw
+        report.record(f"{resource_type_id}.{operation}", result)
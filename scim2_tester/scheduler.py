@@ -0,0 +1,465 @@
+import asyncio
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Generator
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from typing import Any
+
+from scim2_tester.utils import CheckConfig
+from scim2_tester.utils import CheckResult
+from scim2_tester.utils import Status
+
+
+@dataclass
+class Task:
+    """A node of a check dependency graph."""
+
+    name: str
+    """The unique name of the task in its graph."""
+
+    run: Callable[..., Any]
+    """The callable performing the task.
+
+    It is called with the return values of the :attr:`requires` tasks as positional arguments,
+    and returns a :class:`~scim2_tester.CheckResult`, a list of :class:`~scim2_tester.CheckResult`
+    or :data:`None`. In asynchronous graphs, it returns an awaitable.
+    """
+
+    requires: tuple[str, ...] = ()
+    """The tasks that must have succeeded before this task can run.
+
+    If one of them fails or is skipped, this task is skipped too.
+    """
+
+    after: tuple[str, ...] = ()
+    """The tasks that must be finished before this task can run, whatever their outcome."""
+
+    cleanup: bool = False
+    """Whether the task must run even when the run is stopped.
+
+    This is intended for tasks deleting temporary objects. Cleanup tasks cannot
+    require other tasks, and are run after the other tasks when the run is
+    stopped by :attr:`~scim2_tester.CheckConfig.fail_fast`, by an exception, or
+    because the iteration on the results has been interrupted.
+    They are not limited by the :attr:`~scim2_tester.CheckConfig.time_budget`.
+    """
+
+    cost: float = 1
+    """The estimated cost of the task, in number of requests.
+
+    With a :attr:`~scim2_tester.CheckConfig.time_budget`, the cheapest ready tasks are run first,
+    and a task is skipped when its cost is not expected to fit in the remaining time.
+    """
+
+    priority: int = 0
+    """Among the ready tasks, the ones with the highest priority are run first."""
+
+    checks: tuple[Callable, ...] = ()
+    """The checker functions the task performs.
+
+    The task is skipped if none of them is selected by :meth:`~scim2_tester.CheckConfig.is_selected`,
+    unless a selected task requires it. Tasks without checks are always run.
+    """
+
+    tags: tuple[str, ...] = ()
+    """Tags of the task checks, in addition to the ones they are registered with."""
+
+
+def is_failure(value: Any) -> bool:
+    """Indicate whether a task return value is a failure.
+
+    When a task returns a list of results, the first one is the main result and decides for the whole list.
+    """
+    if isinstance(value, CheckResult):
+        return value.status == Status.ERROR
+
+    if isinstance(value, list) and value:
+        return is_failure(value[0])
+
+    return False
+
+
+def value_results(value: Any) -> list[CheckResult]:
+    """Return the results of a task return value."""
+    if isinstance(value, CheckResult):
+        return [value]
+    return list(value or [])
+
+
+def task_results(values: dict[str, Any]) -> list[CheckResult]:
+    """Flatten task return values in a list of results."""
+    return [result for value in values.values() for result in value_results(value)]
+
+
+def map_checks(conf: CheckConfig, checks: Sequence[Callable[[], Any]]) -> list[Any]:
+    """Run independent checks with at most :attr:`~scim2_tester.CheckConfig.max_workers` concurrent threads.
+
+    Without :attr:`~scim2_tester.CheckConfig.max_workers`, the checks are run sequentially.
+    The return values are in the order of the checks.
+    """
+    if not conf.max_workers:
+        return [check() for check in checks]
+
+    with ThreadPoolExecutor(max_workers=conf.max_workers) as executor:
+        return list(executor.map(lambda check: check(), checks))
+
+
+async def amap_checks(
+    conf: CheckConfig, checks: Sequence[Callable[[], Awaitable[Any]]]
+) -> list[Any]:
+    """Asynchronous version of :func:`map_checks`.
+
+    At most :attr:`~scim2_tester.CheckConfig.max_workers` checks are awaited concurrently.
+    Without :attr:`~scim2_tester.CheckConfig.max_workers`, all the checks are awaited concurrently.
+    """
+    if not conf.max_workers:
+        return await asyncio.gather(*(check() for check in checks))
+
+    semaphore = asyncio.Semaphore(conf.max_workers)
+
+    async def bounded(check):
+        async with semaphore:
+            return await check()
+
+    return await asyncio.gather(*(bounded(check) for check in checks))
+
+
+def check_graph(tasks: list[Task]) -> None:
+    """Check that the task dependencies are declared before the tasks that need them.
+
+    This guarantees the graph has no cycle, and that running the tasks in their declaration order is valid.
+    """
+    names: set[str] = set()
+    for task in tasks:
+        if task.name in names:
+            raise ValueError(f"Task {task.name} is declared several times")
+
+        if task.cleanup and task.requires:
+            raise ValueError(f"Cleanup task {task.name} cannot require other tasks")
+
+        for dependency in task.requires + task.after:
+            if dependency not in names:
+                raise ValueError(
+                    f"Task {task.name} depends on {dependency} that is not declared before"
+                )
+
+        names.add(task.name)
+
+
+class _GraphState:
+    """Bookkeeping of a running task graph.
+
+    The return value of a task is forgotten as soon as it has been yielded and
+    no pending task requires it anymore, so long runs keep a flat memory usage.
+    """
+
+    def __init__(self, conf: CheckConfig, tasks: list[Task]):
+        check_graph(tasks)
+        self.conf = conf
+        self.tasks = tasks
+        self.values: dict[str, Any] = {}
+        self.finished: set[str] = set()
+        self.failed: set[str] = set()
+        self.skipped: set[str] = set()
+        self.yielded: set[str] = set()
+        self.late: set[str] = set()
+        self.dependents = Counter(name for task in tasks for name in task.requires)
+        self.indexes = {task.name: index for index, task in enumerate(tasks)}
+        self.selected = self.select()
+        self.started: dict[str, float] = {}
+        self.spent_time = 0.0
+        self.spent_cost = 0.0
+
+    def is_ready(self, task: Task) -> bool:
+        return all(name in self.finished for name in task.requires + task.after)
+
+    def select(self) -> set[str]:
+        """Return the names of the tasks performing selected checks, and of the tasks they require."""
+        selected: set[str] = set()
+        required: set[str] = set()
+        for task in reversed(self.tasks):
+            if (
+                task.name in required
+                or not task.checks
+                or any(self.conf.is_selected(check, task.tags) for check in task.checks)
+            ):
+                selected.add(task.name)
+                required.update(task.requires)
+        return selected
+
+    def rank(self, task: Task) -> tuple:
+        """Sort key of the ready tasks, the first ones being run first."""
+        cost = task.cost if self.conf.deadline is not None else 0
+        return -task.priority, cost, self.indexes[task.name]
+
+    def should_skip(self, task: Task) -> bool:
+        if task.name not in self.selected:
+            return True
+
+        if task.cleanup:
+            return False
+
+        return (
+            self.conf.is_stopped()
+            or self.is_late(task)
+            or any(
+                name in self.skipped or name in self.failed for name in task.requires
+            )
+        )
+
+    def is_late(self, task: Task) -> bool:
+        """Indicate whether the task does not fit in the remaining time budget, or requires such a task."""
+        if task.cleanup:
+            return False
+
+        return any(name in self.late for name in task.requires) or not self.fits(task)
+
+    def fits(self, task: Task) -> bool:
+        """Estimate whether the task can be performed in the remaining time budget.
+
+        The duration of a task is estimated from its cost and the mean duration per cost unit of the finished tasks.
+        """
+        remaining = self.conf.remaining_time()
+        if remaining is None:
+            return True
+
+        if remaining <= 0:
+            return False
+
+        return (
+            not self.spent_cost
+            or task.cost * self.spent_time / self.spent_cost <= remaining
+        )
+
+    def arguments(self, task: Task) -> list[Any]:
+        return [self.values[name] for name in task.requires]
+
+    def skip(self, task: Task) -> None:
+        # Tasks skipped for lack of time are reported, the other ones are silently omitted.
+        if task.name in self.selected and self.is_late(task):
+            self.late.add(task.name)
+            self.values[task.name] = CheckResult(
+                self.conf,
+                status=Status.SKIPPED,
+                title=task.name,
+                reason="Not enough time left in the time budget",
+            )
+        self.skipped.add(task.name)
+        self.finished.add(task.name)
+        self.release(task)
+
+    def start(self, task: Task) -> None:
+        self.started[task.name] = time.monotonic()
+        if task.cleanup:
+            self.conf.reset_request_timeout()
+        else:
+            self.conf.bound_request_timeout()
+
+    def finish(self, task: Task, value: Any) -> None:
+        if task.name in self.started and not task.cleanup:
+            self.spent_time += time.monotonic() - self.started.pop(task.name)
+            self.spent_cost += task.cost
+        self.values[task.name] = value
+        if is_failure(value):
+            self.failed.add(task.name)
+        self.conf.failures += sum(
+            result.status == Status.ERROR for result in value_results(value)
+        )
+        self.finished.add(task.name)
+        self.release(task)
+
+    def release(self, task: Task) -> None:
+        for name in task.requires:
+            self.dependents[name] -= 1
+            self.forget(name)
+
+    def forget(self, name: str) -> None:
+        if name in self.yielded and not self.dependents[name]:
+            self.values.pop(name, None)
+
+    def pop(self, task: Task) -> tuple[str, Any]:
+        value = self.values[task.name]
+        self.yielded.add(task.name)
+        self.forget(task.name)
+        return task.name, value
+
+    def flush(self, index: int) -> Generator[tuple[str, Any], None, int]:
+        """Yield the finished tasks from index, until a task is not finished.
+
+        Return the index of the first unfinished task.
+        """
+        while index < len(self.tasks) and self.tasks[index].name in self.finished:
+            if self.tasks[index].name in self.values:
+                yield self.pop(self.tasks[index])
+            index += 1
+        return index
+
+    def cleanup(self) -> None:
+        """Run the cleanup tasks that did not run yet."""
+        for task in self.tasks:
+            if task.cleanup and task.name not in self.finished:
+                self.start(task)
+                self.finish(task, task.run())
+
+
+def iter_tasks(conf: CheckConfig, tasks: list[Task]) -> Iterator[tuple[str, Any]]:
+    """Run a task graph with as many concurrent tasks as allowed by :attr:`~scim2_tester.CheckConfig.max_workers`.
+
+    Tasks are run as soon as their dependencies are finished, ordered by :attr:`Task.priority`,
+    and by :attr:`Task.cost` with a :attr:`~scim2_tester.CheckConfig.time_budget`.
+    Without :attr:`~scim2_tester.CheckConfig.max_workers`, the tasks are run sequentially.
+
+    Yield the task names and return values in the declaration order, as soon as a task
+    and all the tasks declared before it are finished. Skipped tasks are not yielded,
+    unless they are skipped for lack of time: a :attr:`~scim2_tester.Status.SKIPPED` result is yielded then.
+    If the iteration is stopped early, the tasks that are not started yet are cancelled.
+    In any case, the cleanup tasks are run.
+    """
+    state = _GraphState(conf, tasks)
+    pending = list(tasks)
+    flushed = 0
+
+    if not conf.max_workers:
+        try:
+            while pending:
+                task = min(
+                    (task for task in pending if state.is_ready(task)), key=state.rank
+                )
+                pending.remove(task)
+                if state.should_skip(task):
+                    state.skip(task)
+                else:
+                    state.start(task)
+                    state.finish(task, task.run(*state.arguments(task)))
+
+                flushed = yield from state.flush(flushed)
+
+        finally:
+            state.cleanup()
+        return
+
+    running: dict[Future, Task] = {}
+    executor = ThreadPoolExecutor(max_workers=conf.max_workers)
+    try:
+        while pending or running:
+            if conf.is_stopped():
+                for future in [future for future in running if future.cancel()]:
+                    state.skip(running.pop(future))
+
+            ready = [task for task in pending if state.is_ready(task)]
+            for task in sorted(ready, key=state.rank):
+                pending.remove(task)
+                if state.should_skip(task):
+                    state.skip(task)
+                else:
+                    state.start(task)
+                    future = executor.submit(task.run, *state.arguments(task))
+                    running[future] = task
+
+            if running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    state.finish(running.pop(future), future.result())
+
+            flushed = yield from state.flush(flushed)
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        state.finished.update(
+            task.name for future, task in running.items() if not future.cancelled()
+        )
+        state.cleanup()
+
+
+def run_tasks(conf: CheckConfig, tasks: list[Task]) -> dict[str, Any]:
+    """Run a task graph with :func:`iter_tasks` and return the task return values indexed by task names."""
+    return dict(iter_tasks(conf, tasks))
+
+
+async def aiter_tasks(
+    conf: CheckConfig, tasks: list[Task]
+) -> AsyncIterator[tuple[str, Any]]:
+    """Asynchronous version of :func:`iter_tasks`.
+
+    Every task is started as soon as its dependencies are finished, so all independent tasks run concurrently.
+    When the run is stopped, the tasks that are not started yet are cancelled, the started ones are awaited
+    so the objects they create are cleaned up, and the cleanup tasks are run.
+    """
+    state = _GraphState(conf, tasks)
+    by_name = {task.name: task for task in tasks}
+    futures: dict[str, asyncio.Future] = {}
+
+    def stop() -> None:
+        for task in tasks:
+            future = futures[task.name]
+            if (
+                not task.cleanup
+                and task.name not in state.started
+                and future is not asyncio.current_task()
+            ):
+                future.cancel()
+
+    def settle(task: Task) -> None:
+        # Tasks cancelled before they started never reached their own bookkeeping.
+        if futures[task.name].cancelled() and task.name not in state.finished:
+            state.skip(task)
+
+    async def run(task: Task) -> None:
+        try:
+            dependencies = [futures[name] for name in task.requires + task.after]
+            if dependencies:
+                await asyncio.wait(dependencies)
+
+            for name in task.requires + task.after:
+                settle(by_name[name])
+
+            if state.should_skip(task):
+                state.skip(task)
+                return
+
+            state.start(task)
+            state.finish(task, await task.run(*state.arguments(task)))
+
+        except asyncio.CancelledError:
+            state.skip(task)
+            raise
+
+        except Exception:
+            state.skip(task)
+            stop()
+            raise
+
+        if conf.is_stopped():
+            stop()
+
+    for task in tasks:
+        futures[task.name] = asyncio.ensure_future(run(task))
+
+    try:
+        for task in tasks:
+            future = futures[task.name]
+            await asyncio.wait([future])
+            settle(task)
+            if not future.cancelled() and (exception := future.exception()):
+                raise exception
+
+            if task.name in state.values:
+                yield state.pop(task)
+
+    finally:
+        stop()
+        await asyncio.gather(*futures.values(), return_exceptions=True)
+
+
+async def arun_tasks(conf: CheckConfig, tasks: list[Task]) -> dict[str, Any]:
+    """Asynchronous version of :func:`run_tasks`."""
+    return {name: value async for name, value in aiter_tasks(conf, tasks)}
@@ -1,8 +1,12 @@
-import uuid
+import functools
+from collections.abc import Awaitable
+from collections.abc import Callable
 
 from scim2_models import Error
 from scim2_models import Schema
 
+from .scheduler import amap_checks
+from .scheduler import map_checks
 from .utils import CheckConfig
 from .utils import CheckResult
 from .utils import Status
@@ -23,16 +27,44 @@ def check_schemas_endpoint(conf: CheckConfig) -> list[CheckResult]:
     schemas_result = check_query_all_schemas(conf)
     results = [schemas_result]
 
-    if schemas_result.status == Status.SUCCESS:
-        for resource_type in schemas_result.data:
-            results.append(check_query_schema_by_id(conf, resource_type))
+    schemas = schemas_result.data if schemas_result.status == Status.SUCCESS else []
+    checks: list[Callable[[], CheckResult]] = []
+    if conf.is_selected(check_query_schema_by_id):
+        checks.extend(
+            functools.partial(check_query_schema_by_id, conf, schema)
+            for schema in schemas
+        )
+    if conf.is_selected(check_access_invalid_schema):
+        checks.append(functools.partial(check_access_invalid_schema, conf))
+    results.extend(map_checks(conf, checks))
+
+    return results
 
-    results.append(check_access_invalid_schema(conf))
+
+async def acheck_schemas_endpoint(conf: CheckConfig) -> list[CheckResult]:
+    """Asynchronous version of :func:`check_schemas_endpoint`.
+
+    The individual `/Schemas` queries and the invalid id check are performed concurrently,
+    at most :attr:`~scim2_tester.CheckConfig.max_workers` at a time.
+    """
+    schemas_result = await acheck_query_all_schemas(conf)
+    results = [schemas_result]
+
+    schemas = schemas_result.data if schemas_result.status == Status.SUCCESS else []
+    checks: list[Callable[[], Awaitable[CheckResult]]] = []
+    if conf.is_selected(acheck_query_schema_by_id):
+        checks.extend(
+            functools.partial(acheck_query_schema_by_id, conf, schema)
+            for schema in schemas
+        )
+    if conf.is_selected(acheck_access_invalid_schema):
+        checks.append(functools.partial(acheck_access_invalid_schema, conf))
+    results.extend(await amap_checks(conf, checks))
 
     return results
 
 
-@checker
+@checker("discovery")
 def check_query_all_schemas(conf: CheckConfig) -> CheckResult:
     response = conf.client.query(
         Schema, expected_status_codes=conf.expected_status_codes or [200]
@@ -46,7 +78,21 @@ def check_query_all_schemas(conf: CheckConfig) -> CheckResult:
     )
 
 
-@checker
+@checker("discovery")
+async def acheck_query_all_schemas(conf: CheckConfig) -> CheckResult:
+    response = await conf.client.query(
+        Schema, expected_status_codes=conf.expected_status_codes or [200]
+    )
+    available = ", ".join([f"'{resource.name}'" for resource in response.resources])
+    return CheckResult(
+        conf,
+        status=Status.SUCCESS,
+        reason=f"Schemas available are: {available}",
+        data=response.resources,
+    )
+
+
+@checker("discovery")
 def check_query_schema_by_id(conf: CheckConfig, schema: Schema) -> CheckResult:
     response = conf.client.query(
         Schema,
@@ -62,9 +108,25 @@ def check_query_schema_by_id(conf: CheckConfig, schema: Schema) -> CheckResult:
     return CheckResult(conf, status=Status.SUCCESS, reason=reason, data=response)
 
 
-@checker
+@checker("discovery")
+async def acheck_query_schema_by_id(conf: CheckConfig, schema: Schema) -> CheckResult:
+    response = await conf.client.query(
+        Schema,
+        schema.id,
+        expected_status_codes=conf.expected_status_codes or [200],
+    )
+    if isinstance(response, Error):
+        return CheckResult(
+            conf, status=Status.ERROR, reason=response.detail, data=response
+        )
+
+    reason = f"Successfully accessed the /Schemas/{schema.id} endpoint."
+    return CheckResult(conf, status=Status.SUCCESS, reason=reason, data=response)
+
+
+@checker("discovery", "negative")
 def check_access_invalid_schema(conf: CheckConfig) -> CheckResult:
-    probably_invalid_id = str(uuid.uuid4())
+    probably_invalid_id = str(conf.random_uuid())
     response = conf.client.query(
         Schema,
         probably_invalid_id,
@@ -72,6 +134,25 @@ def check_access_invalid_schema(conf: CheckConfig) -> CheckResult:
         raise_scim_errors=False,
     )
 
+    return _invalid_schema_result(conf, probably_invalid_id, response)
+
+
+@checker("discovery", "negative")
+async def acheck_access_invalid_schema(conf: CheckConfig) -> CheckResult:
+    probably_invalid_id = str(conf.random_uuid())
+    response = await conf.client.query(
+        Schema,
+        probably_invalid_id,
+        expected_status_codes=conf.expected_status_codes or [404],
+        raise_scim_errors=False,
+    )
+
+    return _invalid_schema_result(conf, probably_invalid_id, response)
+
+
+def _invalid_schema_result(
+    conf: CheckConfig, probably_invalid_id: str, response
+) -> CheckResult:
     if not isinstance(response, Error):
         return CheckResult(
             conf,
@@ -6,7 +6,7 @@ from .utils import Status
 from .utils import checker
 
 
-@checker
+@checker("discovery")
 def check_service_provider_config_endpoint(
     conf: CheckConfig,
 ) -> CheckResult:
@@ -20,3 +20,14 @@ def check_service_provider_config_endpoint(
         ServiceProviderConfig, expected_status_codes=conf.expected_status_codes or [200]
     )
     return CheckResult(conf, status=Status.SUCCESS, data=response)
+
+
+@checker("discovery")
+async def acheck_service_provider_config_endpoint(
+    conf: CheckConfig,
+) -> CheckResult:
+    """Asynchronous version of :func:`check_service_provider_config_endpoint`."""
+    response = await conf.client.query(
+        ServiceProviderConfig, expected_status_codes=conf.expected_status_codes or [200]
+    )
+    return CheckResult(conf, status=Status.SUCCESS, data=response)
@@ -1,24 +1,150 @@
+import datetime
 import functools
+import inspect
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from collections import defaultdict
+from contextvars import ContextVar
 from dataclasses import dataclass
+from dataclasses import field
 from enum import Enum
 from enum import auto
+from typing import TYPE_CHECKING
 from typing import Any
 
+from scim2_client import RequestNetworkError
 from scim2_client import SCIMClient
 from scim2_client import SCIMClientError
+from scim2_models import Resource
+
+HTTPTransportError: tuple[type[Exception], ...]
+try:
+    from httpx import RequestError
+
+    HTTPTransportError = (RequestError,)
+except ImportError:  # pragma: no cover
+    # Without httpx, there is no transport error to convert
+    HTTPTransportError = ()
+
+if TYPE_CHECKING:
+    from scim2_tester.fixtures import FixturePool
 
 
 class Status(Enum):
     SUCCESS = auto()
     ERROR = auto()
+    SKIPPED = auto()
+
+
+class ReferencePool:
+    """Objects shared by the references of the generated objects.
+
+    Instead of creating a new object for every reference attribute, like group members,
+    up to :attr:`size` objects of every referenced model are created and handed out in turn.
+    References are counted: every object returned by :meth:`take` or given to :meth:`add`
+    is handed back with :meth:`release` when the referencing object is deleted. The objects
+    are deleted at the end of the run by :meth:`drain`, or by their last :meth:`release`
+    if they are still referenced then, for instance by the tasks of other workers.
+
+    :param size: The number of objects of every referenced model.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.objects: dict[type[Resource], list[Resource]] = defaultdict(list)
+        self.garbages: list[Resource] = []
+        self._pending: Counter[type[Resource]] = Counter()
+        self._turns: Counter[type[Resource]] = Counter()
+        self._uses: Counter[tuple[type[Resource], str | None]] = Counter()
+        self._drained: set[tuple[type[Resource], str | None]] = set()
+        self._lock = threading.Lock()
+
+    def take(self, model: type[Resource]) -> Resource | None:
+        """Return the next object of a model to reference.
+
+        Return :data:`None` if the pool is not full yet, in which case the caller
+        creates an object and gives it to the pool with :meth:`add`.
+        """
+        with self._lock:
+            objs = self.objects[model]
+            if len(objs) + self._pending[model] < self.size or not objs:
+                self._pending[model] += 1
+                return None
+
+            obj = objs[self._turns[model] % len(objs)]
+            self._turns[model] += 1
+            self._uses[model, obj.id] += 1
+            return obj
+
+    def add(
+        self, model: type[Resource], obj: Resource, garbages: list[Resource]
+    ) -> None:
+        """Add an object created after :meth:`take` returned :data:`None`.
+
+        :param garbages: The objects created along with ``obj``, deleted with it.
+        """
+        with self._lock:
+            self._pending[model] = max(self._pending[model] - 1, 0)
+            self.objects[model].append(obj)
+            self.garbages.extend(garbages)
+            self._uses[model, obj.id] += 1
+
+    def release(self, obj: Resource) -> bool:
+        """Hand back a reference to an object, and return whether the object can be deleted.
+
+        Objects that are not in the pool can always be deleted. Pooled objects can be
+        deleted once they are not referenced anymore and the pool has been drained.
+        """
+        key = (obj.__class__, obj.id)
+        with self._lock:
+            if key not in self._uses:
+                return True
+
+            self._uses[key] -= 1
+            if self._uses[key] > 0:
+                return False
+
+            del self._uses[key]
+            if key not in self._drained:
+                return False
+            self._drained.remove(key)
+            return True
+
+    def drain(self) -> list[Resource]:
+        """Empty the pool, and return the objects that can be deleted, in the order they can be deleted.
+
+        The objects still referenced are left to their last :meth:`release`.
+        """
+        with self._lock:
+            objs = []
+            for model_objs in self.objects.values():
+                for obj in model_objs:
+                    key = (obj.__class__, obj.id)
+                    if key in self._uses:
+                        self._drained.add(key)
+                    else:
+                        objs.append(obj)
+            objs += self.garbages[::-1]
+            self.objects.clear()
+            self.garbages = []
+            self._turns.clear()
+            return objs
 
 
 @dataclass
 class CheckConfig:
     """Object used to configure the checks behavior."""
 
-    client: SCIMClient
-    """The SCIM client that will be used to perform the requests."""
+    client: Any
+    """The SCIM client that will be used to perform the requests.
+
+    A synchronous :class:`~scim2_client.SCIMClient` for :func:`~scim2_tester.check_server`,
+    or a :class:`~scim2_client.client.BaseAsyncSCIMClient` for :func:`~scim2_tester.acheck_server`.
+    """
 
     raise_exceptions: bool = False
     """Whether to raise exceptions or store them in a :class:`~scim2_tester.Result` object."""
@@ -26,6 +152,137 @@ class CheckConfig:
     expected_status_codes: list[int] | None = None
     """The expected response status codes."""
 
+    max_workers: int | None = None
+    """The number of threads used to perform independent checks concurrently.
+
+    If :data:`None`, the checks are performed sequentially.
+    With asynchronous clients, this bounds the number of concurrent individual
+    :class:`~scim2_models.Schema` and :class:`~scim2_models.ResourceType` queries.
+    """
+
+    fail_fast: int | None = None
+    """Stop performing new checks once this number of checks have failed.
+
+    Checks that are not started yet are cancelled, as well as checks being performed
+    with asynchronous clients. The temporary objects created on the server are still deleted.
+    If :data:`None`, all the checks are performed whatever the failures.
+    """
+
+    time_budget: float | None = None
+    """The number of seconds the checks are allowed to last.
+
+    Checks that are not expected to finish within the remaining time are skipped,
+    and the timeout of the requests is bounded by the remaining time.
+    If :data:`None`, the checks are not limited in time.
+    """
+
+    failures: int = field(default=0, init=False, repr=False)
+    """The number of failed checks reported so far."""
+
+    deadline: float | None = field(default=None, init=False, repr=False)
+    """The :func:`time.monotonic` time at which the :attr:`time_budget` is exhausted."""
+
+    include: list[str] | None = None
+    """The names and tags of the checks to perform.
+
+    A check is performed if its name or one of its tags is listed, as well as the checks it depends on.
+    Tags are the ones registered in :data:`CHECKS`, and the resource type ids for the resource checks.
+    If :data:`None`, all the checks are performed.
+    """
+
+    exclude: list[str] | None = None
+    """The names and tags of the checks not to perform.
+
+    Exclusions take precedence over :attr:`include`.
+    """
+
+    seed: int | None = None
+    """The seed of the random values the objects are filled with, so runs can be reproduced.
+
+    The values are reproducible when the checks are performed sequentially.
+    If :data:`None`, the values differ at every run.
+    """
+
+    random_generator: random.Random = field(
+        default_factory=random.Random, init=False, repr=False
+    )
+    """The random generator seeded with :attr:`seed`."""
+
+    reference_pool_size: int | None = None
+    """The number of objects of every model shared by the references of the generated objects.
+
+    The objects are stored in the :attr:`reference_pool`, and deleted at the end of the run
+    once no referencing object is left.
+    If :data:`None`, a new object is created for every reference, and deleted with the referencing object.
+    """
+
+    reference_pool: ReferencePool | None = field(default=None, init=False, repr=False)
+    """The pool of referenced objects, if :attr:`reference_pool_size` is set."""
+
+    fixtures: "FixturePool | None" = None
+    """Provisioned objects the read checks are performed on, instead of the objects created by the checks.
+
+    If :data:`None`, the read checks are performed on the created objects.
+    """
+
+    initial_timeout: Any = field(default=None, init=False, repr=False)
+    """The client requests timeout before it was bounded by the :attr:`time_budget`."""
+
+    def __post_init__(self):
+        self.random_generator.seed(self.seed)
+        if self.reference_pool_size is not None:
+            self.reference_pool = ReferencePool(self.reference_pool_size)
+
+        if self.time_budget is not None:
+            self.deadline = time.monotonic() + self.time_budget
+            self.initial_timeout = getattr(self.http_client(), "timeout", None)
+
+    def is_stopped(self) -> bool:
+        """Whether no new check should be started, according to :attr:`fail_fast`."""
+        return self.fail_fast is not None and self.failures >= self.fail_fast
+
+    def is_selected(self, check, tags: tuple[str, ...] = ()) -> bool:
+        """Indicate whether a check should be performed according to :attr:`include` and :attr:`exclude`.
+
+        :param check: The checker function.
+        :param tags: Tags to consider in addition to the ones the check is registered with.
+        """
+        title = check_title(check)
+        names = {title, *CHECKS.get(title, ()), *tags}
+        if self.include is not None and not names.intersection(self.include):
+            return False
+
+        return not names.intersection(self.exclude or ())
+
+    def random_uuid(self) -> uuid.UUID:
+        """Return a random UUID drawn from the :attr:`random_generator`, so it is reproduced with the :attr:`seed`."""
+        return uuid.UUID(int=self.random_generator.getrandbits(128), version=4)
+
+    def remaining_time(self) -> float | None:
+        """Return the number of seconds left in the :attr:`time_budget`, or :data:`None` without budget."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def http_client(self) -> Any:
+        """Return the HTTP client wrapped by the SCIM client, if any."""
+        return getattr(self.client, "client", None)
+
+    def bound_request_timeout(self) -> None:
+        """Bound the client requests timeout to the remaining :attr:`time_budget`.
+
+        This only has effect on SCIM clients wrapping a HTTP client with a ``timeout`` attribute,
+        like :class:`httpx.Client` and :class:`httpx.AsyncClient`.
+        """
+        remaining = self.remaining_time()
+        if remaining is not None and hasattr(self.http_client(), "timeout"):
+            self.http_client().timeout = max(remaining, 0)
+
+    def reset_request_timeout(self) -> None:
+        """Restore the client requests timeout as it was before being bounded."""
+        if self.deadline is not None and hasattr(self.http_client(), "timeout"):
+            self.http_client().timeout = self.initial_timeout
+
 
 class SCIMTesterError(Exception):
     """Exception raised when a check failed and the `raise_exceptions` config parameter is :data:`True`."""
@@ -58,38 +315,392 @@ class CheckResult:
     data: Any | None = None
     """Any related data that can help to debug."""
 
+    start: datetime.datetime | None = None
+    """When the check started."""
+
+    duration: float | None = None
+    """How long the check lasted, in seconds."""
+
+    requests: int = 0
+    """The number of requests performed by the check."""
+
+    bytes_sent: int = 0
+    """The size of the request bodies sent by the check, in bytes."""
+
+    bytes_received: int = 0
+    """The size of the response bodies received by the check, in bytes."""
+
+    validation_time: float = 0
+    """The time spent validating the responses, in seconds."""
+
+    status_codes: list[int] = field(default_factory=list)
+    """The HTTP status codes of the responses received by the check."""
+
     def __post_init__(self):
         if self.conf.raise_exceptions and self.status == Status.ERROR:
             raise SCIMTesterError(self.reason, self)
 
 
-def checker(func):
+@dataclass
+class Accounting:
+    """The requests performed during a check."""
+
+    requests: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    validation_time: float = 0
+    status_codes: list[int] = field(default_factory=list)
+
+
+current_accounting: ContextVar[Accounting | None] = ContextVar(
+    "current_accounting", default=None
+)
+"""The accounting of the check running in the current thread or asynchronous task."""
+
+_INSTRUMENTED_REQUESTS = (
+    "prepare_create_request",
+    "prepare_query_request",
+    "prepare_search_request",
+    "prepare_delete_request",
+    "prepare_replace_request",
+)
+
+_instrumentation_lock = threading.Lock()
+
+
+@dataclass
+class _Instrumentation:
+    """The instrumentation of a client, shared by the checks running with it."""
+
+    originals: dict[str, Any]
+    """The client instance attributes replaced by the instrumentation, if the client had any."""
+
+    users: int = 1
+    """The number of running checks using the client."""
+
+
+_instrumentations: dict[int, _Instrumentation] = {}
+"""The instrumentations of the clients running checks, indexed by client ids."""
+
+
+def instrument_client(client: SCIMClient) -> None:
+    """Make a SCIM client report its requests to the :data:`current_accounting`, until :func:`release_client`.
+
+    The client request preparation and response validation methods are wrapped,
+    which works with every engine. Outside of checks, the client behavior is unchanged.
+    The body sizes are measured from the JSON payloads, and from the ``Content-Length`` response header when available.
+
+    Calls are counted, so concurrent checks can share the client: the original methods are restored
+    once :func:`release_client` has been called as many times.
+    """
+    with _instrumentation_lock:
+        instrumentation = _instrumentations.get(id(client))
+        if instrumentation is not None:
+            instrumentation.users += 1
+            return
+
+        methods = {
+            name: _counting_requests(getattr(client, name))
+            for name in _INSTRUMENTED_REQUESTS
+        }
+        methods["check_response"] = _timing_validation(client.check_response)
+        _instrumentations[id(client)] = _Instrumentation(
+            {name: vars(client)[name] for name in methods if name in vars(client)}
+        )
+        for name, method in methods.items():
+            setattr(client, name, method)
+
+
+def release_client(client: SCIMClient) -> None:
+    """Undo a :func:`instrument_client` call, and restore the client methods after the last one."""
+    with _instrumentation_lock:
+        instrumentation = _instrumentations[id(client)]
+        instrumentation.users -= 1
+        if instrumentation.users:
+            return
+
+        del _instrumentations[id(client)]
+        for name in (*_INSTRUMENTED_REQUESTS, "check_response"):
+            if name in instrumentation.originals:
+                setattr(client, name, instrumentation.originals[name])
+            else:
+                delattr(client, name)
+
+
+def record_request(payload: Any = None) -> None:
+    """Report a request to the :data:`current_accounting`.
+
+    This is done by :func:`instrument_client` for the SCIM client methods,
+    and must be called for the requests sent directly with the HTTP client.
+
+    :param payload: The JSON body of the request, if any.
+    """
+    accounting = current_accounting.get()
+    if accounting is not None:
+        accounting.requests += 1
+        if payload is not None:
+            accounting.bytes_sent += _json_size(payload)
+
+
+def http_url(conf: CheckConfig, path: str) -> str:
+    """Return the URL of an endpoint, for requests sent with the :meth:`~CheckConfig.http_client`."""
+    # The werkzeug engine needs the SCIM prefix, httpx clients have a base URL
+    return f"{getattr(conf.client, 'scim_prefix', '')}{path}"
+
+
+def send_http_request(
+    conf: CheckConfig, method: str, url: str, payload: Any = None
+) -> Any:
+    """Send a request with the :meth:`~CheckConfig.http_client`, the way the SCIM client would.
+
+    The request is reported to the :data:`current_accounting`, the ``environ`` of
+    :class:`~scim2_client.engines.werkzeug.TestSCIMClient` is passed along, and
+    transport errors are raised as :class:`~scim2_client.RequestNetworkError`, so they are reported as check errors.
+    Callers must check that :meth:`~CheckConfig.http_client` is not :data:`None` beforehand,
+    for instance with :func:`missing_http_client_result`.
+
+    :param method: The HTTP method, for instance ``patch``.
+    :param url: The request URL, for instance built with :func:`http_url`.
+    :param payload: The JSON body of the request, if any.
+    """
+    record_request(payload)
+    try:
+        return getattr(conf.http_client(), method)(url, **_http_kwargs(conf, payload))
+    except HTTPTransportError as exc:
+        raise RequestNetworkError(source=payload) from exc
+
+
+async def asend_http_request(
+    conf: CheckConfig, method: str, url: str, payload: Any = None
+) -> Any:
+    """Asynchronous version of :func:`send_http_request`."""
+    record_request(payload)
+    try:
+        return await getattr(conf.http_client(), method)(
+            url, **_http_kwargs(conf, payload)
+        )
+    except HTTPTransportError as exc:
+        raise RequestNetworkError(source=payload) from exc
+
+
+def _http_kwargs(conf: CheckConfig, payload: Any) -> dict[str, Any]:
+    kwargs = dict(getattr(conf.client, "environ", None) or {})
+    if payload is not None:
+        kwargs["json"] = payload
+    return kwargs
+
+
+def missing_http_client_result(conf: CheckConfig) -> CheckResult | None:
+    """Return a skipped result if the SCIM client does not wrap a HTTP client, and :data:`None` else.
+
+    Checks sending requests the SCIM client does not support, like PATCH, need the
+    :meth:`~CheckConfig.http_client` of engines like :class:`~scim2_client.engines.httpx.SyncSCIMClient`.
+    """
+    if conf.http_client() is not None:
+        return None
+
+    return CheckResult(
+        conf,
+        status=Status.SKIPPED,
+        reason=f"{conf.client.__class__.__name__} does not wrap a HTTP client to send the requests with",
+    )
+
+
+def check_http_response(conf: CheckConfig, response: Any, **kwargs) -> Any:
+    """Validate the response of a request sent with the :meth:`~CheckConfig.http_client`.
+
+    The response is reported to the :data:`current_accounting` like the SCIM client responses.
+
+    :param kwargs: Parameters passed to the SCIM client ``check_response`` method.
+    """
+    payload = None
+    if response.status_code not in (204, 205):
+        # httpx responses have a json method, werkzeug responses have a json property
+        payload = response.json() if callable(response.json) else response.json
+    else:
+        # There is no resource to validate in empty responses
+        kwargs.pop("expected_types", None)
+
+    return conf.client.check_response(
+        payload=payload,
+        status_code=response.status_code,
+        headers=response.headers,
+        **kwargs,
+    )
+
+
+def _counting_requests(prepare):
+    @functools.wraps(prepare)
+    def wrapped(*args, **kwargs):
+        req = prepare(*args, **kwargs)
+        # Query payloads are sent as URL parameters
+        is_query = prepare.__name__ == "prepare_query_request"
+        record_request(req.payload if not is_query else None)
+        return req
+
+    return wrapped
+
+
+def _timing_validation(check_response):
+    @functools.wraps(check_response)
+    def wrapped(*args, **kwargs):
+        accounting = current_accounting.get()
+        if accounting is None:
+            return check_response(*args, **kwargs)
+
+        if kwargs.get("status_code") is not None:
+            accounting.status_codes.append(kwargs["status_code"])
+
+        headers = kwargs.get("headers") or {}
+        content_length = headers.get("Content-Length")
+        if content_length is not None:
+            accounting.bytes_received += int(content_length)
+        elif kwargs.get("payload") is not None:
+            accounting.bytes_received += _json_size(kwargs["payload"])
+
+        start = time.perf_counter()
+        try:
+            return check_response(*args, **kwargs)
+        finally:
+            accounting.validation_time += time.perf_counter() - start
+
+    return wrapped
+
+
+def _json_size(payload: Any) -> int:
+    return len(json.dumps(payload, separators=(",", ":"), default=str).encode())
+
+
+CHECKS: dict[str, frozenset[str]] = {}
+"""The registered checks names, and their tags.
+
+The tags in use are:
+
+- ``discovery`` for the configuration endpoints checks;
+- ``crud`` for the resources lifecycle checks, that create objects on the server;
+- ``negative`` for the checks performing invalid requests;
+- ``pagination`` for the checks walking the pages of the resources;
+- ``filter`` for the filtered queries checks;
+- ``bulk`` for the bulk creation checks;
+- ``patch`` for the PATCH modification checks;
+- ``membership`` for the group membership checks.
+"""
+
+
+_DESCRIPTIONS: dict[str, str | None] = {}
+"""The results descriptions, indexed by check names.
+
+They come from the synchronous checkers docstrings, as the asynchronous ones only refer to them.
+"""
+
+
+def checker(*tags):
     """Decorate checker methods.
 
     - It adds a title and a description to the returned result, extracted from the method name and its docstring.
+      The results of coroutine functions get the docstring of their synchronous version when there is one.
     - It catches SCIMClient errors.
+    - It registers the check and its tags in :data:`CHECKS`.
+    - It records the check duration and requests in the result.
+
+    It can be used bare, or with tags:
+
+    .. code-block:: python
+
+        @checker("discovery", "negative")
+        def check_access_invalid_schema(conf: CheckConfig) -> CheckResult: ...
+
+    Coroutine functions are decorated with a coroutine wrapper.
+    Their leading ``a`` is stripped from the result title, so :code:`acheck_object_query` results are titled :code:`check_object_query`.
     """
+    if len(tags) == 1 and callable(tags[0]):
+        return _checker(tags[0], ())
+
+    return functools.partial(_checker, tags=tags)
+
+
+def _checker(func, tags: tuple[str, ...]):
+    CHECKS[check_title(func)] = frozenset(tags)
+    if not inspect.iscoroutinefunction(func):
+        _DESCRIPTIONS[check_title(func)] = func.__doc__
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapped(conf: CheckConfig, *args, **kwargs):
+            measure = _Measure(conf.client)
+            try:
+                result = await func(conf, *args, **kwargs)
+            except SCIMClientError as exc:
+                if conf.raise_exceptions:
+                    raise
+
+                result = _error_result(conf, exc)
+            finally:
+                measure.stop()
+
+            return _decorate_result(func, result, measure)
+
+        return async_wrapped
 
     @functools.wraps(func)
     def wrapped(conf: CheckConfig, *args, **kwargs):
+        measure = _Measure(conf.client)
         try:
             result = func(conf, *args, **kwargs)
         except SCIMClientError as exc:
             if conf.raise_exceptions:
                 raise
 
-            reason = f"{exc} {exc.__cause__}" if exc.__cause__ else str(exc)
-            result = CheckResult(
-                conf, status=Status.ERROR, reason=reason, data=exc.source
-            )
+            result = _error_result(conf, exc)
+        finally:
+            measure.stop()
 
-        # decorate results
-        if isinstance(result, CheckResult):
-            result.title = func.__name__
-            result.description = func.__doc__
-        else:
-            result[0].title = func.__name__
-            result[0].description = func.__doc__
-        return result
+        return _decorate_result(func, result, measure)
 
     return wrapped
+
+
+def check_title(func) -> str:
+    """Return the title of the results produced by a checker method."""
+    if inspect.iscoroutinefunction(func) and func.__name__.startswith("acheck_"):
+        return func.__name__[1:]
+    return func.__name__
+
+
+def _error_result(conf: CheckConfig, exc: SCIMClientError) -> CheckResult:
+    reason = f"{exc} {exc.__cause__}" if exc.__cause__ else str(exc)
+    return CheckResult(conf, status=Status.ERROR, reason=reason, data=exc.source)
+
+
+class _Measure:
+    """Measure the duration and the requests of a check, from its creation until :meth:`stop`."""
+
+    def __init__(self, client: SCIMClient | None):
+        self.client = client
+        if client is not None:
+            instrument_client(client)
+        self.start = datetime.datetime.now(datetime.timezone.utc)
+        self.counter = time.perf_counter()
+        self.accounting = Accounting()
+        self.token = current_accounting.set(self.accounting)
+
+    def stop(self) -> None:
+        self.duration = time.perf_counter() - self.counter
+        current_accounting.reset(self.token)
+        if self.client is not None:
+            release_client(self.client)
+
+
+def _decorate_result(func, result, measure: _Measure):
+    main_result = result if isinstance(result, CheckResult) else result[0]
+    main_result.title = check_title(func)
+    main_result.description = _DESCRIPTIONS.get(main_result.title, func.__doc__)
+    main_result.start = measure.start
+    main_result.duration = measure.duration
+    main_result.requests = measure.accounting.requests
+    main_result.bytes_sent = measure.accounting.bytes_sent
+    main_result.bytes_received = measure.accounting.bytes_received
+    main_result.validation_time = measure.accounting.validation_time
+    main_result.status_codes = measure.accounting.status_codes
+    return result
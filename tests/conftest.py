@@ -1,8 +1,17 @@
+import threading
+
+import portpicker
 import pytest
 from httpx import Client
 from scim2_client.engines.httpx import SyncSCIMClient
 from scim2_models import Group
+from scim2_models import SearchRequest
 from scim2_models import User
+from scim2_server.backend import InMemoryBackend
+from scim2_server.provider import SCIMProvider
+from scim2_server.utils import load_default_resource_types
+from scim2_server.utils import load_default_schemas
+from werkzeug.serving import make_server
 
 from scim2_tester.utils import CheckConfig
 
@@ -18,3 +27,45 @@ def scim_client(httpserver):
 @pytest.fixture
 def check_config(scim_client):
     return CheckConfig(scim_client)
+
+
+@pytest.fixture
+def scim2_server():
+    backend = InMemoryBackend()
+    app = SCIMProvider(backend)
+
+    for schema in load_default_schemas().values():
+        app.register_schema(schema)
+
+    for resource_type in load_default_resource_types().values():
+        app.register_resource_type(resource_type)
+
+    return app
+
+
+@pytest.fixture
+def paginated_scim2_server(scim2_server):
+    """Make scim2-server return the total number of results as totalResults, instead of the page size."""
+    backend = scim2_server.backend
+    query_resources = backend.query_resources
+
+    def fixed_query_resources(search_request, resource_type_id=None):
+        total_results, _ = query_resources(
+            SearchRequest(filter=search_request.filter), resource_type_id
+        )
+        _, resources = query_resources(search_request, resource_type_id)
+        return total_results, resources
+
+    backend.query_resources = fixed_query_resources
+    return scim2_server
+
+
+@pytest.fixture
+def scim2_server_url(scim2_server):
+    port = portpicker.pick_unused_port()
+    server = make_server("localhost", port, scim2_server, threaded=True)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield f"http://localhost:{port}"
+    server.shutdown()
+    thread.join()
@@ -0,0 +1,215 @@
+import asyncio
+import json
+import re
+import uuid
+
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.werkzeug import TestSCIMClient
+from scim2_models import Bulk
+from scim2_models import Group
+from scim2_models import ServiceProviderConfig
+from scim2_models import User
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from scim2_tester import CheckConfig
+from scim2_tester import Status
+from scim2_tester import abulk_test
+from scim2_tester import bulk_test
+from scim2_tester.bulk import check_bulk_creation
+from scim2_tester.bulk import creations
+from scim2_tester.load import resource_pools
+
+
+def scim_response(payload, status=200):
+    return Response(
+        json.dumps(payload), status=status, content_type="application/scim+json"
+    )
+
+
+class BulkServer:
+    """A minimal SCIM server supporting bulk creations."""
+
+    def __init__(self, max_operations, max_bulk_requests=None):
+        self.max_operations = max_operations
+        self.max_bulk_requests = max_bulk_requests
+        self.objects = {}
+        self.bulk_requests = 0
+
+    def create(self, endpoint, data):
+        obj_id = uuid.uuid4().hex
+        location = f"http://localhost{endpoint}/{obj_id}"
+        self.objects[obj_id] = {
+            **data,
+            "id": obj_id,
+            "meta": {"resourceType": endpoint[1:-1], "location": location},
+        }
+        return self.objects[obj_id]
+
+    def handler(self, request):
+        if request.method == "DELETE":
+            self.objects.pop(request.path.rsplit("/", 1)[-1], None)
+            return Response(status=204)
+
+        if request.path != "/Bulk":
+            return scim_response(self.create(request.path, request.json), 201)
+
+        self.bulk_requests += 1
+        if (
+            self.max_bulk_requests is not None
+            and self.bulk_requests > self.max_bulk_requests
+        ):
+            return scim_response(
+                {
+                    "schemas": ["urn:ietf:params:scim:api:messages:2.0:Error"],
+                    "status": "503",
+                    "detail": "Too many bulk requests",
+                },
+                503,
+            )
+
+        operations = request.json["Operations"]
+        assert len(operations) <= self.max_operations
+
+        ids = {}
+        results = []
+        for operation in operations:
+            data = operation["data"]
+            members = data.get("members", [])
+            for member in members:
+                value = member["value"]
+                member["value"] = (
+                    ids.get(value.removeprefix("bulkId:"))
+                    if value.startswith("bulkId:")
+                    else value
+                    if value in self.objects
+                    else None
+                )
+
+            if any(member["value"] is None for member in members):
+                status, location = 409, None
+            else:
+                obj = self.create(operation["path"], data)
+                ids[operation["bulkId"]] = obj["id"]
+                status, location = 201, obj["meta"]["location"]
+
+            results.append(
+                {
+                    "method": "POST",
+                    "bulkId": operation["bulkId"],
+                    "location": location,
+                    "status": str(status),
+                }
+            )
+
+        return scim_response(
+            {
+                "schemas": ["urn:ietf:params:scim:api:messages:2.0:BulkResponse"],
+                "Operations": results,
+            }
+        )
+
+
+def test_bulk_test(httpserver, scim_client):
+    server = BulkServer(max_operations=3)
+    httpserver.expect_request(re.compile(r".*")).respond_with_handler(server.handler)
+    scim_client.service_provider_config = ServiceProviderConfig(
+        bulk=Bulk(supported=True, max_operations=3)
+    )
+    report = bulk_test(scim_client, count=2)
+
+    assert report.bulk.status == Status.SUCCESS
+    assert report.sequential.status == Status.SUCCESS
+    # Groups are kept in the same request than the member they reference
+    assert report.bulk.requests == server.bulk_requests == 2
+    assert report.sequential.requests == 4
+    assert report.speedup > 0
+    assert not server.objects
+
+
+def test_bulk_creation_split_members(httpserver, scim_client):
+    """Test that members created by a previous bulk request are referenced by their id."""
+    server = BulkServer(max_operations=1)
+    httpserver.expect_request(re.compile(r".*")).respond_with_handler(server.handler)
+    scim_client.service_provider_config = ServiceProviderConfig(
+        bulk=Bulk(supported=True, max_operations=1)
+    )
+    conf = CheckConfig(scim_client)
+    pools = resource_pools(conf)
+    try:
+        result = check_bulk_creation(conf, creations(conf, pools, 2))
+        assert result.status == Status.SUCCESS, result.reason
+        assert result.requests == server.bulk_requests == 4
+
+        users, groups = (pool.objects for pool in pools)
+        assert all(user.user_name for user in users)
+        assert [group.members[0].value for group in groups] == [
+            user.id for user in users
+        ]
+        assert all(
+            server.objects[group.id]["members"][0]["value"] == group.members[0].value
+            for group in groups
+        )
+    finally:
+        for pool in pools[::-1]:
+            pool.cleanup()
+
+    assert not server.objects
+
+
+def test_bulk_creation_failed_request(httpserver, scim_client):
+    """Test that the objects created by the requests preceding a failed one are kept in the pools."""
+    server = BulkServer(max_operations=1, max_bulk_requests=1)
+    httpserver.expect_request(re.compile(r".*")).respond_with_handler(server.handler)
+    scim_client.service_provider_config = ServiceProviderConfig(
+        bulk=Bulk(supported=True, max_operations=1)
+    )
+    conf = CheckConfig(scim_client)
+    pools = resource_pools(conf)
+    try:
+        result = check_bulk_creation(conf, creations(conf, pools, 2))
+        assert result.status == Status.ERROR
+        assert server.bulk_requests == 2
+
+        users, groups = (pool.objects for pool in pools)
+        assert [user.id for user in users] == list(server.objects)
+        assert not groups
+    finally:
+        for pool in pools[::-1]:
+            pool.cleanup()
+
+    assert not server.objects
+
+
+def test_bulk_test_unsupported(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    report = bulk_test(client)
+
+    assert report.bulk.status == Status.SKIPPED
+    assert report.sequential is None
+    assert report.speedup is None
+    assert not scim2_server.backend.resources
+
+
+def test_async_bulk_test(httpserver):
+    server = BulkServer(max_operations=10)
+    httpserver.expect_request(re.compile(r".*")).respond_with_handler(server.handler)
+
+    async def main():
+        client = AsyncSCIMClient(
+            AsyncClient(base_url=f"http://localhost:{httpserver.port}"),
+            resource_models=[User, Group],
+            service_provider_config=ServiceProviderConfig(
+                bulk=Bulk(supported=True, max_operations=10)
+            ),
+        )
+        client.register_naive_resource_types()
+        return await abulk_test(client, count=3)
+
+    report = asyncio.run(main())
+    assert report.bulk.status == Status.SUCCESS
+    assert report.bulk.requests == server.bulk_requests == 1
+    assert report.sequential.requests == 6
+    assert not server.objects
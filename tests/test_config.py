@@ -5,7 +5,15 @@ from scim2_client.engines.httpx import SyncSCIMClient
 from scim2_models import Group
 from scim2_models import User
 
+from scim2_tester import CHECKS
+from scim2_tester.checker import check_random_url
 from scim2_tester.checker import check_server
+from scim2_tester.resource import check_object_creation
+from scim2_tester.resource import check_object_deletion
+from scim2_tester.resource import check_object_query
+from scim2_tester.schemas import check_access_invalid_schema
+from scim2_tester.schemas import check_query_all_schemas
+from scim2_tester.utils import CheckConfig
 
 
 def test_raise_exceptions():
@@ -14,3 +22,28 @@ def test_raise_exceptions():
     scim = SyncSCIMClient(client, resource_models=(User, Group))
     with pytest.raises(SCIMClientError):
         check_server(scim, raise_exceptions=True)
+
+
+def test_is_selected():
+    """Test that checks are selected by name and tags, exclusions taking precedence."""
+    conf = CheckConfig(None, include=["discovery", "check_object_query"])
+    assert conf.is_selected(check_query_all_schemas)
+    assert conf.is_selected(check_object_query)
+    assert not conf.is_selected(check_object_creation)
+    assert not conf.is_selected(check_random_url)
+
+    conf = CheckConfig(None, include=["User"], exclude=["check_object_deletion"])
+    assert conf.is_selected(check_object_creation, ("User",))
+    assert not conf.is_selected(check_object_creation, ("Group",))
+    assert not conf.is_selected(check_object_deletion, ("User",))
+
+    conf = CheckConfig(None, exclude=["negative"])
+    assert conf.is_selected(check_query_all_schemas)
+    assert not conf.is_selected(check_access_invalid_schema)
+
+
+def test_registry():
+    """Test that checks and their asynchronous versions are registered with their tags."""
+    assert CHECKS["check_object_query"] == {"crud"}
+    assert CHECKS["check_access_invalid_schema"] == {"discovery", "negative"}
+    assert "acheck_object_query" not in CHECKS
@@ -0,0 +1,70 @@
+import asyncio
+
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.werkzeug import TestSCIMClient
+from scim2_models import Email
+from scim2_models import Meta
+from scim2_models import Name
+from scim2_models import User
+from werkzeug.test import Client
+
+from scim2_tester import afilter_test
+from scim2_tester import filter_test
+from scim2_tester.filters import filter_expressions
+
+
+def test_filter_expressions():
+    user = User(
+        user_name="bjensen",
+        active=True,
+        name=Name(family_name="Jensen"),
+        emails=[Email(type="work", value="bjensen@example.com")],
+        meta=Meta(last_modified="2024-01-01T00:00:00Z"),
+    )
+    expressions = {
+        str(filter): filter.expression for filter in filter_expressions(user)
+    }
+
+    assert expressions["userName eq"] == 'userName eq "bjensen"'
+    assert expressions["userName sw"] == 'userName sw "bje"'
+    assert expressions["userName co"] == 'userName co "jen"'
+    assert expressions["userName pr"] == "userName pr"
+    assert expressions["active eq"] == "active eq true"
+    assert expressions["name.familyName eq"] == 'name.familyName eq "Jensen"'
+    assert expressions["emails[type] eq"] == 'emails[type eq "work"]'
+    assert expressions["emails.value eq"] == 'emails.value eq "bjensen@example.com"'
+    assert (
+        expressions["meta.lastModified gt"]
+        == 'meta.lastModified gt "2023-12-31T23:59:59+00:00"'
+    )
+
+
+def test_filter_test(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    groups = [
+        resource_type
+        for resource_type in client.resource_types
+        if resource_type.id == "Group"
+    ]
+    report = filter_test(client, resource_types=groups, seeds=3, repeat=2)
+
+    assert report.operations["Group.displayName eq"].count == 2
+    assert report.operations["Group.displayName eq"].errors == 0
+    assert report.operations["Group.displayName co"].errors == 0
+    assert report.operations["Group.members[type] eq"].errors == 0
+    assert report.operations["Group.meta.created gt"].errors == 0
+    assert not scim2_server.backend.resources
+
+
+def test_async_filter_test(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        return await afilter_test(client, seeds=2, repeat=1)
+
+    report = asyncio.run(main())
+    assert report.operations["User.userName eq"].errors == 0
+    assert report.operations["Group.displayName sw"].errors == 0
+    assert not scim2_server.backend.resources
@@ -0,0 +1,101 @@
+import asyncio
+
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.werkzeug import TestSCIMClient
+from scim2_models import Bulk
+from scim2_models import ServiceProviderConfig
+from werkzeug.test import Client
+
+from scim2_tester import FixturePool
+from scim2_tester import Status
+from scim2_tester import acheck_server
+from scim2_tester import check_server
+from scim2_tester import rate_test
+from scim2_tester.load import ResourcePool
+
+
+def test_fixtures_check_server(scim2_server):
+    """Test that the read checks are performed on the fixture objects."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    with FixturePool(client, count=3) as fixtures:
+        ids = {obj.id for objs in fixtures.objects.values() for obj in objs}
+        assert len(fixtures.objects["User"]) == len(fixtures.objects["Group"]) == 3
+
+        results = check_server(client, fixtures=fixtures)
+        queries = [result for result in results if result.title == "check_object_query"]
+        assert len(queries) == 2
+        assert all(result.data.id in ids for result in queries)
+        assert all(result.status == Status.SUCCESS for result in results)
+
+    assert not scim2_server.backend.resources
+
+
+def test_fixtures_adoption(scim2_server):
+    """Test that existing objects are adopted by filter, and not deleted."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    group_model = client.get_resource_model("Group")
+    groups = [client.create(group_model(display_name=f"fixture {i}")) for i in range(3)]
+    client.create(group_model(display_name="other"))
+
+    resource_types = [rt for rt in client.resource_types if rt.id == "Group"]
+    with FixturePool(
+        client,
+        resource_types,
+        count=10,
+        filters={"Group": 'displayName sw "fixture"'},
+    ) as fixtures:
+        assert sorted(obj.id for obj in fixtures.objects["Group"]) == sorted(
+            group.id for group in groups
+        )
+
+    assert len(scim2_server.backend.resources) == 4
+
+
+def test_fixtures_bulk_failure(scim2_server):
+    """Test that the objects the bulk requests fail to create are created one by one."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    client.service_provider_config = ServiceProviderConfig(
+        bulk=Bulk(supported=True, max_operations=10)
+    )
+    with FixturePool(client, count=2) as fixtures:
+        assert len(fixtures.objects["User"]) == len(fixtures.objects["Group"]) == 2
+
+    assert not scim2_server.backend.resources
+
+
+def test_fixtures_rate_test(scim2_server, monkeypatch):
+    """Test that no object is created before a query rate test with fixtures."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    with FixturePool(client, count=2) as fixtures:
+        prepared = []
+        monkeypatch.setattr(
+            ResourcePool, "prepare", lambda pool, count: prepared.append(pool)
+        )
+        report = rate_test(
+            client, rate=50, duration=0.2, operation="query", fixtures=fixtures
+        )
+
+    assert not prepared
+    assert report.operations["User.query"].count == 5
+    assert report.operations["Group.query"].errors == 0
+    assert not scim2_server.backend.resources
+
+
+def test_async_fixtures(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        async with FixturePool(client, count=2) as fixtures:
+            results = await acheck_server(client, fixtures=fixtures)
+            objs = {obj.id for objs in fixtures.objects.values() for obj in objs}
+        return results, objs
+
+    results, objs = asyncio.run(main())
+    assert len(objs) == 4
+    assert all(result.status == Status.SUCCESS for result in results)
+    assert not scim2_server.backend.resources
@@ -0,0 +1,289 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.werkzeug import TestSCIMClient
+from werkzeug.test import Client
+
+from scim2_tester import CheckConfig
+from scim2_tester import CheckResult
+from scim2_tester import Status
+from scim2_tester import acapacity_test
+from scim2_tester import aiter_soak_test
+from scim2_tester import aload_test
+from scim2_tester import arate_test
+from scim2_tester import capacity_test
+from scim2_tester import iter_soak_test
+from scim2_tester import load_test
+from scim2_tester import rate_test
+from scim2_tester.load import OPERATIONS
+from scim2_tester.load import OperationStats
+from scim2_tester.load import ResourcePool
+from scim2_tester.load import percentile
+from scim2_tester.load import resource_pools
+from scim2_tester.resource import MODIFICATIONS
+from scim2_tester.resource import delete_references
+
+
+def test_percentile():
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([1.0], 95) == 1
+    assert percentile([], 50) is None
+
+
+def test_operation_stats():
+    stats = OperationStats(latencies=[0.3, 0.1, 0.2], duration=2)
+    assert stats.count == 3
+    assert stats.throughput == 1.5
+    assert stats.p50 == 0.2
+    assert stats.max == 0.3
+
+
+def test_operation_stats_error_statuses():
+    conf = CheckConfig(None)
+    stats = OperationStats()
+    stats.add(CheckResult(conf, Status.ERROR, duration=0.1, status_codes=[409]))
+    stats.add(CheckResult(conf, Status.ERROR, duration=0.1))
+    stats.add(CheckResult(conf, Status.SUCCESS, duration=0.1, status_codes=[200]))
+
+    assert stats.errors == 2
+    assert stats.error_statuses == {409: 1, None: 1}
+
+
+def test_load_test(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    report = load_test(client, iterations=3, concurrency=2)
+
+    assert set(report.operations) == {
+        f"{resource_type}.{operation}"
+        for resource_type in ("User", "Group")
+        for operation in (
+            "creation",
+            "query",
+            "query_without_id",
+            "replacement",
+            "modification.check_object_modification",
+            "modification.check_object_modification_without_target",
+            "deletion",
+        )
+    }
+    for name, stats in report.operations.items():
+        multiple = name.endswith(".check_object_modification")
+        assert stats.count == 3 * len(MODIFICATIONS) if multiple else 3
+        assert stats.errors == 0
+        assert 0 < stats.p50 <= stats.p95 <= stats.p99 <= stats.max
+    assert report.throughput > 0
+    assert "User.creation" in str(report)
+    assert not scim2_server.backend.resources
+
+
+def test_load_test_resource_types(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    user = client.get_resource_model("User")
+    resource_types = [
+        resource_type
+        for resource_type in client.resource_types
+        if resource_type.schema_ == user.model_fields["schemas"].default[0]
+    ]
+    report = load_test(client, resource_types, iterations=2)
+
+    assert report.operations["User.creation"].count == 2
+    assert "Group.creation" not in report.operations
+    # Every PATCH operation of the modification task is recorded
+    assert report.operations[
+        "User.modification.check_object_modification"
+    ].count == 2 * len(MODIFICATIONS)
+    assert (
+        report.operations[
+            "User.modification.check_object_modification_without_target"
+        ].count
+        == 2
+    )
+
+
+def test_async_load_test(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        return await aload_test(client, iterations=3, concurrency=3)
+
+    report = asyncio.run(main())
+    assert report.operations["Group.deletion"].count == 3
+    assert all(stats.errors == 0 for stats in report.operations.values())
+    assert not scim2_server.backend.resources
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+def test_rate_test(scim2_server, operation):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    report = rate_test(client, rate=50, duration=0.2, operation=operation)
+
+    assert report.operations[f"User.{operation}"].count == 5
+    assert report.operations[f"Group.{operation}"].count == 5
+    for stats in report.operations.values():
+        assert stats.errors == 0
+        # Latencies are measured from the scheduled time, so they include the queuing time
+        assert all(
+            latency >= service_time
+            for latency, service_time in zip(
+                stats.latencies, stats.service_times, strict=True
+            )
+        )
+    assert not scim2_server.backend.resources
+
+
+def test_rate_test_coordinated_omission(scim2_server):
+    """Test that operations queued behind a slow one have their waiting time in their latency."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    report = rate_test(client, rate=100, duration=0.1, operation="query", max_workers=1)
+
+    stats = report.operations["User.query"]
+    assert stats.count == 5
+    assert stats.max > stats.service_percentile(100)
+
+
+def test_rate_test_unknown_operation(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    with pytest.raises(ValueError):
+        rate_test(client, rate=1, duration=1, operation="patch")
+
+
+def test_rate_test_without_resource_types(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    report = rate_test(client, rate=50, duration=0.2, resource_types=[])
+
+    assert not report.operations
+
+
+def test_rate_test_exhausted_pool(scim2_server, monkeypatch):
+    """Test that operations without any object to act on are not recorded."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    monkeypatch.setattr(ResourcePool, "prepare", lambda pool, count: None)
+    report = rate_test(client, rate=50, duration=0.2, operation="deletion")
+
+    assert not report.operations
+
+
+def test_async_rate_test(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        return await arate_test(client, rate=50, duration=0.2, operation="deletion")
+
+    report = asyncio.run(main())
+    assert report.operations["User.deletion"].count == 5
+    assert all(stats.errors == 0 for stats in report.operations.values())
+    assert not scim2_server.backend.resources
+
+
+def test_resource_pools_shared_references(scim2_server):
+    """Test that cleaning a pool up keeps the referenced objects other pools may use."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    conf = CheckConfig(client, reference_pool_size=1)
+    group_pool, user_pool = (
+        pool
+        for resource_type_id in ("Group", "User")
+        for pool in resource_pools(conf)
+        if pool.resource_type.id == resource_type_id
+    )
+    group_pool.prepare(2)
+    user_pool.prepare(1)
+    user_pool.cleanup()
+    member_id = group_pool.objects[0].members[0].ref.rsplit("/", 1)[-1]
+    assert client.query(client.get_resource_model("User"), member_id)
+
+    group_pool.cleanup()
+    delete_references(conf)
+    assert not scim2_server.backend.resources
+
+
+def test_capacity_test(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    report = capacity_test(client, concurrencies=(1, 2), iterations=2)
+
+    for resource_type_id in ("User", "Group"):
+        steps = report.steps[resource_type_id]
+        assert [step.concurrency for step in steps] == [1, 2]
+        assert steps[1].report.operations[f"{resource_type_id}.creation"].count == 4
+        assert report.max_throughput(resource_type_id) > 0
+    assert "SLO breached" not in str(report)
+    assert not scim2_server.backend.resources
+
+
+def test_capacity_test_slo_breach(scim2_server):
+    """Test that the steps stop at the first breach of the objectives."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    report = capacity_test(client, concurrencies=(1, 2), iterations=1, max_p99=1e-9)
+
+    assert len(report.steps["User"]) == 1
+    assert report.sustainable("User") is None
+    assert report.max_throughput("User") == 0
+    assert "SLO breached" in str(report)
+
+
+def test_async_capacity_test(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        return await acapacity_test(client, concurrencies=(1, 2), iterations=1)
+
+    report = asyncio.run(main())
+    assert report.max_throughput("Group") > 0
+
+
+def test_soak_test(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    reports = list(iter_soak_test(client, rate=20, window=0.25, duration=0.5))
+
+    assert len(reports) >= 2
+    assert all(report.start is not None for report in reports)
+    assert all(report.duration > 0 for report in reports)
+    # 10 lifecycles, every PATCH modification being recorded as an operation
+    assert sum(report.count for report in reports) == 10 * (6 + len(MODIFICATIONS))
+    assert sum(report.errors for report in reports) == 0
+    assert not scim2_server.backend.resources
+
+
+def test_soak_test_interruption(scim2_server):
+    """Test that stopping the iteration stops the test, and deletes the created objects."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    reports = iter_soak_test(client, rate=10, window=1)
+    report = next(reports)
+    reports.close()
+
+    assert report.count > 0
+    assert not scim2_server.backend.resources
+
+
+def test_async_soak_test(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        return [
+            report
+            async for report in aiter_soak_test(
+                client, rate=20, window=0.25, duration=0.5
+            )
+        ]
+
+    reports = asyncio.run(main())
+    assert len(reports) >= 2
+    # The lifecycles started during the duration are all finished and reported
+    assert sum(report.count for report in reports) == 10 * (6 + len(MODIFICATIONS))
+    assert sum(report.errors for report in reports) == 0
+    assert not scim2_server.backend.resources
@@ -0,0 +1,80 @@
+import asyncio
+
+from httpx import AsyncClient
+from httpx import Client
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.httpx import SyncSCIMClient
+
+from scim2_tester import Status
+from scim2_tester import amembership_test
+from scim2_tester import membership_test
+from scim2_tester.membership import check_member_addition
+from scim2_tester.utils import CheckConfig
+
+
+def test_membership_test(scim2_server, scim2_server_url):
+    client = SyncSCIMClient(Client(base_url=scim2_server_url))
+    client.discover()
+    report = membership_test(client, sizes=(2, 10), iterations=2)
+
+    assert [step.members for step in report.steps] == [2, 10]
+    for step in report.steps:
+        assert set(step.report.operations) == {
+            "member_addition",
+            "member_removal",
+            "query",
+            "query_without_members",
+        }
+        assert step.report.count == 8
+        assert step.report.errors == 0
+
+    first, last = (step.report.operations["query"] for step in report.steps)
+    assert first.mean_bytes_received < last.mean_bytes_received
+    assert report.slowdown("query") > 0
+    assert "query_without_members" in str(report)
+    assert not scim2_server.backend.resources
+
+
+def test_membership_test_without_patch(scim2_server, scim2_server_url):
+    """Test that the member additions and removals are skipped without PATCH support."""
+    client = SyncSCIMClient(Client(base_url=scim2_server_url))
+    client.discover()
+    client.service_provider_config.patch.supported = False
+    report = membership_test(client, sizes=(1,), iterations=1)
+
+    assert set(report.steps[0].report.operations) == {
+        "query",
+        "query_without_members",
+    }
+    assert report.steps[0].report.errors == 0
+    assert not scim2_server.backend.resources
+
+    group = client.get_resource_model("Group")(id="foo")
+    user = client.get_resource_model("User")(id="bar")
+    result = check_member_addition(CheckConfig(client), group, user)
+    assert result.status == Status.SKIPPED
+
+
+def test_membership_test_without_groups(scim2_server, scim2_server_url):
+    client = SyncSCIMClient(Client(base_url=scim2_server_url))
+    client.discover()
+    client.resource_models = tuple(
+        model for model in client.resource_models if model.__name__ != "Group"
+    )
+    report = membership_test(client, sizes=(1,), iterations=1)
+
+    assert not report.steps
+    assert not scim2_server.backend.resources
+
+
+def test_async_membership_test(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        return await amembership_test(client, sizes=(3,), iterations=1)
+
+    report = asyncio.run(main())
+    assert report.steps[0].report.count == 4
+    assert report.steps[0].report.errors == 0
+    assert report.slowdown("query") is None
+    assert not scim2_server.backend.resources
@@ -1,4 +1,5 @@
 import re
+import time
 
 from httpx import Client
 from scim2_client.engines.httpx import SyncSCIMClient
@@ -26,6 +27,39 @@ def test_unreachable_host():
     )
 
 
+def test_unreachable_host_fail_fast():
+    """Test that no more checks are performed after the first failure."""
+    client = Client(base_url="https://invalid.test")
+    scim = SyncSCIMClient(client)
+    results = check_server(scim, fail_fast=1)
+
+    assert len(results) == 1
+    assert results[0].status == Status.ERROR
+
+
+def test_slow_server_time_budget(httpserver):
+    """Test that requests time out and remaining checks are skipped when the time budget is exhausted."""
+
+    def slow_handler(request):
+        time.sleep(1)
+
+    httpserver.expect_request(re.compile(r".*")).respond_with_handler(slow_handler)
+    client = Client(base_url=f"http://localhost:{httpserver.port}", timeout=10)
+    scim = SyncSCIMClient(client)
+
+    start = time.monotonic()
+    results = check_server(scim, time_budget=0.3)
+
+    assert time.monotonic() - start < 1
+    assert results[0].title == "check_service_provider_config_endpoint"
+    assert results[0].status == Status.ERROR
+    assert [result.status for result in results[1:]] == [
+        Status.SKIPPED,
+        Status.SKIPPED,
+    ]
+    assert client.timeout.read == 10
+
+
 def test_bad_authentication(httpserver):
     """Test reaching a valid URL with incorrect authentication."""
     httpserver.expect_request(re.compile(r".*")).respond_with_json(
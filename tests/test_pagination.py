@@ -0,0 +1,55 @@
+import asyncio
+
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.werkzeug import TestSCIMClient
+from werkzeug.test import Client
+
+from scim2_tester import Status
+from scim2_tester import apagination_test
+from scim2_tester import pagination_test
+from scim2_tester.pagination import _slowdown
+
+
+def test_slowdown():
+    assert _slowdown([0.1] * 7) is None
+    assert _slowdown([0.1] * 8) == 1
+    assert _slowdown([0.1, 0.1] + [0.2] * 4 + [0.5, 0.5]) == 5
+
+
+def test_pagination(paginated_scim2_server):
+    scim2_server = paginated_scim2_server
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    results = pagination_test(client, seeds=6, page_size=3)
+
+    assert [result.status for result in results] == [Status.SUCCESS, Status.SUCCESS]
+    assert [page.start_index for page in results[1].data] == [1, 4]
+    assert all(page.latency > 0 for page in results[1].data)
+    # Filling the users references creates other users
+    assert sum(page.items for page in results[0].data) >= 6
+    assert not scim2_server.backend.resources
+
+
+def test_pagination_inconsistent_total_results(scim2_server):
+    """scim2-server returns the number of resources of the page as totalResults."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    results = pagination_test(client, seeds=6, page_size=3)
+
+    assert results[0].status == Status.ERROR
+    assert "resources were not returned" in results[0].reason
+    assert not scim2_server.backend.resources
+
+
+def test_async_pagination(paginated_scim2_server, scim2_server_url):
+    scim2_server = paginated_scim2_server
+
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        return await apagination_test(client, seeds=4, page_size=2)
+
+    results = asyncio.run(main())
+    assert [result.status for result in results] == [Status.SUCCESS, Status.SUCCESS]
+    assert not scim2_server.backend.resources
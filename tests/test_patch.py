@@ -0,0 +1,50 @@
+import asyncio
+
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.werkzeug import TestSCIMClient
+from werkzeug.test import Client
+
+from scim2_tester import apatch_test
+from scim2_tester import patch_test
+
+
+def test_patch_test(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    report = patch_test(client, iterations=3)
+
+    assert set(report.operations) == {
+        "User.replacement",
+        "User.modification",
+        "Group.replacement",
+        "Group.modification",
+    }
+    assert report.count == 12
+    assert report.errors == 0
+    replacement = report.operations["User.replacement"]
+    modification = report.operations["User.modification"]
+    assert 0 < modification.mean_bytes_sent < replacement.mean_bytes_sent
+    assert not scim2_server.backend.resources
+
+
+def test_patch_test_unsupported(scim2_server):
+    """Test that nothing is performed when the server does not support PATCH."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    client.service_provider_config.patch.supported = False
+    report = patch_test(client)
+
+    assert report.count == 0
+
+
+def test_async_patch_test(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        return await apatch_test(client, iterations=2)
+
+    report = asyncio.run(main())
+    assert report.operations["Group.modification"].count == 2
+    assert report.errors == 0
+    assert not scim2_server.backend.resources
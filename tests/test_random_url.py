@@ -1,9 +1,15 @@
+import asyncio
 import re
 
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
 from scim2_models import Error
+from scim2_models import Group
 from scim2_models import User
 
+from scim2_tester.checker import acheck_random_url
 from scim2_tester.checker import check_random_url
+from scim2_tester.utils import CheckConfig
 from scim2_tester.utils import Status
 
 
@@ -49,3 +55,21 @@ def test_random_url_not_404(httpserver, check_config):
 
     assert result.status == Status.ERROR
     assert "did return an object, but the status code is 200" in result.reason
+
+
+def test_async_random_url(httpserver):
+    """Test reaching a random URL with an asynchronous client."""
+    httpserver.expect_request(re.compile(r".*")).respond_with_json(
+        Error(status=404, detail="Endpoint Not Found").model_dump(),
+        status=404,
+        content_type="application/scim+json",
+    )
+    client = AsyncClient(base_url=f"http://localhost:{httpserver.port}")
+    scim_client = AsyncSCIMClient(client, resource_models=[User, Group])
+    conf = CheckConfig(scim_client)
+
+    result = asyncio.run(acheck_random_url(conf))
+
+    assert result.status == Status.SUCCESS
+    assert result.title == "check_random_url"
+    assert "correctly returned a 404 error" in result.reason
@@ -1,10 +1,35 @@
+import asyncio
+import re
 from enum import Enum
 
+import httpx
+from httpx import AsyncClient
 from pydantic import Field
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.werkzeug import TestSCIMClient
 from scim2_models import ComplexAttribute
+from scim2_models import Group
+from scim2_models import Mutability
 from scim2_models import Reference
 from scim2_models import Resource
+from werkzeug.test import Client
 
+from scim2_tester import CheckConfig
+from scim2_tester import Status
+from scim2_tester.filling import aiter_objects
+from scim2_tester.filling import counter_strategy
+from scim2_tester.filling import fill_plan
+from scim2_tester.filling import generate_objects
+from scim2_tester.filling import register_strategy
+from scim2_tester.filling import required_field_names
+from scim2_tester.filling import unregister_strategy
+from scim2_tester.resource import MODIFICATIONS
+from scim2_tester.resource import adelete_objects
+from scim2_tester.resource import check_object_modification
+from scim2_tester.resource import check_object_modification_without_target
+from scim2_tester.resource import check_object_query_without_id
+from scim2_tester.resource import delete_objects
+from scim2_tester.resource import delete_references
 from scim2_tester.resource import fill_with_random_values
 
 
@@ -57,3 +82,257 @@ def test_random_values():
 
     assert obj.example_unique in ["foo", "bar"]
     assert all(val in ["foo", "bar"] for val in obj.example_multiple)
+
+
+def test_fill_plan():
+    """Check that the fill plans are computed once per model."""
+    plan = fill_plan(CustomModel)
+
+    assert fill_plan(CustomModel) is plan
+    assert plan["str_multiple"].multiple
+    assert not plan["str_unique"].multiple
+    assert plan["complex_unique"].filler is not None
+    assert not plan["schemas"].fillable
+    assert plan["example_unique"].value("0f") in ["foo", "bar"]
+    assert plan["id"].mutability == Mutability.read_only
+    assert required_field_names(Group) == ["schemas"]
+    assert fill_plan.cache_info().maxsize is not None
+
+
+def test_generate_objects():
+    """Check that 'generate_objects' produce distinct valid objects."""
+    field_names = [
+        field_name
+        for field_name in CustomModel.model_fields
+        if not field_name.startswith("reference") and field_name != "meta"
+    ]
+    objs, garbages = generate_objects(None, CustomModel, 50, field_names)
+
+    assert len(objs) == 50
+    assert not garbages
+    assert len({obj.str_unique for obj in objs}) == 50
+    assert all(obj.complex_unique.str_unique for obj in objs)
+    assert all(obj.example_unique in ["foo", "bar"] for obj in objs)
+    for obj in objs:
+        CustomModel.model_validate(obj.model_dump())
+
+
+def test_aiter_objects(scim2_server, scim2_server_url):
+    """Check that the referenced objects are created while iterating over objects."""
+
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        conf = CheckConfig(client)
+        model = client.get_resource_model("Group")
+        objs = [
+            obj
+            async for obj in aiter_objects(conf, model, 3, ["display_name", "members"])
+        ]
+        await adelete_objects(conf, [ref for _, refs in objs for ref in refs])
+        return objs
+
+    objs = asyncio.run(main())
+    assert len({obj.display_name for obj, _ in objs}) == 3
+    assert all(len(refs) == 1 for _, refs in objs)
+    assert all(obj.members[0].ref == refs[0].meta.location for obj, refs in objs)
+    assert not scim2_server.backend.resources
+
+
+def test_reference_pool(scim2_server):
+    """Check that the referenced objects are shared, and deleted with the pool."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    conf = CheckConfig(client, reference_pool_size=2)
+    model = client.get_resource_model("Group")
+    objs, garbages = generate_objects(conf, model, 6, ["display_name", "members"])
+
+    assert len(garbages) == 6
+    assert len(scim2_server.backend.resources) == 2
+    locations = [obj.members[0].ref for obj in objs]
+    assert locations[:2] == locations[2:4] == locations[4:]
+
+    delete_objects(conf, garbages)
+    assert len(scim2_server.backend.resources) == 2
+
+    delete_references(conf)
+    assert not scim2_server.backend.resources
+    assert not conf.reference_pool.drain()
+
+
+def test_reference_pool_referenced_objects(scim2_server):
+    """Check that the objects still referenced when the pool is drained are deleted by their last release."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    conf = CheckConfig(client, reference_pool_size=1)
+    model = client.get_resource_model("Group")
+    _, garbages = generate_objects(conf, model, 2, ["display_name", "members"])
+
+    delete_references(conf)
+    assert len(scim2_server.backend.resources) == 1
+
+    delete_objects(conf, garbages[:1])
+    assert len(scim2_server.backend.resources) == 1
+
+    delete_objects(conf, garbages[1:])
+    assert not scim2_server.backend.resources
+
+
+def test_seeded_values():
+    """Check that objects filled with the same seed are identical."""
+    field_names = ["str_unique", "int_unique", "bool_unique", "complex_unique"]
+    first, _ = generate_objects(CheckConfig(None, seed=42), CustomModel, 3, field_names)
+    second, _ = generate_objects(
+        CheckConfig(None, seed=42), CustomModel, 3, field_names
+    )
+    other, _ = generate_objects(CheckConfig(None, seed=43), CustomModel, 3, field_names)
+
+    assert [obj.model_dump() for obj in first] == [obj.model_dump() for obj in second]
+    assert [obj.str_unique for obj in first] != [obj.str_unique for obj in other]
+
+
+def test_register_strategy():
+    """Check that the most specific strategy is used."""
+    register_strategy(str, lambda token: "type")
+    register_strategy("strUnique", lambda token: "name")
+    register_strategy("org:test:CustomModel:strMultiple", lambda token: "urn")
+    register_strategy(int, lambda token: 42)
+    try:
+        obj, _ = fill_with_random_values(
+            None,
+            CustomModel(),
+            ["str_unique", "str_multiple", "int_unique", "example_unique"],
+        )
+        assert obj.str_unique == "name"
+        assert obj.str_multiple == ["urn"]
+        assert obj.int_unique == 42
+        # Type strategies do not override the examples
+        assert obj.example_unique in ["foo", "bar"]
+
+        complex_obj, _ = fill_with_random_values(None, Complex())
+        assert complex_obj.str_unique == "name"
+        assert complex_obj.str_multiple == ["type"]
+
+    finally:
+        for key in (str, int, "strUnique", "org:test:CustomModel:strMultiple"):
+            unregister_strategy(key)
+
+    obj, _ = fill_with_random_values(None, CustomModel(), ["str_unique"])
+    assert obj.str_unique != "name"
+
+
+def test_counter_strategy():
+    register_strategy(str, counter_strategy())
+    try:
+        objs, _ = generate_objects(None, CustomModel, 5, ["str_unique"])
+    finally:
+        unregister_strategy(str)
+
+    prefix = objs[0].str_unique.split("-")[0]
+    assert [obj.str_unique for obj in objs] == [f"{prefix}-{i}" for i in range(5)]
+
+
+def test_query_without_id_filter(scim2_server):
+    """Test that the object is looked for with a filter when the server supports it."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    conf = CheckConfig(client)
+    group_model = client.get_resource_model("Group")
+    groups = [client.create(group_model(display_name=f"group {i}")) for i in range(5)]
+    result = check_object_query_without_id(conf, groups[-1])
+
+    assert result.status == Status.SUCCESS
+    assert result.requests == 1
+    assert [group.id for group in result.data.resources] == [groups[-1].id]
+
+
+def test_query_without_id_page_walk(paginated_scim2_server):
+    """Test that the pages are walked when the server does not support filtering."""
+    paginated_scim2_server.page_size = 2
+    client = TestSCIMClient(Client(paginated_scim2_server))
+    client.discover()
+    client.service_provider_config.filter.supported = False
+    conf = CheckConfig(client)
+    group_model = client.get_resource_model("Group")
+    groups = [client.create(group_model(display_name=f"group {i}")) for i in range(5)]
+
+    result = check_object_query_without_id(conf, groups[2])
+    assert result.status == Status.SUCCESS
+    assert result.requests == 2
+
+    paginated_scim2_server.backend.delete_resource("Group", groups[2].id)
+    result = check_object_query_without_id(conf, groups[2])
+    assert result.status == Status.ERROR
+    assert result.requests == 2
+
+
+def test_object_modification(scim2_server):
+    """Test the PATCH operations, with and without path."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    conf = CheckConfig(client)
+    group = client.create(client.get_resource_model("Group")(display_name="group"))
+
+    for op, with_path in MODIFICATIONS:
+        result = check_object_modification(conf, group, op, with_path)
+        assert result.status == Status.SUCCESS, result.reason
+        assert result.requests == 1
+        assert result.bytes_sent > 0
+
+    assert client.query(group.__class__, group.id).external_id is None
+
+    result = check_object_modification(conf, group, "replace", True)
+    assert result.data is None
+    assert client.query(group.__class__, group.id).external_id is not None
+
+    result = check_object_modification_without_target(conf, group)
+    assert result.status == Status.SUCCESS
+    assert result.data.scim_type == "noTarget"
+
+
+def test_object_modification_unexpected_value(httpserver, check_config):
+    """Test that the attribute of the modified object returned by the server is checked."""
+    httpserver.expect_request(re.compile(r".*")).respond_with_json(
+        {"schemas": Group.model_fields["schemas"].default, "id": "foo"},
+        content_type="application/scim+json",
+    )
+    group = Group(id="foo", display_name="group")
+
+    result = check_object_modification(check_config, group)
+    assert result.status == Status.ERROR
+    assert "externalId" in result.reason
+
+    result = check_object_modification_without_target(check_config, group)
+    assert result.status == Status.ERROR
+
+
+def test_object_modification_network_error(scim_client):
+    """Test that transport errors of PATCH requests are reported as check errors."""
+
+    def handler(request):
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    scim_client.client = httpx.Client(
+        base_url="http://localhost", transport=httpx.MockTransport(handler)
+    )
+    conf = CheckConfig(scim_client)
+    group = Group(id="foo", display_name="group")
+
+    result = check_object_modification(conf, group)
+    assert result.status == Status.ERROR
+    assert result.reason.startswith("Network error happened during request")
+
+    result = check_object_modification_without_target(conf, group)
+    assert result.status == Status.ERROR
+
+
+def test_object_modification_without_http_client(scim_client):
+    """Test that PATCH checks are skipped with engines that do not wrap a HTTP client."""
+    scim_client.client = None
+    conf = CheckConfig(scim_client)
+    group = Group(id="foo", display_name="group")
+
+    assert check_object_modification(conf, group).status == Status.SKIPPED
+    assert (
+        check_object_modification_without_target(conf, group).status == Status.SKIPPED
+    )
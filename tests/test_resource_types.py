@@ -1,5 +1,6 @@
 import re
 
+import pytest
 from scim2_models import Context
 from scim2_models import Error
 from scim2_models import ListResponse
@@ -9,7 +10,8 @@ from scim2_tester.resource_types import check_resource_types_endpoint
 from scim2_tester.utils import Status
 
 
-def test_resource_types_endpoint(httpserver, check_config):
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_resource_types_endpoint(httpserver, check_config, max_workers):
     """Test a fully functional resource types endpoint."""
     httpserver.expect_request(re.compile(r"^/ResourceTypes$")).respond_with_json(
         ListResponse[ResourceType](
@@ -33,6 +35,7 @@ def test_resource_types_endpoint(httpserver, check_config):
         content_type="application/scim+json",
     )
 
+    check_config.max_workers = max_workers
     results = check_resource_types_endpoint(check_config)
 
     assert all(result.status == Status.SUCCESS for result in results)
@@ -0,0 +1,110 @@
+import asyncio
+import random
+
+import pytest
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
+from scim2_client.engines.werkzeug import TestSCIMClient
+from werkzeug.test import Client
+
+from scim2_tester import Scenario
+from scim2_tester import ascenario_test
+from scim2_tester import scenario_test
+
+
+def test_scenario_validation():
+    with pytest.raises(ValueError):
+        Scenario(mixes={})
+
+    with pytest.raises(ValueError):
+        Scenario(mixes={"User": {"patch": 1}})
+
+    with pytest.raises(ValueError):
+        Scenario(mixes={"User": {"query": 0}})
+
+    with pytest.raises(ValueError):
+        Scenario.from_dict({"mixes": {"User": {"query": 1}}, "foo": "bar"})
+
+
+def test_scenario_draw():
+    scenario = Scenario(mixes={"User": {"query": 3}, "Group": {"creation": 1}})
+    draws = scenario.draw(1000)
+
+    assert set(draws) == {("User", "query"), ("Group", "creation")}
+    assert 600 < draws.count(("User", "query")) < 900
+    assert scenario.draw(10, random.Random(1)) == scenario.draw(10, random.Random(1))
+
+
+def test_scenario_from_toml(tmp_path):
+    path = tmp_path / "scenario.toml"
+    path.write_text(
+        """
+pool_size = 3
+
+[mixes.User]
+query = 70
+deletion = 2
+"""
+    )
+    scenario = Scenario.from_toml(path)
+
+    assert scenario.pool_size == 3
+    assert scenario.mixes == {"User": {"query": 70, "deletion": 2}}
+
+
+def test_scenario_test(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    scenario = Scenario(
+        mixes={
+            "User": {"query": 5, "replacement": 2, "creation": 2, "deletion": 1},
+            "Group": {"query_without_id": 1},
+        },
+        pool_size=3,
+    )
+    report = scenario_test(client, scenario, iterations=30, concurrency=2)
+
+    assert 0 < report.count <= 30
+    assert report.errors == 0
+    assert set(report.operations) <= {
+        "User.query",
+        "User.replacement",
+        "User.creation",
+        "User.deletion",
+        "Group.query_without_id",
+    }
+    assert not scim2_server.backend.resources
+
+
+def test_scenario_test_empty_pool(scim2_server):
+    """Test that deletions are not performed once the pool is empty."""
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    scenario = Scenario(mixes={"User": {"deletion": 1}}, pool_size=2)
+    report = scenario_test(client, scenario, iterations=5)
+
+    assert report.operations["User.deletion"].count == 2
+    assert not scim2_server.backend.resources
+
+
+def test_scenario_test_unknown_resource_type(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+
+    with pytest.raises(ValueError):
+        scenario_test(client, Scenario(mixes={"Foo": {"query": 1}}))
+
+
+def test_async_scenario_test(scim2_server, scim2_server_url):
+    async def main():
+        client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+        await client.discover()
+        scenario = Scenario(
+            mixes={"User": {"query": 3, "creation": 1, "deletion": 1}}, pool_size=2
+        )
+        return await ascenario_test(client, scenario, iterations=10, concurrency=2)
+
+    report = asyncio.run(main())
+    assert 0 < report.count <= 10
+    assert report.errors == 0
+    assert not scim2_server.backend.resources
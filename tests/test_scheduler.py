@@ -0,0 +1,371 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scim2_tester.scheduler import Task
+from scim2_tester.scheduler import aiter_tasks
+from scim2_tester.scheduler import arun_tasks
+from scim2_tester.scheduler import iter_tasks
+from scim2_tester.scheduler import run_tasks
+from scim2_tester.scheduler import task_results
+from scim2_tester.utils import CheckConfig
+from scim2_tester.utils import CheckResult
+from scim2_tester.utils import Status
+
+
+def result(conf, status=Status.SUCCESS, data=None):
+    return CheckResult(conf, status=status, data=data)
+
+
+def test_sequential_run():
+    """Test that tasks run in declaration order and receive their dependencies results."""
+    conf = CheckConfig(None)
+    calls = []
+
+    def run(name, *args):
+        calls.append((name, [arg.data for arg in args]))
+        return result(conf, data=name)
+
+    tasks = [
+        Task("a", lambda: run("a")),
+        Task("b", lambda a: run("b", a), requires=("a",)),
+        Task("c", lambda a, b: run("c", a, b), requires=("a", "b")),
+    ]
+    values = run_tasks(conf, tasks)
+
+    assert list(values) == ["a", "b", "c"]
+    assert calls == [("a", []), ("b", ["a"]), ("c", ["a", "b"])]
+
+
+def test_skip_dependents_of_failures():
+    """Test that the dependents of a failed task are skipped, but not the tasks that only come after it."""
+    conf = CheckConfig(None)
+    tasks = [
+        Task("a", lambda: result(conf, status=Status.ERROR)),
+        Task("b", lambda a: result(conf), requires=("a",)),
+        Task("c", lambda b: result(conf), requires=("b",)),
+        Task("d", lambda: result(conf), after=("a", "c")),
+    ]
+
+    assert list(run_tasks(conf, tasks)) == ["a", "d"]
+    assert list(asyncio.run(arun_tasks(conf, _async(tasks)))) == ["a", "d"]
+
+    conf = CheckConfig(None, max_workers=4)
+    assert list(run_tasks(conf, tasks)) == ["a", "d"]
+
+
+def test_threaded_run():
+    """Test that independent tasks overlap when max_workers is set."""
+    conf = CheckConfig(None, max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def independent(name):
+        barrier.wait()
+        return result(conf, data=name)
+
+    tasks = [
+        Task("a", lambda: result(conf, data="a")),
+        Task("b", lambda a: independent("b"), requires=("a",)),
+        Task("c", lambda a: independent("c"), requires=("a",)),
+        Task("d", lambda: [result(conf, data="d")], after=("b", "c")),
+    ]
+    values = run_tasks(conf, tasks)
+
+    assert list(values) == ["a", "b", "c", "d"]
+    assert [r.data for r in task_results(values)] == ["a", "b", "c", "d"]
+
+
+def test_async_run():
+    """Test that independent asynchronous tasks overlap."""
+    conf = CheckConfig(None)
+
+    async def main():
+        event = asyncio.Event()
+
+        async def wait_event():
+            await asyncio.wait_for(event.wait(), timeout=5)
+            return result(conf, data="waiter")
+
+        async def set_event():
+            event.set()
+            return result(conf, data="setter")
+
+        tasks = [Task("waiter", wait_event), Task("setter", set_event)]
+        return await arun_tasks(conf, tasks)
+
+    values = asyncio.run(main())
+    assert [r.data for r in task_results(values)] == ["waiter", "setter"]
+
+
+def test_invalid_graph():
+    """Test that dependencies must be declared before the tasks needing them."""
+    conf = CheckConfig(None)
+    with pytest.raises(ValueError, match="not declared before"):
+        run_tasks(conf, [Task("a", lambda b: None, requires=("b",)), Task("b", None)])
+
+    with pytest.raises(ValueError, match="declared several times"):
+        run_tasks(conf, [Task("a", lambda: None), Task("a", lambda: None)])
+
+
+def _async(tasks):
+    def wrap(func):
+        async def wrapped(*args):
+            return func(*args)
+
+        return wrapped
+
+    return [Task(t.name, wrap(t.run), t.requires, t.after) for t in tasks]
+
+
+def test_streaming():
+    """Test that task values are yielded before the next tasks are run, and that stopping the iteration stops the tasks."""
+    conf = CheckConfig(None)
+    calls = []
+
+    def run(name):
+        calls.append(name)
+        return result(conf, data=name)
+
+    tasks = [Task("a", lambda: run("a")), Task("b", lambda: run("b"))]
+    iterator = iter_tasks(conf, tasks)
+
+    assert next(iterator)[0] == "a"
+    assert calls == ["a"]
+    iterator.close()
+    assert calls == ["a"]
+
+
+def test_threaded_streaming_order():
+    """Test that values are yielded in declaration order even if later tasks finish first."""
+    conf = CheckConfig(None, max_workers=2)
+    event = threading.Event()
+
+    def slow():
+        event.wait(timeout=5)
+        return result(conf, data="slow")
+
+    def fast():
+        event.set()
+        return result(conf, data="fast")
+
+    tasks = [Task("slow", slow), Task("fast", fast)]
+    assert [name for name, _ in iter_tasks(conf, tasks)] == ["slow", "fast"]
+
+
+def test_async_streaming():
+    """Test that stopping an asynchronous iteration cancels the tasks that are not started yet."""
+    conf = CheckConfig(None)
+    calls = []
+
+    async def main():
+        async def fast():
+            return result(conf, data="fast")
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            calls.append("slow")
+
+        async def later():
+            calls.append("later")
+
+        tasks = [
+            Task("fast", fast),
+            Task("slow", slow),
+            Task("later", later, after=("slow",)),
+        ]
+        iterator = aiter_tasks(conf, tasks)
+        name, _ = await anext(iterator)
+        await iterator.aclose()
+        return name
+
+    assert asyncio.run(main()) == "fast"
+    assert calls == ["slow"]
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_fail_fast(max_workers):
+    """Test that no new task is started once fail_fast failures happened, but cleanup tasks still run."""
+    conf = CheckConfig(None, max_workers=max_workers, fail_fast=1)
+    calls = []
+
+    def run(name, status=Status.SUCCESS):
+        calls.append(name)
+        return result(conf, status=status)
+
+    tasks = [
+        Task("a", lambda: run("a", Status.ERROR)),
+        Task("b", lambda: run("b"), after=("a",)),
+        Task("cleanup", lambda: run("cleanup"), after=("b",), cleanup=True),
+    ]
+
+    assert list(run_tasks(conf, tasks)) == ["a", "cleanup"]
+    assert calls == ["a", "cleanup"]
+    assert conf.failures == 1
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_cleanup_on_exception(max_workers):
+    """Test that cleanup tasks run when a task raises an exception."""
+    conf = CheckConfig(None, max_workers=max_workers)
+    calls = []
+
+    def fail():
+        raise RuntimeError("failure")
+
+    tasks = [
+        Task("a", fail),
+        Task("b", lambda: calls.append("b"), after=("a",)),
+        Task("cleanup", lambda: calls.append("cleanup"), after=("b",), cleanup=True),
+    ]
+
+    with pytest.raises(RuntimeError):
+        run_tasks(conf, tasks)
+    assert calls == ["cleanup"]
+
+
+def test_cleanup_on_interrupted_iteration():
+    """Test that cleanup tasks run when the iteration is interrupted."""
+    conf = CheckConfig(None)
+    calls = []
+    tasks = [
+        Task("a", lambda: result(conf)),
+        Task("b", lambda: calls.append("b")),
+        Task("cleanup", lambda: calls.append("cleanup"), cleanup=True),
+    ]
+
+    iterator = iter_tasks(conf, tasks)
+    next(iterator)
+    iterator.close()
+    assert calls == ["cleanup"]
+
+
+def test_async_fail_fast():
+    """Test that in-flight asynchronous tasks finish once fail_fast failures happened, but no new task is started."""
+    conf = CheckConfig(None, fail_fast=1)
+    calls = []
+
+    async def main():
+        async def creation():
+            await asyncio.sleep(0.05)
+            calls.append("creation")
+            return result(conf)
+
+        async def fail():
+            return result(conf, status=Status.ERROR)
+
+        async def query(obj):
+            calls.append("query")
+
+        async def cleanup():
+            calls.append("cleanup")
+
+        tasks = [
+            Task("creation", creation),
+            Task("fail", fail),
+            Task("query", query, requires=("creation",)),
+            Task("cleanup", cleanup, after=("creation", "query", "fail"), cleanup=True),
+        ]
+        return await asyncio.wait_for(arun_tasks(conf, tasks), timeout=5)
+
+    assert list(asyncio.run(main())) == ["creation", "fail", "cleanup"]
+    assert calls == ["creation", "cleanup"]
+
+
+def test_async_cleanup_on_exception():
+    """Test that asynchronous cleanup tasks run when a task raises an exception."""
+    conf = CheckConfig(None)
+    calls = []
+
+    async def main():
+        async def fail():
+            raise RuntimeError("failure")
+
+        async def cleanup():
+            calls.append("cleanup")
+
+        tasks = [Task("fail", fail), Task("cleanup", cleanup, cleanup=True)]
+        return await arun_tasks(conf, tasks)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+    assert calls == ["cleanup"]
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_time_budget(max_workers):
+    """Test that tasks not fitting in the time budget are reported as skipped, but cleanup tasks still run."""
+    conf = CheckConfig(None, max_workers=max_workers, time_budget=0.2)
+    calls = []
+
+    def run(name, duration=0):
+        calls.append(name)
+        time.sleep(duration)
+        return result(conf, data=name)
+
+    tasks = [
+        Task("slow", lambda: run("slow", 0.3)),
+        Task("next", lambda slow: run("next"), requires=("slow",)),
+        Task("independent", lambda: run("independent"), after=("slow",)),
+        Task("cleanup", lambda: run("cleanup"), after=("next",), cleanup=True),
+    ]
+    values = run_tasks(conf, tasks)
+
+    assert calls == ["slow", "cleanup"]
+    assert values["next"].status == Status.SKIPPED
+    assert values["next"].title == "next"
+    assert values["independent"].status == Status.SKIPPED
+    assert values["cleanup"].data == "cleanup"
+
+
+def test_time_budget_estimation():
+    """Test that tasks are skipped when their estimated duration exceeds the remaining budget."""
+    conf = CheckConfig(None, time_budget=0.5)
+    tasks = [
+        Task("a", lambda: time.sleep(0.1)),
+        Task("b", lambda: time.sleep(0.1), cost=10, after=("a",)),
+        Task("c", lambda: result(conf), after=("b",)),
+    ]
+    values = run_tasks(conf, tasks)
+
+    assert values["b"].status == Status.SKIPPED
+    assert values["c"].status == Status.SUCCESS
+
+
+def test_priority_and_cost_order():
+    """Test that ready tasks are run by priority, and by cost with a time budget."""
+    calls = []
+    tasks = [
+        Task("expensive", lambda: calls.append("expensive"), cost=5),
+        Task("cheap", lambda: calls.append("cheap")),
+        Task("important", lambda: calls.append("important"), cost=5, priority=1),
+    ]
+
+    run_tasks(CheckConfig(None), tasks)
+    assert calls == ["important", "expensive", "cheap"]
+
+    calls.clear()
+    values = run_tasks(CheckConfig(None, time_budget=10), tasks)
+    assert calls == ["important", "cheap", "expensive"]
+    assert list(values) == ["expensive", "cheap", "important"]
+
+
+def test_async_time_budget():
+    """Test that asynchronous tasks not fitting in the time budget are reported as skipped."""
+    conf = CheckConfig(None, time_budget=0.1)
+
+    async def main():
+        async def slow():
+            await asyncio.sleep(0.2)
+            return result(conf)
+
+        async def fast():
+            return result(conf)
+
+        tasks = [Task("slow", slow), Task("next", fast, after=("slow",))]
+        return await arun_tasks(conf, tasks)
+
+    values = asyncio.run(main())
+    assert values["slow"].status == Status.SUCCESS
+    assert values["next"].status == Status.SKIPPED
@@ -1,5 +1,6 @@
 import re
 
+import pytest
 from scim2_models import Context
 from scim2_models import Error
 from scim2_models import ListResponse
@@ -9,7 +10,8 @@ from scim2_tester.schemas import check_schemas_endpoint
 from scim2_tester.utils import Status
 
 
-def test_shemas_endpoint(httpserver, check_config):
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_shemas_endpoint(httpserver, check_config, max_workers):
     """Test a fully functional schemas endpoint."""
     schemas = [model.to_schema() for model in check_config.client.resource_models]
     httpserver.expect_request(re.compile(r"^/Schemas$")).respond_with_json(
@@ -34,6 +36,7 @@ def test_shemas_endpoint(httpserver, check_config):
         content_type="application/scim+json",
     )
 
+    check_config.max_workers = max_workers
     results = check_schemas_endpoint(check_config)
 
     assert all(result.status == Status.SUCCESS for result in results)
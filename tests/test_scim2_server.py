@@ -1,34 +1,191 @@
-import pytest
+import asyncio
+import io
+import itertools
+import uuid
+from types import SimpleNamespace
+
+from httpx import AsyncClient
+from scim2_client.engines.httpx import AsyncSCIMClient
 from scim2_client.engines.werkzeug import TestSCIMClient
-from scim2_server.backend import InMemoryBackend
-from scim2_server.provider import SCIMProvider
-from scim2_server.utils import load_default_resource_types
-from scim2_server.utils import load_default_schemas
 from werkzeug.test import Client
 
+from scim2_tester import Status
+from scim2_tester import acheck_server
 from scim2_tester import check_server
+from scim2_tester import iter_check_server
 
 
-@pytest.fixture
-def scim2_server():
-    backend = InMemoryBackend()
-    app = SCIMProvider(backend)
+def test_discovered_scim2_server(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    check_server(client, raise_exceptions=True)
 
-    for schema in load_default_schemas().values():
-        app.register_schema(schema)
+    assert not scim2_server.backend.resources
 
-    for resource_type in load_default_resource_types().values():
-        app.register_resource_type(resource_type)
 
-    return app
+def test_undiscovered_scim2_server(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    check_server(client, raise_exceptions=True)
 
 
-def test_discovered_scim2_server(scim2_server):
+def test_threaded_scim2_server(scim2_server):
     client = TestSCIMClient(Client(scim2_server))
     client.discover()
-    check_server(client, raise_exceptions=True)
+    sequential_results = check_server(client)
+    threaded_results = check_server(client, max_workers=4)
 
+    assert all(result.status == Status.SUCCESS for result in threaded_results)
+    assert [result.title for result in threaded_results] == [
+        result.title for result in sequential_results
+    ]
 
-def test_undiscovered_scim2_server(scim2_server):
+
+def test_iter_scim2_server(scim2_server):
     client = TestSCIMClient(Client(scim2_server))
-    check_server(client, raise_exceptions=True)
+    client.discover()
+    results = iter_check_server(client)
+
+    first = next(results)
+    assert first.title == "check_service_provider_config_endpoint"
+    assert first.status == Status.SUCCESS
+    assert all(result.status == Status.SUCCESS for result in results)
+
+
+def test_async_scim2_server(scim2_server, scim2_server_url):
+    client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+    results = asyncio.run(acheck_server(client, raise_exceptions=True, max_workers=2))
+
+    assert all(result.status == Status.SUCCESS for result in results)
+    assert "check_object_deletion" in {result.title for result in results}
+    assert not any(
+        (result.description or "").startswith("Asynchronous version")
+        for result in results
+    )
+    assert not scim2_server.backend.resources
+
+
+def test_time_budget_scim2_server(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    results = check_server(client, time_budget=60)
+
+    assert all(result.status == Status.SUCCESS for result in results)
+    assert "check_object_deletion" in {result.title for result in results}
+    assert not scim2_server.backend.resources
+
+
+def test_exclude_scim2_server(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    results = check_server(client, exclude=["crud", "negative"])
+    titles = {result.title for result in results}
+
+    assert all(result.status == Status.SUCCESS for result in results)
+    assert "check_query_all_schemas" in titles
+    assert "check_random_url" not in titles
+    assert "check_access_invalid_schema" not in titles
+    assert "check_object_creation" not in titles
+    assert not scim2_server.backend.resources
+
+
+def test_include_scim2_server(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    results = check_server(client, include=["check_object_query"], exclude=["Group"])
+
+    assert [result.title for result in results] == [
+        "check_service_provider_config_endpoint",
+        "check_query_all_resource_types",
+        "check_query_all_schemas",
+        "check_object_creation",
+        "check_object_query",
+    ]
+    assert all(result.status == Status.SUCCESS for result in results)
+    assert not scim2_server.backend.resources
+
+
+def test_include_patch_scim2_server(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    results = check_server(client, include=["patch"], exclude=["negative", "Group"])
+    titles = [result.title for result in results]
+
+    assert titles.count("check_object_modification") == 5
+    assert "check_object_modification_without_target" not in titles
+    assert "check_object_replacement" not in titles
+    assert all(result.status == Status.SUCCESS for result in results)
+    assert not scim2_server.backend.resources
+
+
+def test_async_include_scim2_server(scim2_server, scim2_server_url):
+    client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+    results = asyncio.run(acheck_server(client, include=["User"]))
+    titles = [result.title for result in results]
+
+    assert titles.count("check_object_creation") == 1
+    assert "check_random_url" not in titles
+    assert "check_query_resource_type_by_id" not in titles
+
+
+def test_accounting_scim2_server(scim2_server):
+    client = TestSCIMClient(Client(scim2_server))
+    client.discover()
+    results = {result.title: result for result in check_server(client, max_workers=4)}
+
+    for result in results.values():
+        assert result.start is not None
+        assert result.duration > 0
+        assert result.requests == 1
+
+    creation = results["check_object_creation"]
+    assert creation.bytes_sent > 0
+    assert creation.bytes_received > 0
+    assert 0 < creation.validation_time < creation.duration
+    assert creation.status_codes == [201]
+    assert results["check_object_query"].bytes_sent == 0
+    assert results["check_object_deletion"].bytes_received == 0
+    assert results["check_object_modification"].bytes_sent > 0
+    assert results["check_object_modification"].status_codes == [204]
+    # The client methods are restored after the run
+    assert "check_response" not in vars(client)
+    assert not any(name.startswith("prepare_") for name in vars(client))
+
+
+def test_async_accounting_scim2_server(scim2_server, scim2_server_url):
+    client = AsyncSCIMClient(AsyncClient(base_url=scim2_server_url))
+    results = asyncio.run(acheck_server(client))
+
+    assert all(result.requests == 1 for result in results)
+    assert all(
+        result.bytes_received > 0
+        for result in results
+        if result.title not in ("check_object_deletion", "check_object_modification")
+    )
+
+
+def test_seeded_scim2_server(scim2_server, monkeypatch):
+    """Test that runs with the same seed send the same requests."""
+    requests = []
+
+    def app(environ, start_response):
+        body = environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0))
+        environ["wsgi.input"] = io.BytesIO(body)
+        requests.append((environ["REQUEST_METHOD"], environ["PATH_INFO"], body))
+        return scim2_server(environ, start_response)
+
+    def run(seed):
+        # The server ids are made predictable, so the requests referencing them can be compared
+        ids = itertools.count()
+        monkeypatch.setattr(
+            "scim2_server.backend.uuid",
+            SimpleNamespace(uuid4=lambda: uuid.UUID(int=next(ids))),
+        )
+        requests.clear()
+        client = TestSCIMClient(Client(app))
+        client.discover()
+        check_server(client, seed=seed)
+        return list(requests)
+
+    first = run(42)
+    assert any(method == "PUT" for method, _, _ in first)
+    assert run(42) == first
+    assert run(43) != first